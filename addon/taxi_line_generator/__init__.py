@@ -8,37 +8,51 @@ bl_info = {
     "category": "3D View",
 }
 
-import bpy
-
-from .operators.bake_export_mesh import TAXILINES_OT_bake_export_mesh
-from .operators.debug_info import TAXILINES_OT_debug_active
-from .operators.draw_line_modal import TAXILINES_OT_draw_taxi_line
-from .operators.edit_path import TAXILINES_OT_edit_path, TAXILINES_OT_finish_editing
-from .operators.insert_point import TAXILINES_OT_insert_point_at_mouse, draw_insert_point_menu
-from .operators.normalize_curve import TAXILINES_OT_normalize_curve
-from .operators.recompute_handles import TAXILINES_OT_recompute_handles
-from .operators.resume_line_modal import TAXILINES_OT_resume_taxi_line
-from .name_sync import register_handlers as _register_handlers
-from .name_sync import unregister_handlers as _unregister_handlers
-from .properties import register_properties, unregister_properties
-from .ui import TAXILINES_OT_reload_addon, TAXILINES_PT_main
+try:
+    import bpy
+except ImportError:  # Plain CPython: only the bpy-free `core` subpackage is usable.
+    bpy = None
+
+if bpy is not None:
+    from .operators.apply_line_settings import TAXILINES_OT_apply_line_settings
+    from .operators.bake_export_mesh import TAXILINES_OT_bake_export_mesh
+    from .operators.compact_edit_storage import TAXILINES_OT_compact_edit_storage
+    from .operators.debug_info import TAXILINES_OT_debug_active
+    from .operators.draw_line_modal import TAXILINES_OT_draw_taxi_line
+    from .operators.edit_path import TAXILINES_OT_edit_path, TAXILINES_OT_finish_editing
+    from .operators.insert_point import TAXILINES_OT_insert_point_at_mouse, draw_insert_point_menu
+    from .operators.normalize_curve import TAXILINES_OT_normalize_curve
+    from .operators.recompute_handles import TAXILINES_OT_recompute_handles
+    from .operators.resume_line_modal import TAXILINES_OT_resume_taxi_line
+    from .operators.upgrade_file import TAXILINES_OT_upgrade_file
+    from .name_sync import register_handlers as _register_handlers
+    from .name_sync import unregister_handlers as _unregister_handlers
+    from .preferences import TAXILINES_AddonPreferences
+    from .properties import register_properties, unregister_properties
+    from .registry import register_handlers as _register_registry_handlers
+    from .registry import unregister_handlers as _unregister_registry_handlers
+    from .ui import TAXILINES_OT_reload_addon, TAXILINES_PT_main
+
+    classes = (
+        TAXILINES_AddonPreferences,
+        TAXILINES_OT_reload_addon,
+        TAXILINES_OT_draw_taxi_line,
+        TAXILINES_OT_resume_taxi_line,
+        TAXILINES_OT_bake_export_mesh,
+        TAXILINES_OT_debug_active,
+        TAXILINES_OT_edit_path,
+        TAXILINES_OT_finish_editing,
+        TAXILINES_OT_insert_point_at_mouse,
+        TAXILINES_OT_normalize_curve,
+        TAXILINES_OT_recompute_handles,
+        TAXILINES_OT_apply_line_settings,
+        TAXILINES_OT_upgrade_file,
+        TAXILINES_OT_compact_edit_storage,
+        TAXILINES_PT_main,
+    )
 
 _addon_keymaps = []
 
-classes = (
-    TAXILINES_OT_reload_addon,
-    TAXILINES_OT_draw_taxi_line,
-    TAXILINES_OT_resume_taxi_line,
-    TAXILINES_OT_bake_export_mesh,
-    TAXILINES_OT_debug_active,
-    TAXILINES_OT_edit_path,
-    TAXILINES_OT_finish_editing,
-    TAXILINES_OT_insert_point_at_mouse,
-    TAXILINES_OT_normalize_curve,
-    TAXILINES_OT_recompute_handles,
-    TAXILINES_PT_main,
-)
-
 
 def register():
     register_properties()
@@ -59,11 +73,13 @@ def register():
         kmi = km.keymap_items.new("taxilines.insert_point", type="RIGHTMOUSE", value="PRESS", shift=True)
         _addon_keymaps.append((km, kmi))
 
+    _register_registry_handlers()
     _register_handlers()
 
 
 def unregister():
     _unregister_handlers()
+    _unregister_registry_handlers()
 
     for km, kmi in _addon_keymaps:
         try:
@@ -0,0 +1,49 @@
+# Geometry kernels on plain NumPy arrays (no bpy/mathutils), so they can be profiled and checked
+# under plain CPython. The modules one level up are the Blender adapters: they read RNA data in
+# bulk (foreach_get), call into here and write the results back.
+from .bezier import (
+    ArcLengthTable,
+    bezier_segments,
+    cumulative_lengths,
+    normalize_span,
+    normalize_spans,
+    points_at_lengths,
+    resample_polyline_evenly,
+    sample_span,
+)
+from .deltas import capture_edits, pack_deltas, ribbon_keys, sample_edits, unpack_deltas
+from .handles import changed_point_indices, merge_windows, solve_taxi_handles, solve_taxi_handles_range
+from .nearest import nearest_on_bezier_2d, project_to_region
+from .ribbon import merge_ribbons, ribbon_geometry
+from .uv import bbox_of, face_slot_uvs, fit_to_bbox, segment_axis_from_bbox, strip_face_arcs, strip_rings, strip_uvs
+
+__all__ = (
+    "ArcLengthTable",
+    "bbox_of",
+    "bezier_segments",
+    "capture_edits",
+    "changed_point_indices",
+    "cumulative_lengths",
+    "face_slot_uvs",
+    "fit_to_bbox",
+    "merge_ribbons",
+    "merge_windows",
+    "nearest_on_bezier_2d",
+    "normalize_span",
+    "normalize_spans",
+    "pack_deltas",
+    "points_at_lengths",
+    "project_to_region",
+    "resample_polyline_evenly",
+    "ribbon_geometry",
+    "ribbon_keys",
+    "sample_edits",
+    "sample_span",
+    "segment_axis_from_bbox",
+    "solve_taxi_handles",
+    "solve_taxi_handles_range",
+    "strip_face_arcs",
+    "strip_rings",
+    "strip_uvs",
+    "unpack_deltas",
+)
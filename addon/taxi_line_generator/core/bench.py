@@ -0,0 +1,97 @@
+"""
+Benchmarks of the core kernels on synthetic lines, without Blender.
+
+From the addon/ directory:
+    python -m taxi_line_generator.core.bench
+or from Blender's Python console:
+    from taxi_line_generator.core.bench import run; run()
+"""
+
+import time
+
+import numpy as np
+
+from .bezier import ArcLengthTable, normalize_span, normalize_spans
+from .deltas import capture_edits, pack_deltas, ribbon_keys, sample_edits, unpack_deltas
+from .handles import solve_taxi_handles
+from .nearest import nearest_on_bezier_2d
+from .ribbon import ribbon_geometry
+from .uv import strip_rings, strip_uvs
+
+
+def zigzag_line(point_count, step=2.0):
+    """(co, left, right) of a zig-zag taxi line on Z=0 with solved taxi handles."""
+    i = np.arange(max(int(point_count), 2), dtype=np.float64)
+    co = np.stack((i * step, (i % 3) * step * 0.75, np.zeros_like(i)), axis=1)
+    left = co.copy()
+    right = co.copy()
+    solve_taxi_handles(co, left, right)
+    return co, left, right
+
+
+def strip_layout(ring_count):
+    """Vertices and loop layout of a straight ribbon strip (two vertices per ring)."""
+    x = np.repeat(np.arange(ring_count, dtype=np.float64) * 0.5, 2)
+    y = np.tile((-0.075, 0.075), ring_count)
+    co = np.stack((x, y, np.zeros_like(x)), axis=1)
+    ring = np.arange(ring_count - 1)
+    loops = np.stack((ring * 2, ring * 2 + 1, ring * 2 + 3, ring * 2 + 2), axis=1).ravel()
+    starts = np.arange(ring_count - 1) * 4
+    return co, loops, starts, np.full(ring_count - 1, 4)
+
+
+def _nearest_click(co, left, right):
+    # Identity view: object XY maps straight onto a 2x2 "region" around the origin.
+    return nearest_on_bezier_2d(co, left, right, np.eye(4), 2.0, 2.0, co[len(co) // 2, :2] + 1.0)
+
+
+def best_ms(fn, repeat):
+    best = None
+    for _ in range(max(int(repeat), 1)):
+        t0 = time.perf_counter()
+        fn()
+        elapsed = (time.perf_counter() - t0) * 1000.0
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run(point_counts=(100, 1_000, 10_000), repeat=5):
+    """Returns {point_count: {kernel: best ms}} and prints a table."""
+    results = {}
+    for count in point_counts:
+        co, left, right = zigzag_line(count)
+        n = len(co)
+        radius = np.ones(n)
+        vec = np.zeros(n, dtype=bool)
+        rings = n * 4
+        strip_co, loops, starts, totals = strip_layout(rings)
+        ring_a, ring_b = strip_rings(starts, totals, loops, len(strip_co))
+        keys = ribbon_keys(strip_co, ring_a, ring_b)
+        deltas = np.zeros_like(strip_co)
+        deltas[::97] = 0.01
+        edit_keys, edit_deltas = capture_edits(deltas, keys, ring_a, ring_b)
+        table = ArcLengthTable(co, left, right, 32)
+        # Disjoint 8-point runs with a 2-point gap, all normalized in one batch.
+        spans = [(i, min(i + 7, n - 1)) for i in range(0, n - 1, 10)]
+
+        kernels = (
+            ("handles", lambda: solve_taxi_handles(co, left.copy(), right.copy())),
+            ("arc_table", lambda: ArcLengthTable(co, left, right, 32)),
+            ("arc_lookup", lambda: table.points_at(np.linspace(0.0, table.total, n))),
+            ("normalize", lambda: normalize_span(co, left, right, 0, n - 1, 32, table=table)),
+            ("normalize_spans", lambda: normalize_spans(co, left, right, spans, 32, table=table)),
+            ("nearest", lambda: _nearest_click(co, left, right)),
+            ("ribbon", lambda: ribbon_geometry(co, left, right, radius, vec, vec, False, 12, 0.15, 1.0, 1.0, 1.0)),
+            ("strip_uvs", lambda: strip_uvs(strip_co, ring_a, ring_b)),
+            ("delta_sample", lambda: sample_edits(keys, edit_keys, edit_deltas)),
+            ("delta_pack", lambda: unpack_deltas(*pack_deltas(deltas), len(deltas))),
+        )
+        timings = {name: best_ms(fn, repeat) for name, fn in kernels}
+        results[int(count)] = timings
+        cols = "  ".join(f"{name}={ms:.2f}ms" for name, ms in timings.items())
+        print(f"[TLG] core, {count} points: {cols}")
+    return results
+
+
+if __name__ == "__main__":
+    run()
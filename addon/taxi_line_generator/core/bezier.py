@@ -0,0 +1,186 @@
+import numpy as np
+
+# Cubic Bezier sampling on plain (n, 3) control arrays: co[i] -> right[i] -> left[i + 1] -> co[i + 1].
+
+
+def bezier_segments(co, left, right, resolution):
+    """
+    (n - 1, resolution, 3) samples of every segment at t = 0..1 inclusive
+    (same parameterization as mathutils.geometry.interpolate_bezier).
+    """
+    co = np.asarray(co, dtype=np.float64)
+    left = np.asarray(left, dtype=np.float64)
+    right = np.asarray(right, dtype=np.float64)
+    resolution = max(int(resolution), 2)
+    t = np.linspace(0.0, 1.0, resolution)[None, :, None]
+    s = 1.0 - t
+    p0 = co[:-1, None, :]
+    p1 = right[:-1, None, :]
+    p2 = left[1:, None, :]
+    p3 = co[1:, None, :]
+    return s**3 * p0 + 3.0 * s**2 * t * p1 + 3.0 * s * t**2 * p2 + t**3 * p3
+
+
+def sample_span(co, left, right, i0, i1, resolution):
+    """Polyline through segments i0..i1 - 1, shared segment endpoints kept once."""
+    if i1 <= i0:
+        return np.empty((0, 3))
+    segs = bezier_segments(co[i0 : i1 + 1], left[i0 : i1 + 1], right[i0 : i1 + 1], resolution)
+    return np.concatenate((segs[0], segs[1:, 1:].reshape(-1, 3)))
+
+
+def cumulative_lengths(points):
+    """Arc length at every polyline vertex (0 at the first one)."""
+    points = np.asarray(points, dtype=np.float64)
+    if len(points) < 2:
+        return np.zeros(len(points))
+    return np.concatenate(([0.0], np.cumsum(np.linalg.norm(np.diff(points, axis=0), axis=1))))
+
+
+def points_at_lengths(points, lengths, s):
+    """
+    Points on a polyline at arc length(s) s, shape (len(s), 3). `lengths` are its cumulative
+    lengths; every target is found with one binary search (searchsorted) and interpolated.
+    """
+    s = np.atleast_1d(np.asarray(s, dtype=np.float64))
+    if len(points) < 2:
+        return np.repeat(points[:1], len(s), axis=0)
+    last = len(lengths) - 1
+    # First sample at or beyond s; interpolate from the one before it.
+    j = np.clip(np.searchsorted(lengths, s, side="left"), 1, last)
+    d0 = lengths[j - 1]
+    d1 = lengths[j]
+    span = d1 - d0
+    f = np.where(span > 1e-12, (s - d0) / np.where(span > 1e-12, span, 1.0), 1.0)
+    f = np.clip(f, 0.0, 1.0)[:, None]
+    return points[j - 1] + (points[j] - points[j - 1]) * f
+
+
+def resample_polyline_evenly(points, count):
+    """`count` points at equal arc-length spacing along a polyline (first and last included)."""
+    points = np.asarray(points, dtype=np.float64)
+    if count <= 1:
+        return points[:1].copy()
+    if len(points) < 2:
+        return points.copy()
+
+    cumulative = cumulative_lengths(points)
+    total = cumulative[-1]
+    if total <= 1e-9:
+        return np.repeat(points[:1], count, axis=0)
+    return points_at_lengths(points, cumulative, np.linspace(0.0, total, count))
+
+
+# Arc-length samples of an open Bezier spline for normalize_spans: `resolution` samples per
+# segment at t = 0..1, flattened with shared segment endpoints kept once; s is the arc length
+# from the first point.
+
+
+class ArcLengthTable:
+    __slots__ = ("segment_count", "resolution", "lengths", "points")
+
+    def __init__(self, co, left, right, resolution=32):
+        co = np.asarray(co, dtype=np.float64)
+        self.segment_count = max(len(co) - 1, 0)
+        self.resolution = max(int(resolution), 2)
+        if self.segment_count < 1:
+            self.points = co[:1].copy()
+            self.lengths = np.zeros(len(self.points))
+            return
+        segs = bezier_segments(co, left, right, self.resolution)
+        self.points = np.concatenate((segs[0], segs[1:, 1:].reshape(-1, 3)))
+        self.lengths = cumulative_lengths(self.points)
+
+    @property
+    def total(self):
+        return float(self.lengths[-1]) if len(self.lengths) else 0.0
+
+    def points_at(self, s):
+        """Points on the sampled polyline at arc length(s) s, shape (len(s), 3)."""
+        return points_at_lengths(self.points, self.lengths, s)
+
+    def span_indices(self, i0, i1):
+        """Table sample range [lo, hi] covering control points i0..i1."""
+        res = self.resolution - 1
+        return int(i0) * res, int(i1) * res
+
+
+def normalize_spans(co, left, right, spans, resolution, table=None):
+    """
+    Evenly redistribute the points of every (i0, i1) span in `spans` (disjoint) along the path
+    they currently describe, in one pass: all targets of all spans are looked up in the same
+    arc-length table at once.
+
+    Returns (indices, co, left, right) for the affected points: handles move with their point and
+    are scaled to the new spacing; the handles facing outside a span are only translated.
+    None when no span has 2+ points. `table` is an ArcLengthTable of the same points.
+    """
+    n = len(co)
+    spans = [(int(i0), int(i1)) for i0, i1 in spans if 0 <= i0 < i1 < n]
+    if n < 2 or not spans:
+        return None
+    if table is None:
+        table = ArcLengthTable(co, left, right, resolution)
+
+    starts = np.array([i0 for i0, _i1 in spans])
+    ends = np.array([i1 for _i0, i1 in spans])
+    counts = ends - starts + 1
+    span_of = np.repeat(np.arange(len(spans)), counts)
+    k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    idx = starts[span_of] + k
+    first = k == 0
+    last = k == counts[span_of] - 1
+
+    res = table.resolution - 1
+    s0 = table.lengths[starts * res]
+    s1 = table.lengths[ends * res]
+    s = s0[span_of] + (s1 - s0)[span_of] * (k / (counts[span_of] - 1))
+
+    old_co = np.asarray(co, dtype=np.float64)[idx]
+    old_left = np.asarray(left, dtype=np.float64)[idx]
+    old_right = np.asarray(right, dtype=np.float64)[idx]
+    targets = table.points_at(s)
+    ends_mask = first | last
+    targets[ends_mask] = old_co[ends_mask]
+
+    # Spacing change of the gap after every point (only meaningful inside a span).
+    eps = 1e-9
+    old_gap = np.linalg.norm(np.diff(old_co, axis=0), axis=1)
+    new_gap = np.linalg.norm(np.diff(targets, axis=0), axis=1)
+    gap_scale = np.where(old_gap > eps, new_gap / np.where(old_gap > eps, old_gap, 1.0), 1.0)
+    left_scale = np.ones(len(idx))
+    right_scale = np.ones(len(idx))
+    left_scale[~first] = gap_scale[~first[1:]]
+    right_scale[~last] = gap_scale[~last[:-1]]
+
+    delta = targets - old_co
+    new_left = targets + (old_left - old_co) * left_scale[:, None]
+    new_right = targets + (old_right - old_co) * right_scale[:, None]
+    # Keep the outside continuity at the span boundaries (translate only).
+    outer_left = first & (idx > 0)
+    outer_right = last & (idx < n - 1)
+    new_left[outer_left] = old_left[outer_left] + delta[outer_left]
+    new_right[outer_right] = old_right[outer_right] + delta[outer_right]
+    return idx, targets, new_left, new_right
+
+
+def normalize_span(co, left, right, i0, i1, resolution, table=None):
+    """
+    Single-span normalize_spans: new (co, left, right) arrays for points i0..i1, None on failure.
+    """
+    result = normalize_spans(co, left, right, ((i0, i1),), resolution, table=table)
+    if result is None:
+        return None
+    return result[1:]
+
+
+__all__ = (
+    "ArcLengthTable",
+    "bezier_segments",
+    "cumulative_lengths",
+    "normalize_span",
+    "normalize_spans",
+    "points_at_lengths",
+    "resample_polyline_evenly",
+    "sample_span",
+)
@@ -0,0 +1,117 @@
+import numpy as np
+
+from .uv import strip_face_arcs
+
+# Edit deltas (export - base vertex offsets) on plain arrays: ribbon-space keys that survive
+# topology changes, sparse capture/sampling, and the packed (indices, values) compact form.
+
+EDIT_EPS = 1e-6
+
+
+def ribbon_keys(coords, ring_a, ring_b):
+    """
+    Ribbon-space key of every vertex: (strip * 2 + side) * 2 + arc-length fraction along the strip.
+
+    Keys of one (strip, side) group are contiguous and sorted by position along the line, so a
+    single searchsorted maps vertices between meshes of different density. None if not a strip.
+    """
+    ring_count = len(coords) // 2
+    centers = np.asarray(coords, dtype=np.float64).reshape(-1, 2, 3).mean(axis=1)
+    arc_a, arc_b, strip = strip_face_arcs(centers, ring_a, ring_b)
+
+    ring_arc = np.full(ring_count, -1.0)
+    ring_strip = np.full(ring_count, -1, dtype=np.int64)
+    # Far rings first: a cyclic strip's closing face points back at its start ring (arc 0).
+    ring_arc[ring_b] = arc_b
+    ring_strip[ring_b] = strip
+    ring_arc[ring_a] = arc_a
+    ring_strip[ring_a] = strip
+    if np.any(ring_strip < 0):
+        return None
+
+    lengths = np.zeros(int(strip.max()) + 1)
+    np.maximum.at(lengths, strip, arc_b)
+    ring_len = lengths[ring_strip]
+    fraction = np.divide(ring_arc, ring_len, out=np.zeros(ring_count), where=ring_len > 0.0)
+    fraction = np.clip(fraction, 0.0, 1.0)
+
+    group = (np.repeat(ring_strip, 2) * 2 + np.tile((0, 1), ring_count)).astype(np.float64)
+    return group * 2.0 + np.repeat(fraction, 2)
+
+
+def _group_of(keys):
+    return np.floor(keys * 0.5)
+
+
+def capture_edits(deltas, keys, ring_a, ring_b):
+    """
+    Sparse (keys, deltas) of the edited vertices, sorted by key.
+
+    Edited vertices are kept together with their unedited neighbours along each side, so the
+    interpolated displacement falls back to zero next to an edit.
+    """
+    edited = np.any(np.abs(deltas) > EDIT_EPS, axis=1)
+    if not np.any(edited):
+        return np.empty(0), np.empty((0, 3))
+    keep = edited.copy()
+    for side in (0, 1):
+        va = ring_a * 2 + side
+        vb = ring_b * 2 + side
+        keep[va] |= edited[vb]
+        keep[vb] |= edited[va]
+
+    keys = keys[keep]
+    deltas = deltas[keep]
+    order = np.argsort(keys, kind="stable")
+    return keys[order], deltas[order]
+
+
+def sample_edits(query_keys, keys, deltas):
+    """Linearly interpolated displacement at each query key (zero outside stored edits)."""
+    out = np.zeros((len(query_keys), 3))
+    if not len(keys) or not len(query_keys):
+        return out
+    hi = np.searchsorted(keys, query_keys, side="right")
+    lo = hi - 1
+    lo_c = np.clip(lo, 0, len(keys) - 1)
+    hi_c = np.clip(hi, 0, len(keys) - 1)
+    group = _group_of(query_keys)
+
+    valid_lo = (lo >= 0) & (_group_of(keys[lo_c]) == group)
+    exact = valid_lo & (keys[lo_c] == query_keys)
+    pair = valid_lo & ~exact & (hi < len(keys)) & (_group_of(keys[hi_c]) == group)
+
+    out[exact] = deltas[lo_c[exact]]
+    if np.any(pair):
+        k0 = keys[lo_c[pair]]
+        k1 = keys[hi_c[pair]]
+        t = ((query_keys[pair] - k0) / np.maximum(k1 - k0, 1e-12))[:, None]
+        out[pair] = deltas[lo_c[pair]] * (1.0 - t) + deltas[hi_c[pair]] * t
+    return out
+
+
+def pack_deltas(deltas):
+    """(int32 indices, float32 flat xyz) of the non-zero rows of deltas."""
+    edited = np.any(np.abs(deltas) > EDIT_EPS, axis=1)
+    return np.flatnonzero(edited).astype(np.int32), np.ascontiguousarray(deltas[edited], dtype=np.float32).ravel()
+
+
+def unpack_deltas(indices, values, vertex_count):
+    """Dense (vertex_count, 3) deltas from pack_deltas() output, or None if inconsistent."""
+    indices = np.asarray(indices, dtype=np.int64)
+    values = np.asarray(values, dtype=np.float64).reshape(-1, 3)
+    if vertex_count < 0 or len(indices) != len(values) or (len(indices) and indices.max() >= vertex_count):
+        return None
+    deltas = np.zeros((vertex_count, 3))
+    deltas[indices] = values
+    return deltas
+
+
+__all__ = (
+    "EDIT_EPS",
+    "capture_edits",
+    "pack_deltas",
+    "ribbon_keys",
+    "sample_edits",
+    "unpack_deltas",
+)
@@ -0,0 +1,152 @@
+import numpy as np
+
+# Fixed "taxi line" handle rules (no user slider); shared by the array solver and the per-point
+# loop in curve_utils.
+HANDLE_SCALE = 0.45
+RIGHT_ANGLE_SCALE = 0.60
+TURN_MIN_DEG = 25.0
+TURN_MAX_DEG = 70.0
+APPROACH_SCALE = 0.08
+
+# A point's handles depend on the points up to this many indices away (bisector + approach
+# straightening), so a local edit only needs a re-solve of index ± WINDOW_RADIUS.
+WINDOW_RADIUS = 2
+
+
+def _normalized_rows_or(v, fallback):
+    length = np.linalg.norm(v, axis=1)
+    out = np.array(fallback, dtype=np.float64)
+    out = np.broadcast_to(out, v.shape).copy()
+    ok = length > 1e-9
+    out[ok] = v[ok] / length[ok, None]
+    return out
+
+
+def solve_taxi_handles(co, left, right):
+    """
+    Taxi handle rules on (n, 3) float64 arrays; left/right are updated in place (points the
+    rules skip keep their current handles).
+    """
+    n = len(co)
+    if n < 2:
+        return
+    x_axis = (1.0, 0.0, 0.0)
+
+    # Endpoints: handle along the first/last segment.
+    for i, j in ((0, 1), (n - 1, n - 2)):
+        v = co[j] - co[i]
+        dist = float(np.linalg.norm(v))
+        if dist > 1e-6:
+            tip = co[i] + (v / dist) * (dist * HANDLE_SCALE)
+            if i == 0:
+                left[i] = co[i]
+                right[i] = tip
+            else:
+                left[i] = tip
+                right[i] = co[i]
+
+    if n <= 2:
+        return
+    prev = co[:-2]
+    p = co[1:-1]
+    nxt = co[2:]
+    dist_in = np.linalg.norm(prev - p, axis=1)
+    dist_out = np.linalg.norm(nxt - p, axis=1)
+    t_in = _normalized_rows_or(p - prev, x_axis)
+    t_out = _normalized_rows_or(nxt - p, x_axis)
+    deflection = np.degrees(np.arccos(np.clip(np.einsum("ij,ij->i", t_in, t_out), -1.0, 1.0)))
+
+    # Smooth (bisector) tangent, wider fillet near right angles, shorter near U-turns.
+    t = t_in + t_out
+    t = np.where((np.linalg.norm(t, axis=1) <= 1e-9)[:, None], t_out, t)
+    length_t = np.linalg.norm(t, axis=1)
+    t = np.where((length_t <= 1e-9)[:, None], t_out, t / np.maximum(length_t, 1e-300)[:, None])
+    scale = np.where((deflection >= 70.0) & (deflection <= 110.0), RIGHT_ANGLE_SCALE, HANDLE_SCALE)
+    length = np.minimum(dist_in, dist_out) * scale
+    length *= np.where(deflection > 160.0, 0.55, np.where(deflection > 135.0, 0.75, 1.0))
+
+    ok = (dist_in > 1e-6) & (dist_out > 1e-6)
+    inner_left = left[1:-1]
+    inner_right = right[1:-1]
+    inner_left[ok] = p[ok] - t[ok] * length[ok, None]
+    inner_right[ok] = p[ok] + t[ok] * length[ok, None]
+
+    # Straighten approach/departure handles of the neighbours of moderate turns.
+    turn = (deflection >= TURN_MIN_DEG) & (deflection <= TURN_MAX_DEG)
+    before = turn & (dist_in > 1e-6)
+    after = turn & (dist_out > 1e-6)
+    d_prev = (p - prev) / np.maximum(dist_in, 1e-300)[:, None]
+    d_next = (p - nxt) / np.maximum(dist_out, 1e-300)[:, None]
+    idx = np.arange(1, n - 1)
+    right[idx[before] - 1] = prev[before] + d_prev[before] * (dist_in[before] * APPROACH_SCALE)[:, None]
+    left[idx[after] + 1] = nxt[after] + d_next[after] * (dist_out[after] * APPROACH_SCALE)[:, None]
+
+
+def solve_taxi_handles_range(co, left, right, lo, hi):
+    """
+    Handles of points lo..hi only, with the same result as a full solve: returns
+    (first, left, right) where the arrays cover lo..hi and `first` is lo after clamping.
+    Only co/left/right[lo - 2 : hi + 3] are read.
+    """
+    n = len(co)
+    lo = max(0, int(lo))
+    hi = min(n - 1, int(hi))
+    if n < 2 or lo > hi:
+        return lo, np.empty((0, 3)), np.empty((0, 3))
+    first = max(0, lo - WINDOW_RADIUS)
+    last = min(n - 1, hi + WINDOW_RADIUS)
+    w_co = np.asarray(co[first : last + 1], dtype=np.float64)
+    w_left = np.array(left[first : last + 1], dtype=np.float64)
+    w_right = np.array(right[first : last + 1], dtype=np.float64)
+    solve_taxi_handles(w_co, w_left, w_right)
+    return lo, w_left[lo - first : hi - first + 1], w_right[lo - first : hi - first + 1]
+
+
+def changed_point_indices(before, after):
+    """
+    Indices (in `after`) of points whose co/handles differ between two (co, left, right)
+    states, allowing for one point added or removed at either end. None if unrelated.
+    """
+    if before is None or after is None:
+        return None
+    old = np.concatenate(before, axis=1)
+    new = np.concatenate(after, axis=1)
+    if len(old) == len(new):
+        return np.flatnonzero(np.any(old != new, axis=1))
+    if len(new) == len(old) + 1:
+        if np.array_equal(new[:-1], old):
+            return np.array([len(new) - 1])
+        if np.array_equal(new[1:], old):
+            return np.array([0])
+    elif len(new) == len(old) - 1 and len(new):
+        if np.array_equal(new, old[:-1]):
+            return np.array([len(new) - 1])
+        if np.array_equal(new, old[1:]):
+            return np.array([0])
+    return None
+
+
+def merge_windows(indices, radius=WINDOW_RADIUS):
+    """[(lo, hi), ...] covering index ± radius of every (sorted) index, overlapping ranges merged."""
+    out = []
+    for index in indices:
+        index = int(index)
+        if out and index - radius <= out[-1][1] + 1:
+            out[-1][1] = index + radius
+        else:
+            out.append([index - radius, index + radius])
+    return [tuple(w) for w in out]
+
+
+__all__ = (
+    "APPROACH_SCALE",
+    "HANDLE_SCALE",
+    "RIGHT_ANGLE_SCALE",
+    "TURN_MAX_DEG",
+    "TURN_MIN_DEG",
+    "WINDOW_RADIUS",
+    "changed_point_indices",
+    "merge_windows",
+    "solve_taxi_handles",
+    "solve_taxi_handles_range",
+)
@@ -0,0 +1,101 @@
+import numpy as np
+
+
+def project_to_region(points, perspective_matrix, width, height):
+    """
+    Region pixel coordinates of (m, 3) points, like bpy_extras.view3d_utils.location_3d_to_region_2d.
+    Points behind the viewer come back as NaN rows.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    mat = np.asarray(perspective_matrix, dtype=np.float64)
+    prj = points @ mat[:3, :3].T + mat[:3, 3]
+    w = points @ mat[3, :3] + mat[3, 3]
+    out = np.full((len(points), 2), np.nan)
+    front = w > 0.0
+    half = np.array((width * 0.5, height * 0.5))
+    out[front] = half + half * (prj[front, :2] / w[front, None])
+    return out
+
+
+def _bezier_at(ctrl, t):
+    t = np.asarray(t, dtype=np.float64)[:, None]
+    s = 1.0 - t
+    return s**3 * ctrl[0] + 3.0 * s**2 * t * ctrl[1] + 3.0 * s * t**2 * ctrl[2] + t**3 * ctrl[3]
+
+
+def _refine_segment(ctrl, mat, width, height, point, coarse, iterations):
+    """(distance, t) of the closest point of one projected segment: coarse samples, then Newton."""
+
+    def screen(t):
+        return project_to_region(_bezier_at(ctrl, t), mat, width, height)
+
+    ts = np.linspace(0.0, 1.0, max(int(coarse), 2))
+    dist = np.linalg.norm(screen(ts) - point, axis=1)
+    if not np.any(np.isfinite(dist)):
+        return np.inf, 0.0
+    k = int(np.nanargmin(dist))
+    best_t = float(ts[k])
+    best_d = float(dist[k])
+
+    # Newton on f(t) = (S(t) - p) . S'(t) = 0, kept between the neighbouring coarse samples.
+    lo = float(ts[max(k - 1, 0)])
+    hi = float(ts[min(k + 1, len(ts) - 1)])
+    t = best_t
+    h = 1e-3
+    for _ in range(max(int(iterations), 0)):
+        sm, s0, sp = screen((t - h, t, t + h))
+        d1 = (sp - sm) / (2.0 * h)
+        d2 = (sp - 2.0 * s0 + sm) / (h * h)
+        r = s0 - point
+        f = float(r @ d1)
+        fp = float(d1 @ d1 + r @ d2)
+        if not np.isfinite(f) or not np.isfinite(fp) or fp <= 1e-12:
+            break
+        t_new = min(max(t - f / fp, lo), hi)
+        done = abs(t_new - t) < 1e-7
+        t = t_new
+        if done:
+            break
+    d = float(np.linalg.norm(screen((t,))[0] - point))
+    if np.isfinite(d) and d < best_d:
+        return d, t
+    return best_d, best_t
+
+
+def nearest_on_bezier_2d(co, left, right, perspective_matrix, width, height, point, coarse=16, iterations=8):
+    """
+    Closest position to a region pixel `point` on a projected open Bezier spline.
+
+    Segments are culled by the screen bbox of their projected control points (the curve stays
+    inside it), nearest boxes first; only segments whose box is closer than the best hit so far
+    are refined. Returns (distance, segment index, t within the segment) or None.
+    """
+    co = np.asarray(co, dtype=np.float64)
+    if len(co) < 2:
+        return None
+    mat = np.asarray(perspective_matrix, dtype=np.float64)
+    p = np.asarray(point, dtype=np.float64)[:2]
+    left = np.asarray(left, dtype=np.float64)
+    right = np.asarray(right, dtype=np.float64)
+    ctrl = np.stack((co[:-1], right[:-1], left[1:], co[1:]), axis=1)
+    xy = project_to_region(ctrl.reshape(-1, 3), mat, width, height).reshape(len(ctrl), 4, 2)
+
+    # Boxes of segments that reach behind the viewer are unbounded on screen: never cull those.
+    behind = np.isnan(xy).any(axis=(1, 2))
+    with np.errstate(invalid="ignore"):
+        gap = np.maximum(xy.min(axis=1) - p, 0.0) + np.maximum(p - xy.max(axis=1), 0.0)
+    lower = np.where(behind, 0.0, np.linalg.norm(gap, axis=1))
+
+    best = None
+    best_d = np.inf
+    for seg in np.argsort(lower, kind="stable"):
+        if lower[seg] > best_d:
+            break
+        d, t = _refine_segment(ctrl[seg], mat, width, height, p, coarse, iterations)
+        if d < best_d:
+            best_d = d
+            best = (float(d), int(seg), float(t))
+    return best
+
+
+__all__ = ("nearest_on_bezier_2d", "project_to_region")
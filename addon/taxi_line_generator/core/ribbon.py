@@ -0,0 +1,235 @@
+import numpy as np
+
+# Array version of the TLG_TaxiLinePreview node group:
+#   set radius -> fillet (Bezier mode) -> resample by length -> curve to mesh with a 2-point
+#   profile (-0.5..0.5) -> UVMap from (length / UV U, (factor - 0.5) * width / UV V).
+#
+# Known differences to the GN output: normals use the Z-up frame (identical to "Minimum Twist"
+# for curves lying in a plane parallel to XY) and point tilt is ignored.
+
+PROFILE_X = (-0.5, 0.5)
+
+
+def normalize_rows(v):
+    n = np.linalg.norm(v, axis=1)
+    out = np.zeros_like(v)
+    ok = n > 1e-12
+    out[ok] = v[ok] / n[ok, None]
+    return out
+
+
+def fillet_bezier(co, hl, hr, radius, vec_l, vec_r, fillet_radius, cyclic):
+    """Fillet Curve node, Bezier mode: every filleted point becomes an arc of two points."""
+    n = len(co)
+    nxt = np.roll(co, -1, axis=0)
+    dirs = normalize_rows(nxt - co)
+    dirs_prev = np.roll(dirs, 1, axis=0)
+
+    mask = np.ones(n, dtype=bool)
+    if not cyclic:
+        mask[0] = False
+        mask[-1] = False
+    if fillet_radius <= 0.0:
+        mask[:] = False
+
+    # Turn angle between incoming/outgoing control polygon segments.
+    angle = np.arccos(np.clip(np.einsum("ij,ij->i", dirs_prev, dirs), -1.0, 1.0))
+    displacement = fillet_radius * np.tan(angle / 2.0)
+    handle_len = (4.0 / 3.0) * fillet_radius * np.tan(angle / 4.0)
+
+    counts = np.where(mask, 2, 1)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    total = int(counts.sum())
+
+    pos = np.empty((total, 3))
+    out_hl = np.empty((total, 3))
+    out_hr = np.empty((total, 3))
+    out_r = np.empty(total)
+    out_vec_l = np.empty(total, dtype=bool)
+    out_vec_r = np.empty(total, dtype=bool)
+
+    keep = ~mask
+    k = starts[keep]
+    pos[k] = co[keep]
+    out_hl[k] = hl[keep]
+    out_hr[k] = hr[keep]
+    out_vec_l[k] = vec_l[keep]
+    out_vec_r[k] = vec_r[keep]
+    out_r[k] = radius[keep]
+
+    a = starts[mask]
+    b = a + 1
+    d_in = dirs_prev[mask]
+    d_out = dirs[mask]
+    disp = displacement[mask][:, None]
+    hlen = handle_len[mask][:, None]
+    pos[a] = co[mask] - d_in * disp
+    pos[b] = co[mask] + d_out * disp
+    out_hr[a] = pos[a] + d_in * hlen
+    out_hl[b] = pos[b] - d_out * hlen
+    out_vec_l[a] = True
+    out_vec_r[a] = False
+    out_vec_l[b] = False
+    out_vec_r[b] = True
+    out_r[a] = radius[mask]
+    out_r[b] = radius[mask]
+
+    # Vector handles point a third of the way to the neighbouring point.
+    prev_pos = np.roll(pos, 1, axis=0)
+    next_pos = np.roll(pos, -1, axis=0)
+    if not cyclic:
+        prev_pos[0] = 2.0 * pos[0] - pos[1] if total > 1 else pos[0]
+        next_pos[-1] = 2.0 * pos[-1] - pos[-2] if total > 1 else pos[-1]
+    out_hl[out_vec_l] = pos[out_vec_l] + (prev_pos[out_vec_l] - pos[out_vec_l]) / 3.0
+    out_hr[out_vec_r] = pos[out_vec_r] + (next_pos[out_vec_r] - pos[out_vec_r]) / 3.0
+    return pos, out_hl, out_hr, out_r, out_vec_l, out_vec_r
+
+
+def evaluate_bezier(pos, hl, hr, radius, vec_l, vec_r, resolution, cyclic):
+    """Evaluated points like Blender: `resolution` samples per segment, 1 for vector-vector segments."""
+    n = len(pos)
+    seg = np.arange(n if cyclic else n - 1)
+    nxt = (seg + 1) % n
+    resolution = max(int(resolution), 1)
+    t = np.arange(resolution, dtype=np.float64) / resolution
+    s = 1.0 - t
+
+    p0 = pos[seg][:, None, :]
+    p1 = hr[seg][:, None, :]
+    p2 = hl[nxt][:, None, :]
+    p3 = pos[nxt][:, None, :]
+    tt = t[None, :, None]
+    ss = s[None, :, None]
+    pts = ss**3 * p0 + 3.0 * ss**2 * tt * p1 + 3.0 * ss * tt**2 * p2 + tt**3 * p3
+    rad = radius[seg][:, None] * s[None, :] + radius[nxt][:, None] * t[None, :]
+
+    keep = np.ones((len(seg), resolution), dtype=bool)
+    keep[:, 1:] = ~(vec_r[seg] & vec_l[nxt])[:, None]
+    pts = pts[keep]
+    rad = rad[keep]
+    if not cyclic:
+        pts = np.vstack((pts, pos[-1:]))
+        rad = np.concatenate((rad, radius[-1:]))
+    return pts, rad
+
+
+def resample_by_length(pts, rad, sample_length, cyclic):
+    """Resample Curve node, Length mode."""
+    closed = np.vstack((pts, pts[:1])) if cyclic else pts
+    closed_rad = np.concatenate((rad, rad[:1])) if cyclic else rad
+    seg_len = np.linalg.norm(np.diff(closed, axis=0), axis=1)
+    cum = np.concatenate(([0.0], np.cumsum(seg_len)))
+    total = float(cum[-1])
+
+    count = max(int(total / sample_length) + 1, 1) if sample_length > 0.0 else 1
+    if cyclic:
+        targets = np.arange(count, dtype=np.float64) * (total / count)
+    elif count > 1:
+        targets = np.linspace(0.0, total, count)
+    else:
+        targets = np.zeros(1)
+
+    if len(seg_len) == 0:
+        return np.repeat(pts[:1], len(targets), axis=0), np.repeat(rad[:1], len(targets))
+
+    idx = np.clip(np.searchsorted(cum, targets, side="right") - 1, 0, len(seg_len) - 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f = np.where(seg_len[idx] > 0.0, (targets - cum[idx]) / seg_len[idx], 0.0)
+    f = np.clip(f, 0.0, 1.0)
+    out = closed[idx] + (closed[idx + 1] - closed[idx]) * f[:, None]
+    out_rad = closed_rad[idx] + (closed_rad[idx + 1] - closed_rad[idx]) * f
+    return out, out_rad
+
+
+def poly_tangents(pts, cyclic):
+    n = len(pts)
+    if n < 2:
+        return np.tile((1.0, 0.0, 0.0), (n, 1))
+    if cyclic:
+        d_prev = normalize_rows(pts - np.roll(pts, 1, axis=0))
+        d_next = normalize_rows(np.roll(pts, -1, axis=0) - pts)
+        return normalize_rows(d_prev + d_next)
+    d = normalize_rows(np.diff(pts, axis=0))
+    tangents = np.empty_like(pts)
+    tangents[0] = d[0]
+    tangents[-1] = d[-1]
+    tangents[1:-1] = normalize_rows(d[:-1] + d[1:])
+    return tangents
+
+
+def z_up_normals(tangents):
+    normals = np.stack((tangents[:, 1], -tangents[:, 0], np.zeros(len(tangents))), axis=1)
+    flat = (np.abs(tangents[:, 0]) + np.abs(tangents[:, 1])) < 1e-4
+    normals[flat] = (1.0, 0.0, 0.0)
+    return normalize_rows(normals)
+
+
+def ribbon_geometry(co, hl, hr, radius, vec_l, vec_r, cyclic, resolution, width, seg_mult, uv_u, uv_v):
+    """
+    Ribbon of one Bezier spline from its control arrays (vec_l/vec_r: VECTOR handle flags).
+    Returns (verts (n,3), loop vertex indices (m,), face count, uvs (m,2)) or None.
+    """
+    if len(co) < 2:
+        return None
+    fillet_radius = max(width * 0.75, 0.02)
+    with np.errstate(all="ignore"):
+        pos, hl, hr, radius, vec_l, vec_r = fillet_bezier(co, hl, hr, radius, vec_l, vec_r, fillet_radius, cyclic)
+    if not np.all(np.isfinite(pos)) or not np.all(np.isfinite(hl)) or not np.all(np.isfinite(hr)):
+        return None
+
+    pts, rad = evaluate_bezier(pos, hl, hr, radius, vec_l, vec_r, resolution, cyclic)
+    sample_length = min(max(width * 0.10, 0.5), 0.5) / max(seg_mult, 0.001)
+    pts, rad = resample_by_length(pts, rad, sample_length, cyclic)
+
+    ring_count = len(pts)
+    face_count = ring_count if cyclic else ring_count - 1
+    if ring_count < 2 or face_count < 1:
+        return None
+
+    # Curve to Mesh: profile X follows the curve normal, scaled by the point radius (width * radius).
+    normals = z_up_normals(poly_tangents(pts, cyclic))
+    profile = np.asarray(PROFILE_X)
+    offsets = (rad * width)[:, None, None] * profile[None, :, None] * normals[:, None, :]
+    verts = (pts[:, None, :] + offsets).reshape(-1, 3)
+
+    ring = np.arange(face_count)
+    nxt = (ring + 1) % ring_count
+    loops = np.stack((ring * 2, ring * 2 + 1, nxt * 2 + 1, nxt * 2), axis=1).ravel()
+
+    # UV U: length along the resampled curve (Spline Parameter > Length); V: profile factor.
+    u_len = np.concatenate(([0.0], np.cumsum(np.linalg.norm(np.diff(pts, axis=0), axis=1))))
+    vert_u = np.repeat(u_len / uv_u, 2)
+    vert_v = np.tile(profile * width / uv_v, ring_count)
+    uvs = np.stack((vert_u[loops], vert_v[loops]), axis=1)
+    return verts, loops, face_count, uvs
+
+
+def merge_ribbons(parts):
+    """Concatenate ribbon_geometry() results into (verts, loops, face_count, uvs) of one mesh."""
+    verts_all = []
+    loops_all = []
+    uvs_all = []
+    vert_offset = 0
+    face_total = 0
+    for verts, loops, face_count, uvs in parts:
+        verts_all.append(verts)
+        loops_all.append(loops + vert_offset)
+        uvs_all.append(uvs)
+        vert_offset += len(verts)
+        face_total += face_count
+    if not parts:
+        return np.empty((0, 3)), np.empty(0, dtype=np.int64), 0, np.empty((0, 2))
+    return np.concatenate(verts_all), np.concatenate(loops_all), face_total, np.concatenate(uvs_all)
+
+
+__all__ = (
+    "PROFILE_X",
+    "evaluate_bezier",
+    "fillet_bezier",
+    "merge_ribbons",
+    "normalize_rows",
+    "poly_tangents",
+    "resample_by_length",
+    "ribbon_geometry",
+    "z_up_normals",
+)
@@ -0,0 +1,167 @@
+import numpy as np
+
+# Array side of the UV kernels in uv_utils: (loop_count, 2) float64 UVs and per-face
+# loop_start/loop_total arrays in, new UVs out.
+
+_EPS = 1e-12
+
+
+def bbox_of(uvs):
+    """(min_u, min_v, max_u, max_v), or None for no UVs."""
+    if uvs is None or not len(uvs):
+        return None
+    mins = uvs.min(axis=0)
+    maxs = uvs.max(axis=0)
+    return (float(mins[0]), float(mins[1]), float(maxs[0]), float(maxs[1]))
+
+
+def _axis_scale(current_size, target_size):
+    if abs(current_size) <= _EPS:
+        return None if abs(target_size) > _EPS else 1.0
+    if abs(target_size) <= _EPS:
+        return None
+    return target_size / current_size
+
+
+def fit_to_bbox(uvs, target_bbox):
+    """UVs scaled/offset so their bbox matches target_bbox (None when the axes can't be mapped)."""
+    current_bbox = bbox_of(uvs)
+    if current_bbox is None or target_bbox is None:
+        return None
+    cmin_u, cmin_v, cmax_u, cmax_v = current_bbox
+    tmin_u, tmin_v, tmax_u, tmax_v = target_bbox
+    su = _axis_scale(cmax_u - cmin_u, tmax_u - tmin_u)
+    sv = _axis_scale(cmax_v - cmin_v, tmax_v - tmin_v)
+    if su is None or sv is None:
+        return None
+    out = np.array(uvs, dtype=np.float64)
+    out[:, 0] = (out[:, 0] - cmin_u) * su + tmin_u
+    out[:, 1] = (out[:, 1] - cmin_v) * sv + tmin_v
+    return out
+
+
+def segment_axis_from_bbox(bbox):
+    if bbox is None:
+        return "X"
+    try:
+        min_u, min_v, max_u, max_v = bbox
+        uspan = float(max_u) - float(min_u)
+        vspan = float(max_v) - float(min_v)
+    except Exception:
+        return "X"
+    return "Y" if abs(vspan) > abs(uspan) else "X"
+
+
+def face_slot_uvs(uvs, starts, totals, segments, slot_axis="X"):
+    """
+    Every face gets its own 0..1 UV slot along slot_axis, repeating after `segments` faces
+    (0 = one slot per face). Returns the new UVs, or None when the loop layout doesn't fit.
+    """
+    segment_slots = segments if segments > 0 else len(starts)
+    if not len(starts) or segment_slots < 1:
+        return None
+    out = np.array(uvs, dtype=np.float64)
+
+    face_rank = np.arange(len(starts))
+    valid = totals > 0
+    starts = starts[valid]
+    totals = totals[valid]
+    face_rank = face_rank[valid]
+    if not len(starts):
+        return out
+
+    # Loop indices of every face, concatenated face by face.
+    offsets = np.concatenate(([0], np.cumsum(totals)[:-1]))
+    loop_idx = np.repeat(starts - offsets, totals) + np.arange(int(totals.sum()))
+    if loop_idx.max() >= len(out):
+        return None
+    face_uvs = out[loop_idx]
+
+    umin = np.minimum.reduceat(face_uvs[:, 0], offsets)
+    umax = np.maximum.reduceat(face_uvs[:, 0], offsets)
+    vmin = np.minimum.reduceat(face_uvs[:, 1], offsets)
+    vmax = np.maximum.reduceat(face_uvs[:, 1], offsets)
+    uspan = np.repeat(umax - umin, totals)
+    vspan = np.repeat(vmax - vmin, totals)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        local_u = np.where(np.abs(uspan) <= _EPS, 0.0, (face_uvs[:, 0] - np.repeat(umin, totals)) / uspan)
+        local_v = np.where(np.abs(vspan) <= _EPS, 0.0, (face_uvs[:, 1] - np.repeat(vmin, totals)) / vspan)
+    face_slot = np.repeat((face_rank % segment_slots).astype(np.float64), totals)
+
+    if slot_axis == "Y":
+        out[loop_idx, 0] = local_u
+        out[loop_idx, 1] = face_slot + local_v
+    else:
+        out[loop_idx, 0] = face_slot + local_u
+        out[loop_idx, 1] = local_v
+    return out
+
+
+def strip_rings(starts, totals, loop_verts, vert_count):
+    """
+    (ring_a, ring_b) per face when the faces form a ribbon strip: vertices 2r/2r+1 are the two
+    profile sides of ring r and every quad runs (a, 0) -> (a, 1) -> (b, 1) -> (b, 0). None otherwise.
+    """
+    face_count = len(starts)
+    if face_count < 1 or vert_count < 4 or vert_count % 2 or len(loop_verts) != face_count * 4:
+        return None
+    if np.any(totals != 4) or np.any(starts != np.arange(face_count) * 4):
+        return None
+    lv = np.asarray(loop_verts).reshape(face_count, 4)
+    if (
+        np.any(lv[:, 0] % 2)
+        or np.any(lv[:, 3] % 2)
+        or np.any(lv[:, 1] != lv[:, 0] + 1)
+        or np.any(lv[:, 2] != lv[:, 3] + 1)
+        or np.any(lv >= vert_count)
+    ):
+        return None
+    return lv[:, 0] // 2, lv[:, 3] // 2
+
+
+def strip_face_arcs(centers, ring_a, ring_b):
+    """
+    Arc length at each face's near/far ring, measured from the start of its strip, plus the strip
+    index of every face. A new strip starts wherever a face doesn't continue the previous one.
+    """
+    seg = np.linalg.norm(centers[ring_b] - centers[ring_a], axis=1)
+    new_strip = np.ones(len(seg), dtype=bool)
+    new_strip[1:] = ring_a[1:] != ring_b[:-1]
+    cum = np.cumsum(seg)
+    strip_offset = np.maximum.accumulate(np.where(new_strip, cum - seg, 0.0))
+    arc_a = cum - seg - strip_offset
+    return arc_a, arc_a + seg, np.cumsum(new_strip) - 1
+
+
+def strip_uvs(co, ring_a, ring_b):
+    """
+    (face_count * 4, 2) loop UVs of a ribbon strip: U = arc length along the ring centers /
+    average ribbon width, V = profile side (0/1). None for a zero-width ribbon.
+    """
+    co = np.asarray(co, dtype=np.float64).reshape(-1, 2, 3)
+    width = float(np.linalg.norm(co[:, 1] - co[:, 0], axis=1).mean())
+    if width <= _EPS:
+        return None
+    face_count = len(ring_a)
+    arc_a, arc_b, _strip = strip_face_arcs(co.mean(axis=1), ring_a, ring_b)
+    u_a = arc_a / width
+    u_b = arc_b / width
+
+    uvs = np.empty((face_count, 4, 2), dtype=np.float64)
+    uvs[:, 0] = np.stack((u_a, np.zeros(face_count)), axis=1)
+    uvs[:, 1] = np.stack((u_a, np.ones(face_count)), axis=1)
+    uvs[:, 2] = np.stack((u_b, np.ones(face_count)), axis=1)
+    uvs[:, 3] = np.stack((u_b, np.zeros(face_count)), axis=1)
+    return uvs.reshape(-1, 2)
+
+
+__all__ = (
+    "bbox_of",
+    "face_slot_uvs",
+    "fit_to_bbox",
+    "segment_axis_from_bbox",
+    "strip_face_arcs",
+    "strip_rings",
+    "strip_uvs",
+)
@@ -2,6 +2,70 @@ from math import acos, degrees
 
 from mathutils import Vector
 
+import numpy as np
+
+from .core.handles import (
+    APPROACH_SCALE as _APPROACH_SCALE,
+    HANDLE_SCALE as _HANDLE_SCALE,
+    RIGHT_ANGLE_SCALE as _RIGHT_ANGLE_SCALE,
+    TURN_MAX_DEG as _TURN_MAX_DEG,
+    TURN_MIN_DEG as _TURN_MIN_DEG,
+    WINDOW_RADIUS,
+    changed_point_indices,
+    merge_windows,
+    solve_taxi_handles,
+    solve_taxi_handles_range,
+)
+
+# The array solver lives in core/handles.py; this module reads/writes the Bezier points around it
+# and keeps the per-point loop for short splines.
+
+# Below this many points the fixed NumPy/foreach overhead outweighs the per-point loop.
+_NUMPY_MIN_POINTS = 24
+# Windowed handle solves read/write whole foreach arrays up to this spline length. Beyond it the
+# O(n) foreach copies cost more than touching the few window points through RNA.
+_BULK_HANDLE_MAX_POINTS = 512
+
+# Every per-point BezierSplinePoint field (name, components, dtype), for bulk foreach copies.
+# Handle types come first: setting them re-aligns the handles, which the handle copies then undo.
+_BEZIER_POINT_FIELDS = (
+    ("handle_left_type", 1, np.int32),
+    ("handle_right_type", 1, np.int32),
+    ("co", 3, np.float32),
+    ("handle_left", 3, np.float32),
+    ("handle_right", 3, np.float32),
+    ("radius", 1, np.float32),
+    ("tilt", 1, np.float32),
+    ("weight_softbody", 1, np.float32),
+    ("select_control_point", 1, bool),
+    ("select_left_handle", 1, bool),
+    ("select_right_handle", 1, bool),
+    ("hide", 1, bool),
+)
+# The same for POLY/NURBS spline points (co carries the NURBS weight as w).
+_SPLINE_POINT_FIELDS = (
+    ("co", 4, np.float32),
+    ("weight", 1, np.float32),
+    ("radius", 1, np.float32),
+    ("tilt", 1, np.float32),
+    ("weight_softbody", 1, np.float32),
+    ("select", 1, bool),
+    ("hide", 1, bool),
+)
+# Writable Spline settings, set after the points exist (order_u is clamped to the point count).
+_SPLINE_SETTINGS = (
+    "tilt_interpolation",
+    "radius_interpolation",
+    "order_u",
+    "resolution_u",
+    "use_cyclic_u",
+    "use_endpoint_u",
+    "use_bezier_u",
+    "use_smooth",
+    "hide",
+    "material_index",
+)
+
 
 def _clamp(v, lo, hi):
     return lo if v < lo else hi if v > hi else v
@@ -17,7 +81,7 @@ def _dir(a, b, fallback):
     return _norm_or(Vector(b) - Vector(a), fallback)
 
 
-def apply_taxi_handles_to_spline(spline):
+def _apply_taxi_handles_to_spline_loop(spline):
     pts = spline.bezier_points
     n = len(pts)
     if n < 2:
@@ -27,7 +91,7 @@ def apply_taxi_handles_to_spline(spline):
     # - Default: smooth tangent (bisector) for rounded corners.
     # - Keep corners C1-continuous (avoid hard kinks) so thick ribbons don't self-overlap.
     # - Straighten approach/departure handles around turns to avoid "snaking".
-    handle_scale = 0.45
+    handle_scale = _HANDLE_SCALE
 
     # Explicit handles reduce overshoot and keep corners predictable.
     for bp in pts:
@@ -81,7 +145,7 @@ def apply_taxi_handles_to_spline(spline):
         vR = t
 
         # Near right angles, bias toward a wider fillet to avoid self-intersections.
-        local_scale = 0.60 if 70.0 <= deflection <= 110.0 else handle_scale
+        local_scale = _RIGHT_ANGLE_SCALE if 70.0 <= deflection <= 110.0 else handle_scale
 
         base = min(dist_in, dist_out)
         length = base * local_scale
@@ -98,9 +162,9 @@ def apply_taxi_handles_to_spline(spline):
     # Second pass: straighten approach/departure handles before/after turns
     # to avoid "snaking" where the curve initially bends the wrong way.
     # Only affects neighboring points (not the corner point itself), so it stays non-destructive.
-    turn_min_deg = 25.0
-    turn_max_deg = 70.0
-    approach_scale = 0.08
+    turn_min_deg = _TURN_MIN_DEG
+    turn_max_deg = _TURN_MAX_DEG
+    approach_scale = _APPROACH_SCALE
 
     for i in range(1, n - 1):
         p_prev = Vector(pts[i - 1].co)
@@ -130,6 +194,300 @@ def apply_taxi_handles_to_spline(spline):
             pts[i + 1].handle_left = p_next + d * (dist_next * approach_scale)
 
 
+def read_spline_points(spline):
+    """(co, handle_left, handle_right) float32 (n, 3) arrays of a Bezier spline."""
+    pts = spline.bezier_points
+    n = len(pts)
+    out = []
+    for attr in ("co", "handle_left", "handle_right"):
+        buf = np.empty(n * 3, dtype=np.float32)
+        pts.foreach_get(attr, buf)
+        out.append(buf.reshape(n, 3))
+    return tuple(out)
+
+
+def insert_bezier_points(spline, index, count=1, co=None):
+    """
+    Open a gap of `count` points before `index` in place (index == len appends). All point fields
+    are moved with one foreach_get/foreach_set each, so the cost hardly depends on the spline
+    length, and the spline itself (with all its settings) is kept. New points start as copies
+    of their neighbour (unselected); `co` ((count, 3) local positions) places them in the same
+    write. Appending leaves the existing points alone and only writes the new tail. Returns the
+    index of the first new point.
+    """
+    bps = spline.bezier_points
+    n = len(bps)
+    index = min(max(int(index), 0), n)
+    count = max(int(count), 0)
+    if count == 0:
+        return index
+    new_co = None if co is None else np.asarray(co, dtype=np.float32).reshape(count, 3)
+
+    if index == n:
+        bps.add(count)
+        values = []
+        if n:
+            last = bps[n - 1]
+            for name, width, dtype in _BEZIER_POINT_FIELDS:
+                if dtype is bool:
+                    values.append((name, 1, False))
+                    continue
+                try:
+                    value = getattr(last, name)
+                except Exception:
+                    continue
+                values.append((name, width, tuple(value) if width > 1 else value))
+        for k in range(count):
+            bp = bps[n + k]
+            # Only touch what add() didn't already set (RNA setters clamp, foreach_set doesn't).
+            for name, width, value in values:
+                current = getattr(bp, name)
+                if (tuple(current) if width > 1 else current) != value:
+                    setattr(bp, name, value)
+            if new_co is not None:
+                bp.co = new_co[k]
+        return index
+
+    fields = []
+    for name, width, dtype in _BEZIER_POINT_FIELDS:
+        buf = np.empty(n * width, dtype=dtype)
+        try:
+            bps.foreach_get(name, buf)
+        except Exception:
+            continue
+        fields.append((name, buf.reshape(n, width)))
+
+    bps.add(count)
+    for name, arr in fields:
+        if name == "co" and new_co is not None:
+            fill = new_co
+        else:
+            fill = np.repeat(arr[index : index + 1], count, axis=0)
+            if arr.dtype == bool:
+                fill[:] = False
+        bps.foreach_set(name, np.concatenate((arr[:index], fill, arr[index:])).ravel())
+    return index
+
+
+def _read_point_fields(points, fields):
+    out = []
+    n = len(points)
+    for name, width, dtype in fields:
+        buf = np.empty(n * width, dtype=dtype)
+        try:
+            points.foreach_get(name, buf)
+        except Exception:
+            continue
+        out.append((name, buf.reshape(n, width)))
+    return out
+
+
+def remove_bezier_end_point(curve_data, spline_index, at_start=False):
+    """
+    Drop the last (or with `at_start` the first) point of a Bezier spline without Edit Mode.
+    RNA can add points but not remove them, so the spline is rebuilt one point shorter from
+    foreach copies; the splines behind it are rebuilt as well so every spline keeps its index.
+    Object Mode only (Edit Mode works on its own copy of the points). Returns the new spline, or
+    None when there was no point to spare.
+    """
+    splines = curve_data.splines
+    if spline_index >= len(splines):
+        return None
+    spline = splines[spline_index]
+    if spline.type != "BEZIER" or len(spline.bezier_points) <= 1:
+        return None
+
+    saved = []
+    for index in range(spline_index, len(splines)):
+        src = splines[index]
+        bezier = src.type == "BEZIER"
+        fields = _read_point_fields(
+            src.bezier_points if bezier else src.points,
+            _BEZIER_POINT_FIELDS if bezier else _SPLINE_POINT_FIELDS,
+        )
+        if index == spline_index:
+            cut = slice(1, None) if at_start else slice(None, -1)
+            fields = [(name, arr[cut]) for name, arr in fields]
+        settings = [(name, getattr(src, name)) for name in _SPLINE_SETTINGS if hasattr(src, name)]
+        saved.append((src.type, fields, settings))
+
+    # New splines are always appended, so the tail goes first and comes back in order.
+    for src in list(splines)[spline_index:]:
+        splines.remove(src)
+    for spline_type, fields, settings in saved:
+        dst = splines.new(type=spline_type)
+        points = dst.bezier_points if spline_type == "BEZIER" else dst.points
+        count = len(fields[0][1]) if fields else 1
+        if count > len(points):
+            points.add(count - len(points))
+        for name, arr in fields:
+            points.foreach_set(name, arr.ravel())
+        for name, value in settings:
+            try:
+                setattr(dst, name, value)
+            except Exception:
+                pass
+    return splines[spline_index]
+
+
+def _apply_taxi_handles_to_spline_np(spline):
+    """Same rules as _apply_taxi_handles_to_spline_loop, as array ops with one bulk read/write."""
+    pts = spline.bezier_points
+    n = len(pts)
+    if n < 2:
+        return True
+
+    co, left, right = (a.astype(np.float64) for a in read_spline_points(spline))
+    solve_taxi_handles(co, left, right)
+
+    # Explicit (FREE) handles reduce overshoot and keep corners predictable. FREE is enum value 0.
+    free = np.zeros(n, dtype=np.int32)
+    pts.foreach_set("handle_left_type", free)
+    pts.foreach_set("handle_right_type", free)
+    pts.foreach_set("handle_left", left.astype(np.float32).ravel())
+    pts.foreach_set("handle_right", right.astype(np.float32).ravel())
+    try:
+        spline.id_data.update_tag()
+    except Exception:
+        pass
+    return True
+
+
+def _read_window(pts, first, last):
+    window = [pts[k] for k in range(first, last + 1)]
+    return tuple(
+        np.array([tuple(getattr(bp, attr)) for bp in window], dtype=np.float32)
+        for attr in ("co", "handle_left", "handle_right")
+    )
+
+
+def _solve_handle_ranges(spline, ranges, points=None):
+    """
+    Re-solve the handles of the points in each (lo, hi) range. `points` may pass an already read
+    read_spline_points() result; returns the points as written (None when only the windows were
+    read, see _BULK_HANDLE_MAX_POINTS).
+    """
+    pts = spline.bezier_points
+    n = len(pts)
+    if n < 2:
+        return points
+    bulk = n <= _BULK_HANDLE_MAX_POINTS
+    if points is None and not bulk:
+        # Long spline: read only the windows (ranges ± WINDOW_RADIUS) point by point.
+        for lo, hi in ranges:
+            first = max(0, int(lo) - WINDOW_RADIUS)
+            last = min(n - 1, int(hi) + WINDOW_RADIUS)
+            if first > last:
+                continue
+            co, left, right = _read_window(pts, first, last)
+            lo_w, w_left, w_right = solve_taxi_handles_range(co, left, right, int(lo) - first, int(hi) - first)
+            _write_handles_per_point(pts, range(first + lo_w, first + lo_w + len(w_left)), w_left, w_right)
+        return None
+
+    co, left, right = points if points is not None else read_spline_points(spline)
+    left = left.copy()
+    right = right.copy()
+    solved = np.zeros(n, dtype=bool)
+    for lo, hi in ranges:
+        # Ranges are solved in order against the handles already written by the previous ones.
+        first, w_left, w_right = solve_taxi_handles_range(co, left, right, lo, hi)
+        last = first + len(w_left)
+        left[first:last] = w_left
+        right[first:last] = w_right
+        solved[first:last] = True
+    if not solved.any():
+        return co, left, right
+
+    if not bulk:
+        indices = np.flatnonzero(solved)
+        _write_handles_per_point(pts, indices, left[indices], right[indices])
+        return co, left, right
+
+    # Explicit (FREE) handles, as in the full solve. FREE is enum value 0.
+    for attr in ("handle_left_type", "handle_right_type"):
+        types = np.empty(n, dtype=np.int32)
+        pts.foreach_get(attr, types)
+        if np.any(types[solved] != 0):
+            types[solved] = 0
+            pts.foreach_set(attr, types)
+    pts.foreach_set("handle_left", left.ravel())
+    pts.foreach_set("handle_right", right.ravel())
+    try:
+        spline.id_data.update_tag()
+    except Exception:
+        pass
+    return co, left, right
+
+
+def _write_handles_per_point(pts, indices, left, right):
+    for j, k in enumerate(indices):
+        bp = pts[int(k)]
+        if bp.handle_left_type != "FREE":
+            bp.handle_left_type = "FREE"
+        if bp.handle_right_type != "FREE":
+            bp.handle_right_type = "FREE"
+        bp.handle_left = left[j]
+        bp.handle_right = right[j]
+
+
+def apply_taxi_handles_to_spline_range(spline, lo, hi):
+    """
+    Recompute handles of points lo..hi only, with the same result as a full solve.
+
+    A point's handles depend on the points up to two away (bisector + approach straightening),
+    so only lo-2..hi+2 feed the solve.
+    """
+    _solve_handle_ranges(spline, ((lo, hi),))
+
+
+def apply_taxi_handles_to_spline_window(spline, index, radius=WINDOW_RADIUS):
+    """Recompute handles after point `index` was moved, added or removed (points index±radius)."""
+    apply_taxi_handles_to_spline_range(spline, index - radius, index + radius)
+
+
+def extend_bezier_spline(spline, local_points, at_start=False):
+    """
+    Append (or prepend) several points, their positions written as part of the insert, and
+    solve only the handles around the joint. With `at_start`, local_points[0] ends up next to
+    the old first point. Returns the index range (lo, hi) of the new points, or None when there
+    was nothing to add.
+    """
+    count = len(local_points)
+    if count == 0:
+        return None
+    index = 0 if at_start else len(spline.bezier_points)
+    co = [tuple(p) for p in local_points]
+    insert_bezier_points(spline, index, count, co=co[::-1] if at_start else co)
+    lo, hi = index, index + count - 1
+    apply_taxi_handles_to_spline_range(spline, lo - WINDOW_RADIUS, hi + WINDOW_RADIUS)
+    return lo, hi
+
+
+def update_taxi_handles_incremental(spline, before, max_windows=16):
+    """
+    Re-solve only the handles affected by what changed since `before` (the state returned by
+    the previous call) and return the new state. Falls back to a full solve when the change
+    can't be localized.
+    """
+    points = read_spline_points(spline)
+    changed = changed_point_indices(before, points)
+    if changed is None or len(changed) > max_windows:
+        apply_taxi_handles_to_spline(spline)
+        return read_spline_points(spline)
+    # Overlapping windows are merged so every point is solved once.
+    return _solve_handle_ranges(spline, merge_windows(changed), points)
+
+
+def apply_taxi_handles_to_spline(spline):
+    if len(spline.bezier_points) >= _NUMPY_MIN_POINTS:
+        try:
+            if _apply_taxi_handles_to_spline_np(spline):
+                return
+        except Exception:
+            pass
+    _apply_taxi_handles_to_spline_loop(spline)
+
+
 def apply_taxi_handles_to_curve(curve_obj, corner_tightness=0.5):
     if curve_obj is None or curve_obj.type != "CURVE" or curve_obj.data is None:
         return
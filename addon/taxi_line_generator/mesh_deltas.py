@@ -0,0 +1,247 @@
+import numpy as np
+
+from .core.deltas import capture_edits, pack_deltas, ribbon_keys, unpack_deltas
+from .core.deltas import sample_edits as sample_ribbon_edits
+from .uv_utils import strip_rings
+
+# Bulk vertex-coordinate helpers for carrying user edits (export - base) onto regenerated meshes.
+
+_EDIT_KEYS_KEY = "tlg_edit_keys"
+_EDIT_DELTAS_KEY = "tlg_edit_deltas"
+
+# Compact storage: instead of a hidden _BASE duplicate, the export object keeps only its non-zero
+# vertex deltas (packed float32) plus the preview fingerprint of the curve they were taken against.
+STORAGE_FULL = "FULL"
+STORAGE_COMPACT = "COMPACT"
+_STORAGE_KEY = "tlg_edit_storage"
+_DELTA_INDICES_KEY = "tlg_delta_indices"
+_DELTA_VALUES_KEY = "tlg_delta_values"
+_DELTA_VERTEX_COUNT_KEY = "tlg_delta_vertex_count"
+_DELTA_FINGERPRINT_KEY = "tlg_delta_fingerprint"
+
+
+def read_coords(mesh):
+    """(vertex_count, 3) float64 array of vertex coordinates (None if unreadable)."""
+    verts = getattr(mesh, "vertices", None)
+    if verts is None:
+        return None
+    try:
+        buf = np.empty(len(verts) * 3, dtype=np.float32)
+        verts.foreach_get("co", buf)
+    except Exception:
+        return None
+    return buf.reshape(-1, 3).astype(np.float64)
+
+
+def write_coords(mesh, coords):
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(coords, dtype=np.float32).ravel())
+    mesh.update()
+
+
+def edit_deltas(export_mesh, base_mesh):
+    """Per-vertex offsets the user applied to the export mesh, or None if the layouts differ."""
+    export_co = read_coords(export_mesh)
+    base_co = read_coords(base_mesh)
+    if export_co is None or base_co is None or export_co.shape != base_co.shape:
+        return None
+    return export_co - base_co
+
+
+def apply_edit_deltas(new_mesh, old_export_mesh, old_base_mesh):
+    """Add (old_export - old_base) to new_mesh in place. Returns False when vertex counts differ."""
+    deltas = edit_deltas(old_export_mesh, old_base_mesh)
+    if deltas is None:
+        return False
+    coords = read_coords(new_mesh)
+    if coords is None or coords.shape != deltas.shape:
+        return False
+    if not np.any(deltas):
+        return True
+    write_coords(new_mesh, coords + deltas)
+    return True
+
+
+def ribbon_coordinates(mesh):
+    """
+    Ribbon-space key of every vertex: (strip * 2 + side) * 2 + arc-length fraction along the strip.
+
+    Keys of one (strip, side) group are contiguous and sorted by position along the line, so a
+    single searchsorted maps vertices between meshes of different density. None if not a strip.
+    """
+    rings = strip_rings(mesh)
+    coords = read_coords(mesh)
+    if rings is None or coords is None:
+        return None
+    return ribbon_keys(coords, *rings)
+
+
+def capture_ribbon_edits(export_mesh, base_mesh):
+    """
+    Sparse ribbon-space edits (keys, deltas) between an export mesh and its base.
+
+    Edited vertices are kept together with their unedited neighbours along each side, so the
+    interpolated displacement falls back to zero next to an edit. None if it can't be captured.
+    """
+    deltas = edit_deltas(export_mesh, base_mesh)
+    if deltas is None:
+        return None
+    keys = ribbon_coordinates(base_mesh)
+    rings = strip_rings(base_mesh)
+    if keys is None or rings is None:
+        return None
+    return capture_edits(deltas, keys, *rings)
+
+
+def apply_ribbon_edits(new_mesh, keys, deltas):
+    """Re-apply stored ribbon-space edits to a regenerated ribbon of any density."""
+    if not len(keys):
+        return True
+    query = ribbon_coordinates(new_mesh)
+    coords = read_coords(new_mesh)
+    if query is None or coords is None:
+        return False
+    offsets = sample_ribbon_edits(query, keys, deltas)
+    if not np.any(offsets):
+        return True
+    write_coords(new_mesh, coords + offsets)
+    return True
+
+
+def store_ribbon_edits(curve_obj, keys, deltas):
+    if curve_obj is None:
+        return
+    try:
+        if not len(keys):
+            for key in (_EDIT_KEYS_KEY, _EDIT_DELTAS_KEY):
+                if key in curve_obj:
+                    del curve_obj[key]
+            return
+        old_keys, old_deltas = load_ribbon_edits(curve_obj)
+        if np.array_equal(old_keys, keys) and np.array_equal(old_deltas, deltas):
+            return
+        curve_obj[_EDIT_KEYS_KEY] = keys.tolist()
+        curve_obj[_EDIT_DELTAS_KEY] = deltas.ravel().tolist()
+    except Exception:
+        pass
+
+
+def load_ribbon_edits(curve_obj):
+    """(keys, deltas) stored on a source curve (empty arrays if none)."""
+    try:
+        keys = np.asarray(curve_obj.get(_EDIT_KEYS_KEY, ()), dtype=np.float64)
+        deltas = np.asarray(curve_obj.get(_EDIT_DELTAS_KEY, ()), dtype=np.float64).reshape(-1, 3)
+    except Exception:
+        return np.empty(0), np.empty((0, 3))
+    if len(keys) != len(deltas):
+        return np.empty(0), np.empty((0, 3))
+    return keys, deltas
+
+
+def uses_compact_storage(curve_obj):
+    try:
+        return curve_obj is not None and curve_obj.get(_STORAGE_KEY) == STORAGE_COMPACT
+    except Exception:
+        return False
+
+
+def set_edit_storage(curve_obj, mode):
+    if curve_obj is None:
+        return
+    try:
+        if curve_obj.get(_STORAGE_KEY) != mode:
+            curve_obj[_STORAGE_KEY] = mode
+    except Exception:
+        pass
+
+
+def _set_packed(obj, key, values):
+    # Assigning a buffer over an existing (possibly empty) array property can crash Blender;
+    # replace the property instead of resizing it in place.
+    if key in obj:
+        del obj[key]
+    obj[key] = values
+
+
+def store_compact_deltas(export_obj, deltas, fingerprint=""):
+    """
+    Keep only the non-zero rows of deltas on export_obj (int32 indices + float32 xyz).
+
+    The four compact keys are written as a set: if any write fails they are all removed (a
+    half-written set would pair new indices with old values) and the error is re-raised.
+    """
+    if export_obj is None or deltas is None:
+        return
+    indices, values = pack_deltas(deltas)
+    try:
+        _set_packed(export_obj, _DELTA_INDICES_KEY, indices)
+        _set_packed(export_obj, _DELTA_VALUES_KEY, values)
+        if export_obj.get(_DELTA_VERTEX_COUNT_KEY) != len(deltas):
+            export_obj[_DELTA_VERTEX_COUNT_KEY] = len(deltas)
+        if export_obj.get(_DELTA_FINGERPRINT_KEY) != (fingerprint or ""):
+            export_obj[_DELTA_FINGERPRINT_KEY] = fingerprint or ""
+    except Exception:
+        clear_compact_deltas(export_obj)
+        raise
+
+
+def load_compact_deltas(export_obj):
+    """Dense (vertex_count, 3) deltas stored on export_obj, or None when there is nothing usable."""
+    if export_obj is None:
+        return None
+    try:
+        count = int(export_obj.get(_DELTA_VERTEX_COUNT_KEY, -1))
+        indices = export_obj.get(_DELTA_INDICES_KEY, ())
+        values = export_obj.get(_DELTA_VALUES_KEY, ())
+        return unpack_deltas(indices, values, count)
+    except Exception:
+        return None
+
+
+def compact_deltas_fingerprint(export_obj):
+    try:
+        return str(export_obj.get(_DELTA_FINGERPRINT_KEY, "") or "")
+    except Exception:
+        return ""
+
+
+def clear_compact_deltas(export_obj):
+    for key in (_DELTA_INDICES_KEY, _DELTA_VALUES_KEY, _DELTA_VERTEX_COUNT_KEY, _DELTA_FINGERPRINT_KEY):
+        try:
+            if key in export_obj:
+                del export_obj[key]
+        except Exception:
+            pass
+
+
+def base_mesh_from_deltas(export_mesh, deltas, name="TLG_BaseTemp"):
+    """Temporary stand-in for _BASE: a copy of export_mesh with the stored deltas removed."""
+    coords = read_coords(export_mesh)
+    if coords is None or deltas is None or coords.shape != deltas.shape:
+        return None
+    mesh = export_mesh.copy()
+    mesh.name = name
+    write_coords(mesh, coords - deltas)
+    return mesh
+
+
+__all__ = (
+    "STORAGE_COMPACT",
+    "STORAGE_FULL",
+    "apply_edit_deltas",
+    "apply_ribbon_edits",
+    "base_mesh_from_deltas",
+    "capture_ribbon_edits",
+    "clear_compact_deltas",
+    "compact_deltas_fingerprint",
+    "edit_deltas",
+    "load_compact_deltas",
+    "load_ribbon_edits",
+    "read_coords",
+    "ribbon_coordinates",
+    "sample_ribbon_edits",
+    "set_edit_storage",
+    "store_compact_deltas",
+    "store_ribbon_edits",
+    "uses_compact_storage",
+    "write_coords",
+)
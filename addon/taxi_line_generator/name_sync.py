@@ -1,11 +1,43 @@
-import bpy  # pyright: ignore[reportMissingImports]
+import time
 
-from .properties import ensure_taxi_preview, get_source_curve_for_mesh, tlg_parse_base_name, tlg_sync_linked_object_names
+import bpy  # pyright: ignore[reportMissingImports]
+from bpy.app.handlers import persistent  # pyright: ignore[reportMissingImports]
+
+from . import registry
+from .mesh_deltas import uses_compact_storage
+from .preferences import get_preference
+from .properties import (
+    ensure_taxi_preview,
+    get_source_curve_for_mesh,
+    is_taxi_curve,
+    tlg_curve_geometry_hash,
+    tlg_ensure_line_metadata,
+    tlg_file_is_upgraded,
+    tlg_inspect_line,
+    tlg_parse_base_name,
+    tlg_sync_linked_object_names,
+)
 
 _IS_SYNCING = False
 _PENDING_BY_LINE_ID = {}
 _TIMER_ARMED = False
-_LAST_ROLES_BY_LINE_ID = None
+_LAST_QUEUED_AT = 0.0
+
+# Trio membership as of the last sync pass. None until the first pass after load/undo,
+# which rebuilds it with one full scan; later passes only touch what changed.
+_TRACKED_BY_LINE_ID = None  # line_id -> {role: {object key}}
+_TRACKED_BY_OBJECT_KEY = {}  # object key -> (line_id, role, object name)
+_TOUCHED_OBJECT_NAMES = set()
+_GEOMETRY_CHANGED_CURVE_NAMES = set()
+_GEOMETRY_HASH_BY_OBJECT_KEY = {}
+# Object count at the last deletion diff, and whether any depsgraph update named an Object since.
+_LAST_OBJECT_COUNT = -1
+_OBJECT_IDS_UPDATED = False
+
+_REQUIRED_ROLES = frozenset({"SRC", "MESH", "BASE"})
+# Compact-storage lines keep their edit deltas on the export mesh and have no _BASE object.
+_COMPACT_REQUIRED_ROLES = frozenset({"SRC", "MESH"})
+_COMPACT_LINE_IDS = set()
 
 _TLG_ROOT_COLLECTION_NAME = "Taxi Lines"
 _TLG_CHILD_COLLECTION_NAMES = (
@@ -47,6 +79,28 @@ def _infer_role(obj):
     return "MESH"
 
 
+def _is_possible_tlg_object(obj):
+    try:
+        t = getattr(obj, "type", None)
+    except Exception:
+        return False
+    if t not in {"CURVE", "MESH"}:
+        return False
+    try:
+        if obj.get("tlg_line_id"):
+            return True
+    except Exception:
+        pass
+    try:
+        if t == "CURVE":
+            return is_taxi_curve(obj)
+        if tlg_file_is_upgraded():
+            return bool(obj.get("tlg_source_curve"))
+        return bool(obj.get("tlg_source_curve") or obj.get("taxilines_source_curve"))
+    except Exception:
+        return False
+
+
 def _iter_possible_tlg_objects():
     try:
         objects = getattr(bpy.data, "objects", None)
@@ -54,92 +108,153 @@ def _iter_possible_tlg_objects():
         objects = None
     if not objects:
         return []
+    return [obj for obj in list(objects) if _is_possible_tlg_object(obj)]
 
-    out = []
-    for obj in list(objects):
-        try:
-            t = getattr(obj, "type", None)
-        except Exception:
-            continue
-        if t not in {"CURVE", "MESH"}:
-            continue
-        try:
-            if obj.get("tlg_line_id"):
-                out.append(obj)
-                continue
-        except Exception:
-            pass
-        if t == "CURVE":
-            try:
-                if obj.get("tlg_is_taxi_line") or ("taxilines_mesh" in obj):
-                    out.append(obj)
-                    continue
-            except Exception:
-                continue
-        else:
-            try:
-                if obj.get("tlg_source_curve") or obj.get("taxilines_source_curve"):
-                    out.append(obj)
-                    continue
-            except Exception:
-                continue
-    return out
 
+def _object_key(obj):
+    # session_uid is stable for the whole session; as_pointer() is the fallback on builds without it.
+    try:
+        key = getattr(obj, "session_uid", None)
+        if key:
+            return key
+        return obj.as_pointer()
+    except Exception:
+        return None
 
-def _build_line_state():
-    roles_by_line_id = {}
-    objs_by_line_id = {}
 
-    for obj in _iter_possible_tlg_objects():
-        line_id = None
-        role = None
+def _line_state_for_object(obj):
+    # Read-only: sync passes must not touch modifiers/handles (that re-tags the depsgraph).
+    _curve_obj, line_id, role = tlg_inspect_line(obj)
+    if obj.type == "MESH" and not role:
+        role = _infer_role(obj)
+    if not line_id or not role:
+        return None, None
+    return line_id, str(role)
 
-        try:
-            line_id = obj.get("tlg_line_id")
-        except Exception:
-            line_id = None
-        try:
-            role = obj.get("tlg_line_role")
-        except Exception:
-            role = None
 
-        if obj.type == "CURVE":
-            ensure_taxi_preview(obj)
-            try:
-                line_id = obj.get("tlg_line_id")
-            except Exception:
-                line_id = None
-            role = "SRC"
+def _refresh_changed_preview(name):
+    # Only re-solve handles / rewrite modifier inputs for curves whose control points actually moved.
+    try:
+        curve_obj = bpy.data.objects.get(name)
+    except Exception:
+        curve_obj = None
+    if curve_obj is None or getattr(curve_obj, "type", None) != "CURVE":
+        return
+    if getattr(curve_obj, "mode", "OBJECT") == "EDIT":
+        # Edit-mode changes live in the edit cache; they are picked up when leaving Edit Mode.
+        return
+    key = _object_key(curve_obj)
+    geometry_hash = tlg_curve_geometry_hash(curve_obj)
+    if geometry_hash is None or _GEOMETRY_HASH_BY_OBJECT_KEY.get(key) == geometry_hash:
+        return
+    ensure_taxi_preview(curve_obj)
+    _GEOMETRY_HASH_BY_OBJECT_KEY[key] = geometry_hash
+
+
+def _is_complete_line(line_id, roles):
+    required = _COMPACT_REQUIRED_ROLES if line_id in _COMPACT_LINE_IDS else _REQUIRED_ROLES
+    return required.issubset(roles)
+
+
+def _untrack_object_key(key):
+    entry = _TRACKED_BY_OBJECT_KEY.pop(key, None)
+    if entry is None:
+        return None
+    line_id, role, _name = entry
+    roles = (_TRACKED_BY_LINE_ID or {}).get(line_id)
+    if roles is not None:
+        keys = roles.get(role)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                roles.pop(role, None)
+        if not roles:
+            _TRACKED_BY_LINE_ID.pop(line_id, None)
+    return line_id
+
+
+def _track_object(obj):
+    key = _object_key(obj)
+    if key is None:
+        return None
+    line_id, role = _line_state_for_object(obj)
+    previous_line_id = _untrack_object_key(key)
+    if not line_id:
+        return previous_line_id
+    _TRACKED_BY_LINE_ID.setdefault(line_id, {}).setdefault(role, set()).add(key)
+    _TRACKED_BY_OBJECT_KEY[key] = (line_id, role, obj.name)
+    if role == "SRC":
+        if uses_compact_storage(obj):
+            _COMPACT_LINE_IDS.add(line_id)
         else:
-            curve_obj = get_source_curve_for_mesh(obj)
-            if curve_obj is not None:
-                ensure_taxi_preview(curve_obj)
-                try:
-                    line_id = curve_obj.get("tlg_line_id")
-                except Exception:
-                    line_id = None
-                if line_id:
-                    try:
-                        obj["tlg_line_id"] = line_id
-                    except Exception:
-                        pass
+            _COMPACT_LINE_IDS.discard(line_id)
+    return line_id
+
+
+def _rebuild_tracking():
+    global _TRACKED_BY_LINE_ID
+    _TRACKED_BY_LINE_ID = {}
+    _TRACKED_BY_OBJECT_KEY.clear()
+    _COMPACT_LINE_IDS.clear()
+    for obj in _iter_possible_tlg_objects():
+        _track_object(obj)
 
-            if not role:
-                role = _infer_role(obj)
-                if role:
-                    try:
-                        obj["tlg_line_role"] = role
-                    except Exception:
-                        pass
-
-        if not line_id or not role:
-            continue
 
-        line_id = str(line_id)
-        roles_by_line_id.setdefault(line_id, set()).add(str(role))
-        objs_by_line_id.setdefault(line_id, []).append(obj)
+def _detect_deleted_line_ids():
+    """
+    Return {line_id: was_complete_trio} for lines that lost tracked objects since the last pass.
+
+    Deleted objects never show up in depsgraph.updates, so the tracked object keys are diffed
+    against the live ones. The diff only runs when the object count changed or an update named
+    an Object since the last pass: a delete + add in the same debounce window keeps the count
+    but the added object shows up in depsgraph.updates.
+    """
+    global _LAST_OBJECT_COUNT, _OBJECT_IDS_UPDATED
+    if not _TRACKED_BY_OBJECT_KEY:
+        return {}
+
+    try:
+        count = len(bpy.data.objects)
+    except Exception:
+        return {}
+    if count == _LAST_OBJECT_COUNT and not _OBJECT_IDS_UPDATED:
+        return {}
 
-    return roles_by_line_id, objs_by_line_id
+    try:
+        alive = {_object_key(obj) for obj in bpy.data.objects}
+    except Exception:
+        return {}
+    _LAST_OBJECT_COUNT = count
+    _OBJECT_IDS_UPDATED = False
+
+    dead_keys = [key for key in _TRACKED_BY_OBJECT_KEY.keys() if key not in alive]
+    affected = {}
+    for key in dead_keys:
+        line_id = _TRACKED_BY_OBJECT_KEY[key][0]
+        if line_id not in affected:
+            roles = _TRACKED_BY_LINE_ID.get(line_id) or {}
+            affected[line_id] = _is_complete_line(line_id, roles.keys())
+    for key in dead_keys:
+        _untrack_object_key(key)
+        _GEOMETRY_HASH_BY_OBJECT_KEY.pop(key, None)
+    return affected
+
+
+def _tracked_objects_for_line(line_id):
+    out = []
+    roles = (_TRACKED_BY_LINE_ID or {}).get(line_id) or {}
+    for keys in list(roles.values()):
+        for key in list(keys):
+            entry = _TRACKED_BY_OBJECT_KEY.get(key)
+            if entry is None:
+                continue
+            try:
+                obj = bpy.data.objects.get(entry[2])
+            except Exception:
+                obj = None
+            if obj is not None and _object_key(obj) == key:
+                out.append(obj)
+    return out
 
 
 def _remove_object_and_data(obj):
@@ -230,28 +345,11 @@ def _cleanup_empty_taxi_collections():
 def _find_curve_by_line_id(line_id: str):
     if not line_id:
         return None
-    try:
-        objects = getattr(bpy.data, "objects", None)
-    except Exception:
-        objects = None
-    if not objects:
-        return None
-    for obj in list(objects):
-        try:
-            if obj.type != "CURVE":
-                continue
-            if obj.get("tlg_line_id") != line_id:
-                continue
-            if obj.get("tlg_line_role") != "SRC":
-                continue
-            return obj
-        except Exception:
-            continue
-    return None
+    return registry.find_object(line_id, role="SRC", obj_type="CURVE")
 
 
 def _depsgraph_update_post(scene, depsgraph):
-    global _IS_SYNCING
+    global _IS_SYNCING, _OBJECT_IDS_UPDATED
     if _IS_SYNCING:
         return
 
@@ -265,9 +363,21 @@ def _depsgraph_update_post(scene, depsgraph):
 
     for update in list(updates):
         obj = getattr(update, "id", None)
+        if isinstance(obj, bpy.types.Object):
+            _OBJECT_IDS_UPDATED = True
         if obj is None or getattr(obj, "type", None) not in {"CURVE", "MESH"}:
             continue
 
+        # New, duplicated and renamed objects all show up here; keep the line-ID registry current.
+        registry.note_object(obj)
+        if _is_possible_tlg_object(obj):
+            try:
+                _TOUCHED_OBJECT_NAMES.add(obj.name)
+                if obj.type == "CURVE" and bool(getattr(update, "is_updated_geometry", False)):
+                    _GEOMETRY_CHANGED_CURVE_NAMES.add(obj.name)
+            except Exception:
+                pass
+
         try:
             last = obj.get("tlg_last_seen_name")
         except Exception:
@@ -286,11 +396,8 @@ def _depsgraph_update_post(scene, depsgraph):
             # Can't safely sync without knowing which line this belongs to.
             continue
 
-        ensure_taxi_preview(curve_obj)
-        try:
-            line_id = curve_obj.get("tlg_line_id")
-        except Exception:
-            line_id = None
+        # A rename only needs linkage metadata; leave the preview/handles alone.
+        line_id = tlg_ensure_line_metadata(curve_obj)
 
         # Stamp metadata onto the renamed mesh so future lookups are rename-safe.
         if obj.type == "MESH" and line_id:
@@ -335,78 +442,148 @@ def _depsgraph_update_post(scene, depsgraph):
     _queue_name_sync(base_by_line_id)
 
 
+def _sync_settings():
+    debounce_s = max(0.0, float(get_preference("sync_debounce_ms", 100.0))) / 1000.0
+    max_units = max(1, int(get_preference("sync_max_lines_per_tick", 64)))
+    max_s = max(0.0005, float(get_preference("sync_max_ms_per_tick", 4.0)) / 1000.0)
+    return debounce_s, max_units, max_s
+
+
+def _has_pending_work():
+    return bool(_PENDING_BY_LINE_ID or _TOUCHED_OBJECT_NAMES or _GEOMETRY_CHANGED_CURVE_NAMES)
+
+
 def _apply_pending_sync():
-    global _IS_SYNCING, _TIMER_ARMED, _PENDING_BY_LINE_ID, _LAST_ROLES_BY_LINE_ID
-    _TIMER_ARMED = False
+    """
+    Timer callback: one sync tick.
+
+    Waits until no depsgraph event arrived for the configured delay (so a transform drag is
+    synced once, after it ends), then processes at most N lines / X ms of queued work.
+    Anything left over stays queued and is handled on the following tick.
+    """
+    global _IS_SYNCING, _TIMER_ARMED
+
+    debounce_s, max_units, max_s = _sync_settings()
+    idle_s = time.perf_counter() - _LAST_QUEUED_AT
+    if idle_s < debounce_s:
+        return max(debounce_s - idle_s, 0.001)
 
-    pending = dict(_PENDING_BY_LINE_ID)
-    _PENDING_BY_LINE_ID.clear()
+    started = time.perf_counter()
+    units_left = max_units
+
+    def has_budget():
+        return units_left > 0 and (time.perf_counter() - started) < max_s
 
     _IS_SYNCING = True
     try:
         # Apply queued renames (if any).
-        for line_id, base in pending.items():
+        while _PENDING_BY_LINE_ID and has_budget():
+            line_id = next(iter(_PENDING_BY_LINE_ID))
+            base = _PENDING_BY_LINE_ID.pop(line_id)
+            units_left -= 1
             curve_obj = _find_curve_by_line_id(line_id)
             if curve_obj is None:
                 continue
             tlg_sync_linked_object_names(curve_obj, base)
 
-        # Sync-delete: if any one of the trio is deleted, delete the other two.
-        roles_by_line_id, objs_by_line_id = _build_line_state()
-        if _LAST_ROLES_BY_LINE_ID is None:
-            _LAST_ROLES_BY_LINE_ID = {k: set(v) for k, v in roles_by_line_id.items()}
-            return None
-
-        deleted_any = False
-        required = {"SRC", "MESH", "BASE"}
-        for line_id, prev_roles in list(_LAST_ROLES_BY_LINE_ID.items()):
-            if not prev_roles or not required.issubset(prev_roles):
-                continue
-
-            cur_roles = roles_by_line_id.get(line_id, set())
-            if not cur_roles:
-                continue
-            if required.issubset(cur_roles):
-                continue
+        while _GEOMETRY_CHANGED_CURVE_NAMES and has_budget():
+            _refresh_changed_preview(_GEOMETRY_CHANGED_CURVE_NAMES.pop())
+            units_left -= 1
 
-            for obj in list(objs_by_line_id.get(line_id, [])):
-                _remove_object_and_data(obj)
-            deleted_any = True
+        if _TRACKED_BY_LINE_ID is None:
+            # The baseline scan covers every touched object as well.
+            _rebuild_tracking()
+            _TOUCHED_OBJECT_NAMES.clear()
+        else:
+            deleted = _detect_deleted_line_ids()
 
-        if deleted_any:
-            roles_by_line_id, _objs_by_line_id = _build_line_state()
-            _cleanup_empty_taxi_collections()
+            # Only objects reported by the depsgraph are re-read (new, duplicated or renamed ones).
+            while _TOUCHED_OBJECT_NAMES and has_budget():
+                name = _TOUCHED_OBJECT_NAMES.pop()
+                units_left -= 1
+                try:
+                    obj = bpy.data.objects.get(name)
+                except Exception:
+                    obj = None
+                if obj is not None:
+                    _track_object(obj)
+
+            # Sync-delete: if any one of the trio is deleted, delete the other two.
+            deleted_any = False
+            for line_id, was_complete in deleted.items():
+                if not was_complete:
+                    continue
+                roles = (_TRACKED_BY_LINE_ID.get(line_id) or {}).keys()
+                if not roles or _is_complete_line(line_id, roles):
+                    continue
+                for obj in _tracked_objects_for_line(line_id):
+                    _remove_object_and_data(obj)
+                deleted_any = True
 
-        _LAST_ROLES_BY_LINE_ID = {k: set(v) for k, v in roles_by_line_id.items()}
+            if deleted_any:
+                _cleanup_empty_taxi_collections()
+                _detect_deleted_line_ids()
+    except Exception:
+        _TIMER_ARMED = False
+        raise
     finally:
         _IS_SYNCING = False
 
-    # If more were queued during application, schedule another pass.
-    if _PENDING_BY_LINE_ID:
-        _queue_name_sync({})
+    # Spill leftover work (or anything queued while applying) over to the next tick.
+    if _has_pending_work():
+        return 0.0
+    _TIMER_ARMED = False
     return None
 
 
 def _queue_name_sync(base_by_line_id):
-    global _PENDING_BY_LINE_ID, _TIMER_ARMED
+    global _PENDING_BY_LINE_ID, _TIMER_ARMED, _LAST_QUEUED_AT
     for line_id, base in (base_by_line_id or {}).items():
         if not line_id or not base:
             continue
         _PENDING_BY_LINE_ID[str(line_id)] = base
 
-    if _TIMER_ARMED:
+    _LAST_QUEUED_AT = time.perf_counter()
+    # Non-persistent timers are dropped on file load, so double-check the flag.
+    if _TIMER_ARMED and bpy.app.timers.is_registered(_apply_pending_sync):
         return
     _TIMER_ARMED = True
     try:
-        bpy.app.timers.register(_apply_pending_sync, first_interval=0.0)
+        bpy.app.timers.register(_apply_pending_sync, first_interval=_sync_settings()[0])
     except Exception:
         _TIMER_ARMED = False
 
 
+@persistent
+def _reset_tracking(*_args):
+    # Undo/load swap the whole object set; re-baseline on the next pass instead of
+    # mistaking restored or vanished objects for user deletions.
+    global _TRACKED_BY_LINE_ID, _LAST_OBJECT_COUNT
+    _TRACKED_BY_LINE_ID = None
+    _LAST_OBJECT_COUNT = -1
+    _TRACKED_BY_OBJECT_KEY.clear()
+    _COMPACT_LINE_IDS.clear()
+    _TOUCHED_OBJECT_NAMES.clear()
+    _GEOMETRY_CHANGED_CURVE_NAMES.clear()
+    _GEOMETRY_HASH_BY_OBJECT_KEY.clear()
+
+
+def invalidate_tracking():
+    """Re-baseline trio tracking on the next sync pass (after bulk structural changes such as storage migration)."""
+    _reset_tracking()
+
+
+_RESET_HANDLER_LISTS = ("load_post", "undo_post", "redo_post")
+
+
 def register_handlers():
     handlers = bpy.app.handlers.depsgraph_update_post
     if _depsgraph_update_post not in handlers:
         handlers.append(_depsgraph_update_post)
+    for list_name in _RESET_HANDLER_LISTS:
+        handlers = getattr(bpy.app.handlers, list_name, None)
+        if handlers is not None and _reset_tracking not in handlers:
+            handlers.append(_reset_tracking)
 
 
 def unregister_handlers():
@@ -415,3 +592,12 @@ def unregister_handlers():
         handlers.remove(_depsgraph_update_post)
     except ValueError:
         pass
+    for list_name in _RESET_HANDLER_LISTS:
+        handlers = getattr(bpy.app.handlers, list_name, None)
+        if handlers is None:
+            continue
+        try:
+            handlers.remove(_reset_tracking)
+        except ValueError:
+            pass
+    _reset_tracking()
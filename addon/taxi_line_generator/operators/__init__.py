@@ -1,4 +1,6 @@
+from .apply_line_settings import TAXILINES_OT_apply_line_settings
 from .bake_export_mesh import TAXILINES_OT_bake_export_mesh
+from .compact_edit_storage import TAXILINES_OT_compact_edit_storage
 from .debug_info import TAXILINES_OT_debug_active
 from .draw_line_modal import TAXILINES_OT_draw_taxi_line
 from .edit_path import TAXILINES_OT_edit_path, TAXILINES_OT_finish_editing
@@ -6,8 +8,10 @@ from .insert_point import TAXILINES_OT_insert_point_at_mouse
 from .normalize_curve import TAXILINES_OT_normalize_curve
 from .recompute_handles import TAXILINES_OT_recompute_handles
 from .resume_line_modal import TAXILINES_OT_resume_taxi_line
+from .upgrade_file import TAXILINES_OT_upgrade_file
 
 __all__ = (
+    "TAXILINES_OT_apply_line_settings",
     "TAXILINES_OT_draw_taxi_line",
     "TAXILINES_OT_bake_export_mesh",
     "TAXILINES_OT_debug_active",
@@ -17,4 +21,6 @@ __all__ = (
     "TAXILINES_OT_normalize_curve",
     "TAXILINES_OT_recompute_handles",
     "TAXILINES_OT_resume_taxi_line",
+    "TAXILINES_OT_upgrade_file",
+    "TAXILINES_OT_compact_edit_storage",
 )
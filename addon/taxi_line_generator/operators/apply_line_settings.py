@@ -0,0 +1,63 @@
+import bpy  # pyright: ignore[reportMissingImports]
+
+from ..properties import get_source_curve_for_mesh, is_taxi_curve, tlg_apply_preview_batch
+
+_SETTINGS = (
+    "tlg_line_width",
+    "tlg_segments_mult",
+    "tlg_uv_u_m_per_tile",
+    "tlg_uv_v_m_per_tile",
+    "tlg_auto_smooth_handles",
+)
+
+
+def _resolve_curve(obj):
+    if obj is None:
+        return None
+    if obj.type == "MESH":
+        obj = get_source_curve_for_mesh(obj)
+    if obj is not None and is_taxi_curve(obj):
+        return obj
+    return None
+
+
+class TAXILINES_OT_apply_line_settings(bpy.types.Operator):
+    bl_idname = "taxilines.apply_line_settings"
+    bl_label = "Apply Line Settings to Selected"
+    bl_description = (
+        "Copy width, segment and UV settings from the active taxi line to all selected lines "
+        "and refresh their previews in one pass"
+    )
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        source = _resolve_curve(context.view_layer.objects.active)
+        if source is None:
+            self.report({"ERROR"}, "Active object must be a Taxi Line curve (or its export mesh).")
+            return {"CANCELLED"}
+
+        targets = []
+        seen = {source.name}
+        for obj in context.selected_objects:
+            curve_obj = _resolve_curve(obj)
+            if curve_obj is None or curve_obj.name in seen:
+                continue
+            seen.add(curve_obj.name)
+            targets.append(curve_obj)
+        if not targets:
+            self.report({"WARNING"}, "Select other Taxi Line curves to apply the settings to.")
+            return {"CANCELLED"}
+
+        values = {name: getattr(source, name) for name in _SETTINGS}
+        for curve_obj in targets:
+            for name, value in values.items():
+                # Property updates only queue a deferred refresh; the batch below does the work.
+                if getattr(curve_obj, name) != value:
+                    setattr(curve_obj, name, value)
+
+        count, elapsed_ms = tlg_apply_preview_batch(targets, context=context)
+        self.report(
+            {"INFO"},
+            f"Applied settings to {len(targets)} line(s); refreshed {count} in {elapsed_ms:.1f} ms.",
+        )
+        return {"FINISHED"}
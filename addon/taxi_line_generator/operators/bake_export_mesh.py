@@ -1,9 +1,13 @@
 import bpy  # pyright: ignore[reportMissingImports]
 
+from .. import registry
+from ..preferences import get_preference
+from ..ribbon_mesh import build_ribbon_mesh
 from ..properties import (
     ensure_taxi_preview,
     get_baked_collection,
     get_baked_mesh_for_curve,
+    tlg_link_objects,
     tlg_parse_base_name,
     is_taxi_curve,
 )
@@ -93,6 +97,8 @@ def _find_or_create_baked_obj(context, curve_obj, baked_col):
     if line_id:
         baked_obj["tlg_line_id"] = line_id
         baked_obj["tlg_line_role"] = "MESH"
+    registry.note_object(baked_obj)
+    tlg_link_objects(curve_obj, export_obj=baked_obj)
     return baked_obj
 
 
@@ -120,32 +126,40 @@ class TAXILINES_OT_bake_export_mesh(bpy.types.Operator):
             return {"CANCELLED"}
 
         baked_col = get_baked_collection(context.scene)
-        depsgraph = context.evaluated_depsgraph_get()
+        use_native = bool(get_preference("use_native_mesher", True, context))
+        depsgraph = None
 
         baked_count = 0
         last_baked_obj = None
         for curve_obj in curves:
-            ensure_taxi_preview(curve_obj, context=context)
+            # The native mesher reads the curve data directly, so skip the per-line view layer
+            # update; only the GN fallback needs an evaluated depsgraph.
+            ensure_taxi_preview(curve_obj, context=None if use_native else context)
 
             baked_obj = _find_or_create_baked_obj(context, curve_obj, baked_col)
 
-            overlay_before = bool(getattr(curve_obj, "tlg_show_curve_overlay", True))
-            try:
-                curve_obj.tlg_show_curve_overlay = False
-            except Exception:
-                overlay_before = None
-
-            try:
-                eval_obj = curve_obj.evaluated_get(depsgraph)
-                new_mesh = bpy.data.meshes.new_from_object(
-                    eval_obj, preserve_all_data_layers=True, depsgraph=depsgraph
-                )
-            finally:
-                if overlay_before is not None:
-                    try:
-                        curve_obj.tlg_show_curve_overlay = overlay_before
-                    except Exception:
-                        pass
+            new_mesh = build_ribbon_mesh(curve_obj, name=baked_obj.name) if use_native else None
+            if new_mesh is None:
+                if depsgraph is None:
+                    depsgraph = context.evaluated_depsgraph_get()
+
+                overlay_before = bool(getattr(curve_obj, "tlg_show_curve_overlay", True))
+                try:
+                    curve_obj.tlg_show_curve_overlay = False
+                except Exception:
+                    overlay_before = None
+
+                try:
+                    eval_obj = curve_obj.evaluated_get(depsgraph)
+                    new_mesh = bpy.data.meshes.new_from_object(
+                        eval_obj, preserve_all_data_layers=True, depsgraph=depsgraph
+                    )
+                finally:
+                    if overlay_before is not None:
+                        try:
+                            curve_obj.tlg_show_curve_overlay = overlay_before
+                        except Exception:
+                            pass
 
             _replace_mesh_data(baked_obj, new_mesh)
             baked_obj.matrix_world = curve_obj.matrix_world
@@ -156,6 +170,8 @@ class TAXILINES_OT_bake_export_mesh(bpy.types.Operator):
                 baked_obj["tlg_line_role"] = "MESH"
             except Exception:
                 pass
+            registry.note_object(baked_obj)
+            tlg_link_objects(curve_obj, export_obj=baked_obj)
 
             _copy_material_slots_from_curve(curve_obj, baked_obj.data)
 
@@ -0,0 +1,109 @@
+import bpy  # pyright: ignore[reportMissingImports]
+
+from .. import registry
+from ..mesh_deltas import (
+    STORAGE_COMPACT,
+    capture_ribbon_edits,
+    edit_deltas,
+    set_edit_storage,
+    store_compact_deltas,
+    store_ribbon_edits,
+    uses_compact_storage,
+)
+from ..name_sync import invalidate_tracking
+from ..properties import get_base_mesh_for_curve, get_baked_mesh_for_curve, is_taxi_curve
+
+
+def _remove_base_object(base_obj):
+    mesh = getattr(base_obj, "data", None)
+    try:
+        bpy.data.objects.remove(base_obj, do_unlink=True)
+    except Exception:
+        return False
+    try:
+        if mesh is not None and mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+    except Exception:
+        pass
+    return True
+
+
+def convert_to_compact_storage(curve_objs=None):
+    """
+    Move lines from a hidden _BASE duplicate to compact delta storage on their export mesh.
+
+    Returns a dict of counts. Lines whose export/base vertex counts no longer match (their deltas
+    can't be computed) or whose deltas can't be stored keep their _BASE and are reported as skipped.
+    """
+    if curve_objs is None:
+        curve_objs = [obj for obj in bpy.data.objects if obj.type == "CURVE" and is_taxi_curve(obj)]
+
+    stats = {"converted": 0, "skipped": 0, "removed": 0}
+    for curve_obj in curve_objs:
+        if uses_compact_storage(curve_obj):
+            continue
+        export_obj = get_baked_mesh_for_curve(curve_obj)
+        base_obj = get_base_mesh_for_curve(curve_obj)
+        if base_obj is not None:
+            deltas = None
+            if export_obj is not None:
+                try:
+                    deltas = edit_deltas(export_obj.data, base_obj.data)
+                except Exception:
+                    deltas = None
+            if deltas is None:
+                stats["skipped"] += 1
+                continue
+            # The curve may have changed since _BASE was built, so no fingerprint: the next
+            # regeneration reconstructs the old base as export - deltas.
+            try:
+                store_compact_deltas(export_obj, deltas, "")
+            except Exception:
+                # Nothing was stored, so the _BASE is still the only record of the edits.
+                stats["skipped"] += 1
+                continue
+            try:
+                ribbon_edits = capture_ribbon_edits(export_obj.data, base_obj.data)
+            except Exception:
+                ribbon_edits = None
+            if ribbon_edits is not None:
+                store_ribbon_edits(curve_obj, *ribbon_edits)
+            if _remove_base_object(base_obj):
+                stats["removed"] += 1
+        set_edit_storage(curve_obj, STORAGE_COMPACT)
+        stats["converted"] += 1
+
+    registry.invalidate()
+    # Deleting _BASE objects must not look like a user deleting one third of a trio.
+    invalidate_tracking()
+    return stats
+
+
+class TAXILINES_OT_compact_edit_storage(bpy.types.Operator):
+    bl_idname = "taxilines.compact_edit_storage"
+    bl_label = "Convert Lines to Compact Storage"
+    bl_description = (
+        "Replace every line's hidden _BASE mesh with compact edit deltas stored on its export mesh "
+        "(smaller files and faster undo)"
+    )
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        if context.mode != "OBJECT":
+            self.report({"ERROR"}, "Switch to Object Mode to convert the edit storage.")
+            return {"CANCELLED"}
+
+        stats = convert_to_compact_storage()
+        level = {"WARNING"} if stats["skipped"] else {"INFO"}
+        self.report(
+            level,
+            (
+                f"Converted {stats['converted']} line(s) to compact storage, removed {stats['removed']} base mesh(es)"
+                + (
+                    f", skipped {stats['skipped']} (vertex counts differ or the deltas could not be stored)."
+                    if stats["skipped"]
+                    else "."
+                )
+            ),
+        )
+        return {"FINISHED"}
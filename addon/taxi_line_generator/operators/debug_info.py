@@ -1,35 +1,7 @@
 import bpy  # pyright: ignore[reportMissingImports]
 
 from ..properties import get_baked_mesh_for_curve, is_taxi_curve
-
-
-def _uv_bbox(mesh, uv_layer):
-    if mesh is None or uv_layer is None:
-        return None
-    data = getattr(uv_layer, "data", None)
-    if not data:
-        return None
-    min_u = 1e30
-    min_v = 1e30
-    max_u = -1e30
-    max_v = -1e30
-    for uv in data:
-        try:
-            u = float(uv.uv.x)
-            v = float(uv.uv.y)
-        except Exception:
-            continue
-        if u < min_u:
-            min_u = u
-        if v < min_v:
-            min_v = v
-        if u > max_u:
-            max_u = u
-        if v > max_v:
-            max_v = v
-    if min_u > max_u or min_v > max_v:
-        return None
-    return (min_u, min_v, max_u, max_v)
+from ..uv_utils import uv_layer_bbox
 
 
 def _append_mesh_uv_debug(lines, mesh_obj, label):
@@ -59,7 +31,7 @@ def _append_mesh_uv_debug(lines, mesh_obj, label):
             name = "?"
         bbox = None
         try:
-            bbox = _uv_bbox(mesh, uv_layer)
+            bbox = uv_layer_bbox(uv_layer)
         except Exception:
             bbox = None
         if bbox is None:
@@ -1,8 +1,11 @@
 import bpy
 from bpy_extras import view3d_utils
+from mathutils import Matrix
 
+from ..point_preview import PointPreview
+from ..preferences import get_preference
 from ..properties import ensure_taxi_preview, get_taxi_curves_collection
-from ..curve_utils import apply_taxi_handles_to_spline
+from ..curve_utils import apply_taxi_handles_to_spline_window, extend_bezier_spline, remove_bezier_end_point
 
 
 def _set_point_handles_smooth(_bp):
@@ -43,6 +46,10 @@ class TAXILINES_OT_draw_taxi_line(bpy.types.Operator):
     _curve_obj = None
     _spline_index = 0
     _has_first_point = False
+    # The curve stays in Object Mode while drawing; clicks are buffered here (curve-local) and
+    # shown by the overlay until _commit_pending writes them.
+    _pending = None
+    _preview = None
 
     def _set_ui_state(self, context, *, active):
         wm = getattr(context, "window_manager", None)
@@ -77,6 +84,42 @@ class TAXILINES_OT_draw_taxi_line(bpy.types.Operator):
         except Exception:
             pass
 
+    def _get_spline(self):
+        curve_data = self._curve_obj.data if self._curve_obj is not None else None
+        if curve_data is None or len(curve_data.splines) <= self._spline_index:
+            return None
+        return curve_data.splines[self._spline_index]
+
+    def _commit_pending(self, context):
+        """Write all buffered points with one bulk insert and one local handle solve (no mode switch)."""
+        if not self._pending:
+            return
+        if self._curve_obj.mode != "OBJECT":
+            self._safe_mode_set(context, self._curve_obj, "OBJECT")
+        spline = self._get_spline()
+        if spline is not None:
+            try:
+                extend_bezier_spline(spline, self._pending)
+                self._curve_obj.data.update_tag()
+                self._curve_obj.update_tag()
+                self._preview.set_anchor(self._curve_obj.matrix_world @ spline.bezier_points[-1].co)
+            except Exception:
+                pass
+        self._pending.clear()
+        self._preview.clear()
+
+    def _finish(self, context, commit=True):
+        if commit and self._curve_obj is not None and self._curve_obj.data is not None:
+            self._commit_pending(context)
+        if self._preview is not None:
+            self._preview.stop()
+            self._preview = None
+        self._pending = None
+        self._set_ui_state(context, active=False)
+
+    def cancel(self, context):
+        self._finish(context, commit=False)
+
     def invoke(self, context, event):
         if context.area.type != "VIEW_3D":
             self.report({"ERROR"}, "Run this in the 3D View.")
@@ -132,9 +175,9 @@ class TAXILINES_OT_draw_taxi_line(bpy.types.Operator):
 
         self._curve_obj = curve_obj
         self._has_first_point = False
-
-        # Keep the curve in Edit Mode so control points are visible while drawing and after finishing.
-        self._safe_mode_set(context, curve_obj, "EDIT")
+        self._pending = []
+        self._preview = PointPreview()
+        self._preview.start()
 
         context.window_manager.modal_handler_add(self)
         return {"RUNNING_MODAL"}
@@ -173,14 +216,13 @@ class TAXILINES_OT_draw_taxi_line(bpy.types.Operator):
         if event.alt and event.type == "RIGHTMOUSE":
             return {"PASS_THROUGH"}
 
-        # Finish (Right Click / Esc)
-        if event.type in {"RIGHTMOUSE", "ESC"} and event.value == "PRESS":
+        # Finish (Right Click / Esc / Enter): write the buffered points.
+        if event.type in {"RIGHTMOUSE", "ESC", "RET", "NUMPAD_ENTER"} and event.value == "PRESS":
+            self._finish(context)
             if self._curve_obj:
                 context.view_layer.objects.active = self._curve_obj
                 self._curve_obj.select_set(True)
                 self._safe_mode_set(context, self._curve_obj, "OBJECT")
-
-            self._set_ui_state(context, active=False)
             return {"FINISHED"}
 
         # Undo last placed point (keep drawing).
@@ -190,67 +232,42 @@ class TAXILINES_OT_draw_taxi_line(bpy.types.Operator):
             if not self._curve_obj or not self._curve_obj.data:
                 return {"RUNNING_MODAL"}
 
-            spline = None
-            if len(self._curve_obj.data.splines) > self._spline_index:
-                spline = self._curve_obj.data.splines[self._spline_index]
+            # Buffered points are only dropped from the buffer.
+            if self._pending:
+                self._pending.pop()
+                self._preview.pop()
+                context.area.tag_redraw()
+                return {"RUNNING_MODAL"}
+
+            spline = self._get_spline()
             if spline is None or spline.type != "BEZIER":
                 return {"RUNNING_MODAL"}
 
-            points = spline.bezier_points
-            if len(points) <= 1:
+            if len(spline.bezier_points) <= 1:
                 # Don't remove the first point/origin anchor.
                 return {"RUNNING_MODAL"}
 
-            # Delete via operator in Edit Mode (RNA collections don't reliably support point removal).
-            self._safe_mode_set(context, self._curve_obj, "EDIT")
+            # The modal stays in Object Mode: truncate with bulk copies and re-solve the handles
+            # next to the removed end.
+            if self._curve_obj.mode != "OBJECT":
+                self._safe_mode_set(context, self._curve_obj, "OBJECT")
             try:
-                for bp in points:
-                    bp.select_control_point = False
-                    if hasattr(bp, "select_left_handle"):
-                        bp.select_left_handle = False
-                    if hasattr(bp, "select_right_handle"):
-                        bp.select_right_handle = False
-
-                points[-1].select_control_point = True
-                with context.temp_override(
-                    object=self._curve_obj,
-                    active_object=self._curve_obj,
-                    selected_objects=[self._curve_obj],
-                    selected_editable_objects=[self._curve_obj],
-                ):
-                    bpy.ops.curve.delete(type="VERT")
+                spline = remove_bezier_end_point(self._curve_obj.data, self._spline_index)
             except Exception:
-                # If delete fails for any reason, keep drawing without crashing.
+                spline = None
+            if spline is None or not len(spline.bezier_points):
                 return {"RUNNING_MODAL"}
-
-            # Recompute handles on the remaining points.
-            self._safe_mode_set(context, self._curve_obj, "OBJECT")
-            apply_taxi_handles_to_spline(spline)
+            apply_taxi_handles_to_spline_window(spline, len(spline.bezier_points) - 1)
 
             self._curve_obj.data.update_tag()
             self._curve_obj.update_tag()
-            self._safe_mode_set(context, self._curve_obj, "EDIT")
+            self._preview.set_anchor(self._curve_obj.matrix_world @ spline.bezier_points[-1].co)
             context.area.tag_redraw()
             return {"RUNNING_MODAL"}
 
-        # Finish (Enter)
-        if event.type in {"RET", "NUMPAD_ENTER"} and event.value == "PRESS":
-            if self._curve_obj:
-                context.view_layer.objects.active = self._curve_obj
-                self._curve_obj.select_set(True)
-                self._safe_mode_set(context, self._curve_obj, "OBJECT")
-
-            self._set_ui_state(context, active=False)
-            return {"FINISHED"}
-
-        # Add point (Left Click)
+        # Add point (Left Click). Only the first click touches the curve (it places the origin);
+        # the rest are buffered and written on finish or every N points.
         if event.type == "LEFTMOUSE" and event.value == "PRESS":
-            # We mutate curve data directly. If we're currently in Edit Mode, Blender keeps an
-            # internal edit cache that won't reflect these changes until we leave/re-enter Edit Mode.
-            # Toggling ensures all created points are visible while drawing.
-            if self._curve_obj:
-                self._safe_mode_set(context, self._curve_obj, "OBJECT")
-
             origin, direction = _get_mouse_ray(context, event)
             hit = _intersect_ray_with_plane(origin, direction, plane_z=0.0)
 
@@ -258,39 +275,34 @@ class TAXILINES_OT_draw_taxi_line(bpy.types.Operator):
                 self.report({"WARNING"}, "Could not place point.")
                 return {"RUNNING_MODAL"}
 
-            spline = None
-            if self._curve_obj and self._curve_obj.data and len(self._curve_obj.data.splines) > self._spline_index:
-                spline = self._curve_obj.data.splines[self._spline_index]
+            spline = self._get_spline() if self._curve_obj else None
             if spline is None:
-                self._set_ui_state(context, active=False)
+                self._finish(context, commit=False)
                 return {"CANCELLED"}
 
-            points = spline.bezier_points
-            if len(points) == 0:
-                spline.bezier_points.add(count=1)
-                points = spline.bezier_points
-
             # First point: set object origin to the first click, store point at local (0,0,0)
             if not self._has_first_point:
-                self._curve_obj.location = hit
+                points = spline.bezier_points
+                if len(points) == 0:
+                    spline.bezier_points.add(count=1)
+                    points = spline.bezier_points
 
+                # matrix_world (not location) so the next clicks see the new origin right away.
+                self._curve_obj.matrix_world = Matrix.Translation(hit)
                 points[0].co = (0.0, 0.0, 0.0)
                 self._has_first_point = True
+                self._curve_obj.data.update_tag()
+                self._curve_obj.update_tag()
+                self._preview.set_anchor(hit)
 
             # Add new point
             else:
-                spline.bezier_points.add(count=1)
-
-                new_pt = spline.bezier_points[-1]
-                local_hit = self._curve_obj.matrix_world.inverted() @ hit
-                new_pt.co = local_hit
+                self._pending.append(self._curve_obj.matrix_world.inverted() @ hit)
+                self._preview.push(hit)
 
-            apply_taxi_handles_to_spline(spline)
-
-            if self._curve_obj:
-                self._curve_obj.data.update_tag()
-                self._curve_obj.update_tag()
-                self._safe_mode_set(context, self._curve_obj, "EDIT")
+                interval = int(get_preference("draw_commit_interval", 0, context))
+                if interval > 0 and len(self._pending) >= interval:
+                    self._commit_pending(context)
 
             context.area.tag_redraw()
             return {"RUNNING_MODAL"}
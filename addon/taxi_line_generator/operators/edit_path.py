@@ -1,12 +1,45 @@
+import time
+
 import bpy
 import bmesh
 
+from .. import registry
+from ..preferences import get_preference
+from ..mesh_deltas import (
+    STORAGE_COMPACT,
+    STORAGE_FULL,
+    apply_edit_deltas,
+    apply_ribbon_edits,
+    base_mesh_from_deltas,
+    capture_ribbon_edits,
+    compact_deltas_fingerprint,
+    edit_deltas,
+    load_compact_deltas,
+    load_ribbon_edits,
+    set_edit_storage,
+    store_compact_deltas,
+    store_ribbon_edits,
+    uses_compact_storage,
+)
+from ..ribbon_mesh import build_ribbon_mesh
+from ..uv_utils import (
+    copy_uv_layer_by_index,
+    fit_uv_to_bbox,
+    repeat_uv_u_by_face,
+    strip_unwrap,
+    uv_bbox,
+    uv_segment_axis_from_bbox,
+)
 from ..properties import (
     ensure_taxi_preview,
     get_base_mesh_for_curve,
     get_baked_mesh_for_curve,
     get_source_curve_for_mesh,
     tlg_parse_base_name,
+    tlg_file_is_upgraded,
+    tlg_ensure_line_metadata,
+    tlg_link_objects,
+    tlg_preview_fingerprint,
     tlg_sync_linked_object_names,
     get_taxi_curves_collection,
     get_taxi_export_collection,
@@ -72,12 +105,11 @@ def _iter_target_curves(context):
             curve_obj = obj
         elif getattr(obj, "type", None) == "MESH":
             curve_obj = _get_source_curve_from_mesh(obj)
-            # If the user renamed the export mesh (or base) manually, treat that as authoritative
-            # and sync the linked trio right away (prevents Edit Curve from "reverting" the mesh name).
+            # Stamp linkage metadata on the selected mesh. A manual rename of the export mesh is
+            # picked up as authoritative by _ensure_export_and_base_mesh_objs (single rename pass).
             if curve_obj is not None:
                 try:
-                    ensure_taxi_preview(curve_obj, context=context)
-                    line_id = curve_obj.get("tlg_line_id")
+                    line_id = tlg_ensure_line_metadata(curve_obj)
                     if line_id:
                         try:
                             obj["tlg_line_id"] = line_id
@@ -102,10 +134,6 @@ def _iter_target_curves(context):
                             obj["tlg_line_role"] = role
                         except Exception:
                             pass
-
-                    base = tlg_parse_base_name(getattr(obj, "name", "") or "")
-                    if base:
-                        tlg_sync_linked_object_names(curve_obj, base)
                 except Exception:
                     pass
 
@@ -155,8 +183,9 @@ def _unlink_obj_from_collection_by_name(obj, names):
 
 
 def _ensure_export_and_base_mesh_objs(context, curve_obj):
-    # Ensure this curve has persistent linkage metadata (safe under renames).
-    ensure_taxi_preview(curve_obj, context=context)
+    # Ensure this curve has persistent linkage metadata (safe under renames). No per-line
+    # view layer update: the depsgraph is evaluated once when meshes are generated.
+    ensure_taxi_preview(curve_obj)
 
     scene = getattr(context, "scene", None)
     export_col = get_taxi_export_collection(scene)
@@ -184,6 +213,7 @@ def _ensure_export_and_base_mesh_objs(context, curve_obj):
         export_obj["tlg_source_curve"] = curve_obj.name
         export_obj["tlg_line_id"] = curve_obj.get("tlg_line_id")
         export_obj["tlg_line_role"] = "MESH"
+        registry.note_object(export_obj)
         _link_obj_to_collection(export_obj, export_col)
     else:
         _link_obj_to_collection(export_obj, export_col)
@@ -196,48 +226,61 @@ def _ensure_export_and_base_mesh_objs(context, curve_obj):
             export_obj["tlg_line_role"] = "MESH"
         except Exception:
             pass
+        registry.note_object(export_obj)
 
     base_obj = get_base_mesh_for_curve(curve_obj)
-    try:
-        if base_obj is not None:
-            base_from_base = tlg_parse_base_name(base_obj.name)
-            if base_from_base:
-                curve_obj["tlg_line_name"] = base_from_base
-    except Exception:
-        pass
-    if base_obj is None:
-        base = curve_obj.get("tlg_line_name") or tlg_parse_base_name(curve_obj.name)
-        name = f"{base}_BASE"
-        mesh = bpy.data.meshes.new(name)
-        base_obj = bpy.data.objects.new(name, mesh)
-        curve_obj["tlg_base_mesh"] = base_obj.name
-        base_obj["tlg_source_curve"] = curve_obj.name
-        base_obj["tlg_line_id"] = curve_obj.get("tlg_line_id")
-        base_obj["tlg_line_role"] = "BASE"
-        _link_obj_to_collection(base_obj, internal_col)
+    # Lines without a _BASE (new or baked-only) follow the storage preference.
+    if base_obj is None and get_preference("edit_storage_mode", STORAGE_FULL, context) == STORAGE_COMPACT:
+        set_edit_storage(curve_obj, STORAGE_COMPACT)
+    if uses_compact_storage(curve_obj):
+        base_obj = None
     else:
-        _link_obj_to_collection(base_obj, internal_col)
         try:
-            base_obj["tlg_source_curve"] = curve_obj.name
+            if base_obj is not None:
+                base_from_base = tlg_parse_base_name(base_obj.name)
+                if base_from_base:
+                    curve_obj["tlg_line_name"] = base_from_base
         except Exception:
             pass
-        try:
+        if base_obj is None:
+            base = curve_obj.get("tlg_line_name") or tlg_parse_base_name(curve_obj.name)
+            name = f"{base}_BASE"
+            mesh = bpy.data.meshes.new(name)
+            base_obj = bpy.data.objects.new(name, mesh)
+            curve_obj["tlg_base_mesh"] = base_obj.name
+            base_obj["tlg_source_curve"] = curve_obj.name
             base_obj["tlg_line_id"] = curve_obj.get("tlg_line_id")
             base_obj["tlg_line_role"] = "BASE"
-        except Exception:
-            pass
+            registry.note_object(base_obj)
+            _link_obj_to_collection(base_obj, internal_col)
+        else:
+            _link_obj_to_collection(base_obj, internal_col)
+            try:
+                base_obj["tlg_source_curve"] = curve_obj.name
+            except Exception:
+                pass
+            try:
+                base_obj["tlg_line_id"] = curve_obj.get("tlg_line_id")
+                base_obj["tlg_line_role"] = "BASE"
+            except Exception:
+                pass
+            registry.note_object(base_obj)
+
+    tlg_link_objects(curve_obj, export_obj=export_obj, base_obj=base_obj)
 
     # Migrate out of legacy add-on collections if present (keeps Outliner tidy).
-    _unlink_obj_from_collection_by_name(curve_obj, {"TAXI_LINES"})
-    _unlink_obj_from_collection_by_name(export_obj, {"TLG_Baked"})
+    if not tlg_file_is_upgraded():
+        _unlink_obj_from_collection_by_name(curve_obj, {"TAXI_LINES"})
+        _unlink_obj_from_collection_by_name(export_obj, {"TLG_Baked"})
 
     # Base mesh is internal: never selectable/visible.
-    try:
-        base_obj.hide_viewport = True
-        base_obj.hide_select = True
-        base_obj.hide_render = True
-    except Exception:
-        pass
+    if base_obj is not None:
+        try:
+            base_obj.hide_viewport = True
+            base_obj.hide_select = True
+            base_obj.hide_render = True
+        except Exception:
+            pass
 
     # Normalize names to <BASE>_SRC / <BASE>_MESH / <BASE>_BASE (no "_SRC_" in mesh/base).
     try:
@@ -261,46 +304,74 @@ def _replace_mesh_data(obj, new_mesh):
             pass
 
 
-def _mesh_new_from_curve(context, curve_obj):
-    depsgraph = context.evaluated_depsgraph_get()
-    eval_obj = curve_obj.evaluated_get(depsgraph)
-    return bpy.data.meshes.new_from_object(eval_obj, preserve_all_data_layers=True, depsgraph=depsgraph)
-
-
-def _uv_bbox(mesh, uv_layer_name="UVMap"):
+def _remove_mesh(mesh):
     if mesh is None:
-        return None
-    uv_layer = None
+        return
     try:
-        uv_layer = mesh.uv_layers.get(uv_layer_name) if hasattr(mesh, "uv_layers") else None
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
     except Exception:
-        uv_layer = None
-    if uv_layer is None:
-        return None
-    data = getattr(uv_layer, "data", None)
-    if not data:
+        pass
+
+
+def _compact_old_base_mesh(context, curve_obj, export_obj):
+    """
+    Temporary stand-in for the _BASE mesh of a compact-storage line. Regenerated from the curve
+    while it still matches the stored deltas, otherwise the export mesh minus those deltas.
+    """
+    export_mesh = getattr(export_obj, "data", None)
+    if export_mesh is None or not len(export_mesh.vertices):
         return None
-    min_u = 1e30
-    min_v = 1e30
-    max_u = -1e30
-    max_v = -1e30
-    for uv in data:
+    fingerprint = tlg_preview_fingerprint(curve_obj)
+    if (
+        fingerprint
+        and fingerprint == compact_deltas_fingerprint(export_obj)
+        and getattr(curve_obj, "mode", "OBJECT") != "EDIT"
+    ):
         try:
-            u = float(uv.uv.x)
-            v = float(uv.uv.y)
+            mesh = _mesh_new_from_curve(context, curve_obj)
         except Exception:
-            continue
-        if u < min_u:
-            min_u = u
-        if v < min_v:
-            min_v = v
-        if u > max_u:
-            max_u = u
-        if v > max_v:
-            max_v = v
-    if min_u > max_u or min_v > max_v:
-        return None
-    return (min_u, min_v, max_u, max_v)
+            mesh = None
+        if mesh is not None:
+            if len(mesh.vertices) == len(export_mesh.vertices):
+                return mesh
+            _remove_mesh(mesh)
+    return base_mesh_from_deltas(export_mesh, load_compact_deltas(export_obj))
+
+
+def _capture_compact_edits(context, curve_obj, export_obj):
+    # Compact lines have no _BASE to diff against later, so record mesh edits when leaving Edit Mesh.
+    # Returns False when the edits could not be recorded (an empty mesh has nothing to record).
+    export_mesh = getattr(export_obj, "data", None)
+    if export_mesh is None or not len(export_mesh.vertices):
+        return True
+    base_mesh = _compact_old_base_mesh(context, curve_obj, export_obj)
+    if base_mesh is None:
+        return False
+    try:
+        deltas = edit_deltas(export_obj.data, base_mesh)
+        if deltas is None:
+            return False
+        store_compact_deltas(export_obj, deltas, compact_deltas_fingerprint(export_obj))
+        ribbon_edits = capture_ribbon_edits(export_obj.data, base_mesh)
+        if ribbon_edits is not None:
+            store_ribbon_edits(curve_obj, *ribbon_edits)
+        return True
+    except Exception:
+        return False
+    finally:
+        _remove_mesh(base_mesh)
+
+
+def _mesh_new_from_curve(context, curve_obj):
+    if get_preference("use_native_mesher", True, context):
+        mesh = build_ribbon_mesh(curve_obj)
+        if mesh is not None:
+            return mesh
+
+    depsgraph = context.evaluated_depsgraph_get()
+    eval_obj = curve_obj.evaluated_get(depsgraph)
+    return bpy.data.meshes.new_from_object(eval_obj, preserve_all_data_layers=True, depsgraph=depsgraph)
 
 
 def _sanitize_uv_bbox(value):
@@ -334,52 +405,6 @@ def _active_uv_layer_name(mesh_obj):
         return None
 
 
-def _copy_uv_layer_by_index(src_mesh, dst_mesh, uv_layer_name):
-    if src_mesh is None or dst_mesh is None or not uv_layer_name:
-        return False
-    if not hasattr(src_mesh, "uv_layers") or not hasattr(dst_mesh, "uv_layers"):
-        return False
-
-    try:
-        src_layer = src_mesh.uv_layers.get(uv_layer_name)
-    except Exception:
-        src_layer = None
-    if src_layer is None:
-        return False
-
-    try:
-        dst_layer = dst_mesh.uv_layers.get(uv_layer_name) or dst_mesh.uv_layers.new(name=uv_layer_name)
-        dst_mesh.uv_layers.active = dst_layer
-    except Exception:
-        return False
-
-    try:
-        src_polys = list(src_mesh.polygons)
-        dst_polys = list(dst_mesh.polygons)
-    except Exception:
-        return False
-    if len(src_polys) != len(dst_polys):
-        return False
-    try:
-        for sp, dp in zip(src_polys, dst_polys):
-            if int(getattr(sp, "loop_total", -1)) != int(getattr(dp, "loop_total", -1)):
-                return False
-    except Exception:
-        return False
-
-    try:
-        src_data = src_layer.data
-        dst_data = dst_layer.data
-        if len(src_data) != len(dst_data):
-            return False
-        for i in range(len(dst_data)):
-            dst_data[i].uv = src_data[i].uv
-    except Exception:
-        return False
-
-    return True
-
-
 def _get_curve_saved_uv_bbox(curve_obj):
     if curve_obj is None:
         return None
@@ -428,147 +453,6 @@ def _set_curve_saved_uv_layer_name(curve_obj, name):
         return False
 
 
-def _fit_uv_to_bbox(mesh, target_bbox, uv_layer_name="UVMap"):
-    if mesh is None or target_bbox is None:
-        return False
-    uv_layer = None
-    try:
-        uv_layer = mesh.uv_layers.get(uv_layer_name) if hasattr(mesh, "uv_layers") else None
-    except Exception:
-        uv_layer = None
-    if uv_layer is None:
-        return False
-
-    current_bbox = _uv_bbox(mesh, uv_layer_name=uv_layer_name)
-    if current_bbox is None:
-        return False
-
-    cmin_u, cmin_v, cmax_u, cmax_v = current_bbox
-    tmin_u, tmin_v, tmax_u, tmax_v = target_bbox
-
-    csize_u = cmax_u - cmin_u
-    csize_v = cmax_v - cmin_v
-    tsize_u = tmax_u - tmin_u
-    tsize_v = tmax_v - tmin_v
-    eps = 1e-12
-    if abs(csize_u) <= eps:
-        if abs(tsize_u) > eps:
-            return False
-        su = 1.0
-    else:
-        if abs(tsize_u) <= eps:
-            return False
-        su = tsize_u / csize_u
-
-    if abs(csize_v) <= eps:
-        if abs(tsize_v) > eps:
-            return False
-        sv = 1.0
-    else:
-        if abs(tsize_v) <= eps:
-            return False
-        sv = tsize_v / csize_v
-
-    for uv in uv_layer.data:
-        uv.uv.x = (uv.uv.x - cmin_u) * su + tmin_u
-        uv.uv.y = (uv.uv.y - cmin_v) * sv + tmin_v
-    return True
-
-
-def _uv_segment_axis_from_bbox(bbox):
-    if bbox is None:
-        return "X"
-    try:
-        min_u, min_v, max_u, max_v = bbox
-        uspan = float(max_u) - float(min_u)
-        vspan = float(max_v) - float(min_v)
-    except Exception:
-        return "X"
-    return "Y" if abs(vspan) > abs(uspan) else "X"
-
-
-def _repeat_uv_u_by_face(mesh, repeat_segments, uv_layer_name="UVMap", slot_axis="X"):
-    if mesh is None or not uv_layer_name or not hasattr(mesh, "uv_layers"):
-        return False
-    try:
-        segments = int(round(float(repeat_segments)))
-    except Exception:
-        segments = 0
-    if segments < 0:
-        segments = 0
-
-    try:
-        uv_layer = mesh.uv_layers.get(uv_layer_name)
-    except Exception:
-        uv_layer = None
-    if uv_layer is None:
-        return False
-    try:
-        polys = list(mesh.polygons)
-    except Exception:
-        polys = []
-    if not polys:
-        return False
-    segment_slots = segments if segments > 0 else len(polys)
-    if segment_slots < 1:
-        return False
-
-    polys.sort(key=lambda p: int(getattr(p, "index", 0)))
-    eps = 1e-12
-    for face_rank, poly in enumerate(polys):
-        try:
-            loop_start = int(poly.loop_start)
-            loop_total = int(poly.loop_total)
-        except Exception:
-            continue
-        if loop_total <= 0:
-            continue
-
-        loop_indices = list(range(loop_start, loop_start + loop_total))
-        u_values = []
-        v_values = []
-        for loop_idx in loop_indices:
-            try:
-                uv = uv_layer.data[loop_idx].uv
-                u_values.append(float(uv.x))
-                v_values.append(float(uv.y))
-            except Exception:
-                pass
-        if not u_values or not v_values:
-            continue
-
-        umin = min(u_values)
-        umax = max(u_values)
-        vmin = min(v_values)
-        vmax = max(v_values)
-        uspan = umax - umin
-        vspan = vmax - vmin
-        face_slot = float(face_rank % segment_slots)
-
-        for loop_idx in loop_indices:
-            try:
-                uv = uv_layer.data[loop_idx].uv
-                u = float(uv.x)
-                v = float(uv.y)
-            except Exception:
-                continue
-            if abs(uspan) <= eps:
-                local_u = 0.0
-            else:
-                local_u = (u - umin) / uspan
-            if abs(vspan) <= eps:
-                local_v = 0.0
-            else:
-                local_v = (v - vmin) / vspan
-            if slot_axis == "Y":
-                uv.x = local_u
-                uv.y = face_slot + local_v
-            else:
-                uv.x = face_slot + local_u
-                uv.y = local_v
-    return True
-
-
 def _follow_active_quads_unwrap(context, mesh_obj, uv_layer_name="UVMap"):
     if context is None or mesh_obj is None or mesh_obj.type != "MESH":
         return False
@@ -667,6 +551,293 @@ def _follow_active_quads_unwrap(context, mesh_obj, uv_layer_name="UVMap"):
     return True
 
 
+def _prepare_regeneration(context, curve_obj, export_obj, base_obj):
+    old_export_mesh = getattr(export_obj, "data", None)
+    compact = base_obj is None
+    if compact:
+        old_base_mesh = _compact_old_base_mesh(context, curve_obj, export_obj)
+    else:
+        old_base_mesh = getattr(base_obj, "data", None)
+
+    uv_layer_name = _get_curve_saved_uv_layer_name(curve_obj)
+    if not uv_layer_name and old_export_mesh is not None and hasattr(old_export_mesh, "uv_layers"):
+        try:
+            uv_layer_name = getattr(old_export_mesh.uv_layers.active, "name", None)
+        except Exception:
+            uv_layer_name = None
+    uv_layer_name = uv_layer_name or "UVMap"
+
+    saved_uv_bbox = _get_curve_saved_uv_bbox(curve_obj)
+    old_uv_bbox = uv_bbox(old_export_mesh, uv_layer_name=uv_layer_name)
+    _debug_uv(
+        context,
+        f"finish_editing: curve={curve_obj.name} export={export_obj.name} uv={uv_layer_name} saved={saved_uv_bbox} old={old_uv_bbox}",
+    )
+    old_materials = []
+    try:
+        if old_export_mesh is not None and hasattr(old_export_mesh, "materials"):
+            old_materials = list(old_export_mesh.materials)
+    except Exception:
+        old_materials = []
+
+    return {
+        "curve_obj": curve_obj,
+        "export_obj": export_obj,
+        "base_obj": base_obj,
+        "compact": compact,
+        "old_export_mesh": old_export_mesh,
+        "old_base_mesh": old_base_mesh,
+        "uv_layer_name": uv_layer_name,
+        "saved_uv_bbox": saved_uv_bbox,
+        "old_uv_bbox": old_uv_bbox,
+        "old_materials": old_materials,
+        "uv_copied": False,
+        "deltas_lost": False,
+        "done": False,
+    }
+
+
+def _regenerate_export_mesh(context, job):
+    curve_obj = job["curve_obj"]
+    export_obj = job["export_obj"]
+    base_obj = job["base_obj"]
+    compact = job["compact"]
+    old_export_mesh = job["old_export_mesh"]
+    old_base_mesh = job["old_base_mesh"]
+    uv_layer_name = job["uv_layer_name"]
+
+    try:
+        new_base_mesh = _mesh_new_from_curve(context, curve_obj)
+    except Exception:
+        new_base_mesh = None
+    if new_base_mesh is None:
+        if compact:
+            _remove_mesh(old_base_mesh)
+        return False
+
+    new_export_mesh = new_base_mesh.copy()
+
+    try:
+        can_apply_deltas = (
+            old_export_mesh is not None
+            and old_base_mesh is not None
+            and len(old_export_mesh.vertices) == len(old_base_mesh.vertices)
+            and len(new_export_mesh.vertices) == len(old_base_mesh.vertices)
+        )
+    except Exception:
+        can_apply_deltas = False
+
+    # Keep a density-independent copy of the edits on the curve so they survive point
+    # inserts, normalization and segment changes (where vertex indices no longer line up).
+    try:
+        ribbon_edits = capture_ribbon_edits(old_export_mesh, old_base_mesh)
+    except Exception:
+        ribbon_edits = None
+    if ribbon_edits is not None:
+        store_ribbon_edits(curve_obj, *ribbon_edits)
+
+    if can_apply_deltas:
+        try:
+            apply_edit_deltas(new_export_mesh, old_export_mesh, old_base_mesh)
+        except Exception:
+            pass
+    else:
+        try:
+            apply_ribbon_edits(new_export_mesh, *load_ribbon_edits(curve_obj))
+        except Exception:
+            pass
+
+    try:
+        new_export_mesh.materials.clear()
+    except Exception:
+        pass
+    for mat in job["old_materials"]:
+        if mat is None:
+            continue
+        try:
+            new_export_mesh.materials.append(mat)
+        except Exception:
+            pass
+
+    # Preserve UVs exactly when topology matches (most common when toggling Curve <-> Mesh
+    # without changing curve point counts). This avoids any unwrap/fit churn.
+    uv_copied = False
+    try:
+        uv_copied = copy_uv_layer_by_index(old_export_mesh, new_export_mesh, uv_layer_name)
+    except Exception:
+        uv_copied = False
+    _debug_uv(context, f"finish_editing: uv_copied={uv_copied}")
+
+    if compact:
+        try:
+            store_compact_deltas(
+                export_obj,
+                edit_deltas(new_export_mesh, new_base_mesh),
+                tlg_preview_fingerprint(curve_obj),
+            )
+        except Exception:
+            # store_compact_deltas already dropped the partial set; the operator reports it.
+            job["deltas_lost"] = True
+        _remove_mesh(old_base_mesh)
+        _remove_mesh(new_base_mesh)
+    else:
+        _replace_mesh_data(base_obj, new_base_mesh)
+    _replace_mesh_data(export_obj, new_export_mesh)
+    job["old_export_mesh"] = None
+    job["old_base_mesh"] = None
+
+    try:
+        export_obj.matrix_world = curve_obj.matrix_world
+        base_obj.matrix_world = curve_obj.matrix_world
+    except Exception:
+        pass
+
+    try:
+        curve_obj.hide_viewport = True
+        curve_obj.hide_select = True
+    except Exception:
+        pass
+    try:
+        export_obj.hide_viewport = False
+        export_obj.hide_select = False
+        export_obj.hide_render = False
+    except Exception:
+        pass
+    try:
+        base_obj.hide_viewport = True
+        base_obj.hide_select = True
+        base_obj.hide_render = True
+    except Exception:
+        pass
+
+    job["uv_copied"] = uv_copied
+    job["done"] = True
+    return True
+
+
+def _refresh_export_uvs(context, job):
+    curve_obj = job["curve_obj"]
+    export_obj = job["export_obj"]
+    uv_layer_name = job["uv_layer_name"]
+    uv_copied = job["uv_copied"]
+    old_uv_bbox = job["old_uv_bbox"]
+
+    ok_unwrap = True
+    if not uv_copied:
+        # Ribbon meshes are plain strips: unwrap them analytically (no mode switching).
+        ok_unwrap = strip_unwrap(export_obj.data, uv_layer_name=uv_layer_name)
+        if not ok_unwrap:
+            ok_unwrap = _follow_active_quads_unwrap(context, export_obj, uv_layer_name=uv_layer_name)
+
+            # UV ops run in Edit Mode (BMesh). Switch back to Object Mode to flush results
+            # onto the Mesh datablock before applying bbox fitting.
+            _safe_mode_set(context, export_obj, "OBJECT")
+
+        try:
+            uv_segments = int(round(float(getattr(curve_obj, "tlg_uv_segments", 0))))
+        except Exception:
+            uv_segments = 0
+        if uv_segments < 0:
+            uv_segments = 0
+        current_bbox_after_unwrap = uv_bbox(getattr(export_obj, "data", None), uv_layer_name=uv_layer_name)
+        slot_axis = uv_segment_axis_from_bbox(current_bbox_after_unwrap)
+        repeat_uv_u_by_face(export_obj.data, uv_segments, uv_layer_name=uv_layer_name, slot_axis=slot_axis)
+
+    # Preserve the user's last UV scale/offset across regenerations.
+    # Prefer the bbox saved when leaving Edit Mesh, then fall back to the previous mesh bbox.
+    applied = False
+    target_uv_bbox = job["saved_uv_bbox"]
+
+    if target_uv_bbox is None:
+        try:
+            uv_segments = int(round(float(getattr(curve_obj, "tlg_uv_segments", 0))))
+        except Exception:
+            uv_segments = 0
+        if uv_segments < 0:
+            uv_segments = 0
+
+        try:
+            current_bbox = uv_bbox(getattr(export_obj, "data", None), uv_layer_name=uv_layer_name)
+        except Exception:
+            current_bbox = None
+
+        if current_bbox is not None:
+            cmin_u, cmin_v, _cmax_u, cmax_v = current_bbox
+            c_u_span = current_bbox[2] - current_bbox[0]
+            c_v_span = cmax_v - cmin_v
+            slot_axis = uv_segment_axis_from_bbox(current_bbox)
+            if c_v_span >= 0.0:
+                if old_uv_bbox is not None:
+                    amin_u, amin_v, amax_u, amax_v = old_uv_bbox
+                else:
+                    amin_u, amin_v = cmin_u, cmin_v
+                    amax_u, amax_v = current_bbox[2], cmax_v
+
+                old_u_span = amax_u - amin_u
+                old_v_span = amax_v - amin_v
+                if slot_axis == "Y":
+                    keep_u_span = old_u_span if old_u_span > 0.0 else c_u_span
+                    desired_seg_span = float(uv_segments) if uv_segments > 0 else c_v_span
+                    target_uv_bbox = (amin_u, amin_v, amin_u + keep_u_span, amin_v + desired_seg_span)
+                else:
+                    keep_v_span = old_v_span if old_v_span > 0.0 else c_v_span
+                    desired_seg_span = float(uv_segments) if uv_segments > 0 else c_u_span
+                    target_uv_bbox = (amin_u, amin_v, amin_u + desired_seg_span, amin_v + keep_v_span)
+
+    if target_uv_bbox is not None:
+        try:
+            applied = fit_uv_to_bbox(export_obj.data, target_uv_bbox, uv_layer_name=uv_layer_name)
+        except Exception:
+            applied = False
+    _debug_uv(
+        context,
+        f"finish_editing: unwrap_ok={ok_unwrap} fit_applied={applied} new_bbox={uv_bbox(getattr(export_obj, 'data', None), uv_layer_name=uv_layer_name)}",
+    )
+    if applied and target_uv_bbox is not None:
+        _set_curve_saved_uv_layer_name(curve_obj, uv_layer_name)
+        _set_curve_saved_uv_bbox(curve_obj, target_uv_bbox)
+    elif uv_copied:
+        # If we copied UVs exactly, treat the copied bbox as authoritative.
+        try:
+            copied_bbox = uv_bbox(getattr(export_obj, "data", None), uv_layer_name=uv_layer_name)
+        except Exception:
+            copied_bbox = None
+        if copied_bbox is not None:
+            _set_curve_saved_uv_layer_name(curve_obj, uv_layer_name)
+            _set_curve_saved_uv_bbox(curve_obj, copied_bbox)
+
+    return ok_unwrap
+
+
+def _ensure_object_mode(context):
+    # One switch for the whole selection: leaving a multi-object Edit Mode exits every object in it.
+    if getattr(context, "mode", "OBJECT") == "OBJECT":
+        return
+    active = context.view_layer.objects.active
+    try:
+        with context.temp_override(object=active, active_object=active):
+            bpy.ops.object.mode_set(mode="OBJECT")
+    except Exception:
+        pass
+
+
+def _enter_edit_mode(context, objs, active):
+    # Multi-object Edit Mode: all (selected) objs enter together with a single switch.
+    objs = [obj for obj in objs if obj is not None]
+    if not objs or active is None:
+        return
+    try:
+        with context.temp_override(
+            object=active,
+            active_object=active,
+            selected_objects=objs,
+            selected_editable_objects=objs,
+        ):
+            bpy.ops.object.mode_set(mode="EDIT")
+    except Exception:
+        pass
+
+
 class TAXILINES_OT_edit_path(bpy.types.Operator):
     bl_idname = "taxilines.edit_path"
     bl_label = "Edit Curve"
@@ -679,9 +850,12 @@ class TAXILINES_OT_edit_path(bpy.types.Operator):
         # when switching back to Edit Mesh later.
         active = context.view_layer.objects.active if context and context.view_layer else None
         invoked_from_mesh = bool(active and getattr(active, "type", None) == "MESH")
+        t_start = time.perf_counter()
         if invoked_from_mesh:
             _debug_uv(context, f"edit_path: invoked_from_mesh active={active.name if active else None} mode={getattr(context, 'mode', '?')}")
-            _safe_mode_set(context, active, "OBJECT")
+        # A single switch also flushes every other mesh of a multi-object Edit Mode session.
+        _ensure_object_mode(context)
+        mode_ms = (time.perf_counter() - t_start) * 1000.0
 
         curves = _iter_target_curves(context)
         if not curves:
@@ -698,14 +872,18 @@ class TAXILINES_OT_edit_path(bpy.types.Operator):
         if active_curve is None or not is_taxi_curve(active_curve):
             active_curve = curves[0]
 
+        t_phase = time.perf_counter()
+        uncaptured = []
         for curve_obj in curves:
-            ensure_taxi_preview(curve_obj, context=context)
             export_obj, base_obj = _ensure_export_and_base_mesh_objs(context, curve_obj)
 
+            if invoked_from_mesh and base_obj is None and not _capture_compact_edits(context, curve_obj, export_obj):
+                uncaptured.append(curve_obj.name)
+
             if invoked_from_mesh:
                 uv_name = _active_uv_layer_name(export_obj) or "UVMap"
                 try:
-                    bbox = _uv_bbox(getattr(export_obj, "data", None), uv_layer_name=uv_name)
+                    bbox = uv_bbox(getattr(export_obj, "data", None), uv_layer_name=uv_name)
                 except Exception:
                     bbox = None
                 if bbox is not None:
@@ -746,9 +924,23 @@ class TAXILINES_OT_edit_path(bpy.types.Operator):
             except Exception:
                 pass
         context.view_layer.objects.active = active_curve
-
-        _safe_mode_set(context, active_curve, "OBJECT")
-        _safe_mode_set(context, active_curve, "EDIT")
+        t_now = time.perf_counter()
+        prepare_ms = (t_now - t_phase) * 1000.0
+
+        _enter_edit_mode(context, curves, active_curve)
+        mode_ms += (time.perf_counter() - t_now) * 1000.0
+        total_ms = (time.perf_counter() - t_start) * 1000.0
+        if uncaptured:
+            self.report(
+                {"WARNING"},
+                f"Could not record the mesh edits of {', '.join(uncaptured)}; "
+                "they won't be carried over when the export mesh is regenerated.",
+            )
+            return {"FINISHED"}
+        self.report(
+            {"INFO"},
+            f"Editing {len(curves)} curve(s): {total_ms:.0f} ms (prepare {prepare_ms:.0f}, mode {mode_ms:.0f}).",
+        )
         return {"FINISHED"}
 
 
@@ -774,203 +966,49 @@ class TAXILINES_OT_finish_editing(bpy.types.Operator):
         if active_curve is None or not is_taxi_curve(active_curve):
             active_curve = curves[0]
 
-        export_objs = []
-        any_failed = False
-        any_unwrap_failed = False
+        timings = {}
+        t_start = time.perf_counter()
+
+        # Phase 1: one mode switch for everything (flushes curve and mesh edits of the whole selection).
+        _ensure_object_mode(context)
+        t_phase = time.perf_counter()
+        timings["mode"] = (t_phase - t_start) * 1000.0
 
+        # Phase 2: resolve trios and capture the state regeneration needs.
+        jobs = []
         for curve_obj in curves:
-            ensure_taxi_preview(curve_obj, context=context)
             export_obj, base_obj = _ensure_export_and_base_mesh_objs(context, curve_obj)
+            jobs.append(_prepare_regeneration(context, curve_obj, export_obj, base_obj))
+        t_now = time.perf_counter()
+        timings["prepare"] = (t_now - t_phase) * 1000.0
+        t_phase = t_now
 
-            old_export_mesh = getattr(export_obj, "data", None)
-            old_base_mesh = getattr(base_obj, "data", None)
-
-            uv_layer_name = _get_curve_saved_uv_layer_name(curve_obj)
-            if not uv_layer_name and old_export_mesh is not None and hasattr(old_export_mesh, "uv_layers"):
-                try:
-                    uv_layer_name = getattr(old_export_mesh.uv_layers.active, "name", None)
-                except Exception:
-                    uv_layer_name = None
-            uv_layer_name = uv_layer_name or "UVMap"
-
-            saved_uv_bbox = _get_curve_saved_uv_bbox(curve_obj)
-            old_uv_bbox = _uv_bbox(old_export_mesh, uv_layer_name=uv_layer_name)
-            _debug_uv(
-                context,
-                f"finish_editing: curve={curve_obj.name} export={export_obj.name} uv={uv_layer_name} saved={saved_uv_bbox} old={old_uv_bbox}",
-            )
-            old_materials = []
-            try:
-                if old_export_mesh is not None and hasattr(old_export_mesh, "materials"):
-                    old_materials = list(old_export_mesh.materials)
-            except Exception:
-                old_materials = []
-
-            _safe_mode_set(context, curve_obj, "OBJECT")
-
-            try:
-                new_base_mesh = _mesh_new_from_curve(context, curve_obj)
-            except Exception:
+        # Phase 3: build every mesh, carry edits over and assign the data blocks.
+        export_objs = []
+        any_failed = False
+        for job in jobs:
+            if _regenerate_export_mesh(context, job):
+                export_objs.append(job["export_obj"])
+            else:
                 any_failed = True
-                continue
-
-            new_export_mesh = new_base_mesh.copy()
-
-            try:
-                can_apply_deltas = (
-                    old_export_mesh is not None
-                    and old_base_mesh is not None
-                    and len(old_export_mesh.vertices) == len(old_base_mesh.vertices)
-                    and len(new_export_mesh.vertices) == len(old_base_mesh.vertices)
-                )
-            except Exception:
-                can_apply_deltas = False
-
-            if can_apply_deltas:
-                try:
-                    for i, v in enumerate(new_export_mesh.vertices):
-                        v.co = v.co + (old_export_mesh.vertices[i].co - old_base_mesh.vertices[i].co)
-                except Exception:
-                    pass
-
-            try:
-                new_export_mesh.materials.clear()
-            except Exception:
-                pass
-            for mat in old_materials:
-                if mat is None:
-                    continue
-                try:
-                    new_export_mesh.materials.append(mat)
-                except Exception:
-                    pass
-
-            # Preserve UVs exactly when topology matches (most common when toggling Curve <-> Mesh
-            # without changing curve point counts). This avoids any unwrap/fit churn.
-            uv_copied = False
-            try:
-                uv_copied = _copy_uv_layer_by_index(old_export_mesh, new_export_mesh, uv_layer_name)
-            except Exception:
-                uv_copied = False
-            _debug_uv(context, f"finish_editing: uv_copied={uv_copied}")
-
-            _replace_mesh_data(base_obj, new_base_mesh)
-            _replace_mesh_data(export_obj, new_export_mesh)
-
-            try:
-                export_obj.matrix_world = curve_obj.matrix_world
-                base_obj.matrix_world = curve_obj.matrix_world
-            except Exception:
-                pass
-
-            try:
-                curve_obj.hide_viewport = True
-                curve_obj.hide_select = True
-            except Exception:
-                pass
-            try:
-                export_obj.hide_viewport = False
-                export_obj.hide_select = False
-                export_obj.hide_render = False
-            except Exception:
-                pass
-            try:
-                base_obj.hide_viewport = True
-                base_obj.hide_select = True
-                base_obj.hide_render = True
-            except Exception:
-                pass
-
-            ok_unwrap = True
-            if not uv_copied:
-                ok_unwrap = _follow_active_quads_unwrap(context, export_obj, uv_layer_name=uv_layer_name)
-                if not ok_unwrap:
-                    any_unwrap_failed = True
+        t_now = time.perf_counter()
+        timings["generate"] = (t_now - t_phase) * 1000.0
+        t_phase = t_now
 
-                # UV ops run in Edit Mode (BMesh). Switch back to Object Mode to flush results
-                # onto the Mesh datablock before applying bbox fitting.
-                _safe_mode_set(context, export_obj, "OBJECT")
-
-                try:
-                    uv_segments = int(round(float(getattr(curve_obj, "tlg_uv_segments", 0))))
-                except Exception:
-                    uv_segments = 0
-                if uv_segments < 0:
-                    uv_segments = 0
-                current_bbox_after_unwrap = _uv_bbox(getattr(export_obj, "data", None), uv_layer_name=uv_layer_name)
-                slot_axis = _uv_segment_axis_from_bbox(current_bbox_after_unwrap)
-                _repeat_uv_u_by_face(export_obj.data, uv_segments, uv_layer_name=uv_layer_name, slot_axis=slot_axis)
-
-            # Preserve the user's last UV scale/offset across regenerations.
-            # Prefer the bbox saved when leaving Edit Mesh, then fall back to the previous mesh bbox.
-            applied = False
-            target_uv_bbox = saved_uv_bbox
-
-            if target_uv_bbox is None:
-                try:
-                    uv_segments = int(round(float(getattr(curve_obj, "tlg_uv_segments", 0))))
-                except Exception:
-                    uv_segments = 0
-                if uv_segments < 0:
-                    uv_segments = 0
-
-                try:
-                    current_bbox = _uv_bbox(getattr(export_obj, "data", None), uv_layer_name=uv_layer_name)
-                except Exception:
-                    current_bbox = None
-
-                if current_bbox is not None:
-                    cmin_u, cmin_v, _cmax_u, cmax_v = current_bbox
-                    c_u_span = current_bbox[2] - current_bbox[0]
-                    c_v_span = cmax_v - cmin_v
-                    slot_axis = _uv_segment_axis_from_bbox(current_bbox)
-                    if c_v_span >= 0.0:
-                        if old_uv_bbox is not None:
-                            amin_u, amin_v, amax_u, amax_v = old_uv_bbox
-                        else:
-                            amin_u, amin_v = cmin_u, cmin_v
-                            amax_u, amax_v = current_bbox[2], cmax_v
-
-                        old_u_span = amax_u - amin_u
-                        old_v_span = amax_v - amin_v
-                        if slot_axis == "Y":
-                            keep_u_span = old_u_span if old_u_span > 0.0 else c_u_span
-                            desired_seg_span = float(uv_segments) if uv_segments > 0 else c_v_span
-                            target_uv_bbox = (amin_u, amin_v, amin_u + keep_u_span, amin_v + desired_seg_span)
-                        else:
-                            keep_v_span = old_v_span if old_v_span > 0.0 else c_v_span
-                            desired_seg_span = float(uv_segments) if uv_segments > 0 else c_u_span
-                            target_uv_bbox = (amin_u, amin_v, amin_u + desired_seg_span, amin_v + keep_v_span)
-
-            if target_uv_bbox is not None:
-                try:
-                    applied = _fit_uv_to_bbox(export_obj.data, target_uv_bbox, uv_layer_name=uv_layer_name)
-                except Exception:
-                    applied = False
-            _debug_uv(
-                context,
-                f"finish_editing: unwrap_ok={ok_unwrap} fit_applied={applied} new_bbox={_uv_bbox(getattr(export_obj, 'data', None), uv_layer_name=uv_layer_name)}",
-            )
-            if applied and target_uv_bbox is not None:
-                _set_curve_saved_uv_layer_name(curve_obj, uv_layer_name)
-                _set_curve_saved_uv_bbox(curve_obj, target_uv_bbox)
-            elif uv_copied:
-                # If we copied UVs exactly, treat the copied bbox as authoritative.
-                try:
-                    copied_bbox = _uv_bbox(getattr(export_obj, "data", None), uv_layer_name=uv_layer_name)
-                except Exception:
-                    copied_bbox = None
-                if copied_bbox is not None:
-                    _set_curve_saved_uv_layer_name(curve_obj, uv_layer_name)
-                    _set_curve_saved_uv_bbox(curve_obj, copied_bbox)
-
-            export_objs.append(export_obj)
+        # Phase 4: UVs (analytic unwrap, bbox fitting) on the assigned meshes.
+        any_unwrap_failed = False
+        for job in jobs:
+            if job.get("done") and not _refresh_export_uvs(context, job):
+                any_unwrap_failed = True
+        t_now = time.perf_counter()
+        timings["uv"] = (t_now - t_phase) * 1000.0
+        t_phase = t_now
 
         if not export_objs:
             self.report({"ERROR"}, "No export meshes were generated.")
             return {"CANCELLED"}
 
-        # Select results and make the active one match the previously active curve (if possible).
+        # Phase 5: select results and make the active one match the previously active curve (if possible).
         _deselect_all(context)
         active_export = export_objs[0]
         for export_obj in export_objs:
@@ -986,15 +1024,28 @@ class TAXILINES_OT_finish_editing(bpy.types.Operator):
                     active_export = export_obj
         context.view_layer.objects.active = active_export
 
-        # For single-object workflows, drop into Edit Mode on the export mesh.
-        _safe_mode_set(context, active_export, "OBJECT")
-        if len(export_objs) == 1:
-            _safe_mode_set(context, active_export, "EDIT")
-
+        # Drop into (multi-object) Edit Mode on all export meshes with a single switch.
+        _ensure_object_mode(context)
+        _enter_edit_mode(context, export_objs, active_export)
+        timings["mode"] += (time.perf_counter() - t_phase) * 1000.0
+        total_ms = (time.perf_counter() - t_start) * 1000.0
+        timing_text = (
+            f"{len(export_objs)} line(s) in {total_ms:.0f} ms "
+            f"(prepare {timings['prepare']:.0f}, generate {timings['generate']:.0f}, "
+            f"UV {timings['uv']:.0f}, mode {timings['mode']:.0f})"
+        )
+
+        deltas_lost = [job["curve_obj"].name for job in jobs if job.get("deltas_lost")]
         if any_failed:
-            self.report({"WARNING"}, "Some selected taxi lines failed to generate.")
+            self.report({"WARNING"}, f"Some selected taxi lines failed to generate. {timing_text}")
+        elif deltas_lost:
+            self.report(
+                {"WARNING"},
+                f"Could not store the compact edit deltas of {', '.join(deltas_lost)}; "
+                f"their mesh edits won't be carried over on the next regeneration. {timing_text}",
+            )
         elif any_unwrap_failed:
-            self.report({"WARNING"}, "Export mesh updated, but UV unwrap failed on one or more lines.")
+            self.report({"WARNING"}, f"Export mesh updated, but UV unwrap failed on one or more lines. {timing_text}")
         else:
-            self.report({"INFO"}, "Export mesh updated from curve.")
+            self.report({"INFO"}, f"Export mesh updated from curve: {timing_text}.")
         return {"FINISHED"}
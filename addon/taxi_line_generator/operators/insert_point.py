@@ -1,8 +1,11 @@
 import bpy
+import numpy as np
 from bpy_extras import view3d_utils
-from mathutils import geometry
 from mathutils import Vector
 
+from ..core.nearest import nearest_on_bezier_2d
+from ..curve_utils import insert_bezier_points, read_spline_points
+
 
 def _safe_mode_set(context, obj, mode):
     if context is None or obj is None:
@@ -51,130 +54,52 @@ def _find_nearest_segment_at_mouse(context, curve_obj, mouse_xy, resolution=40):
     if region is None or rv3d is None:
         return None
 
-    def closest_on_seg_2d(a2, b2, p2):
-        v = b2 - a2
-        denom = v.dot(v)
-        if denom <= 1e-12:
-            return (p2 - a2).length, 0.0
-        u = (p2 - a2).dot(v) / denom
-        u = 0.0 if u < 0.0 else 1.0 if u > 1.0 else u
-        c = a2 + v * u
-        return (p2 - c).length, u
-
     best = None
     best_dist = 1e18
 
-    world = curve_obj.matrix_world
-    curve_data = curve_obj.data
-
-    for spline in _iter_bezier_splines(curve_data):
-        bps = spline.bezier_points
-        for i in range(len(bps) - 1):
-            a = bps[i]
-            b = bps[i + 1]
-
-            samples = geometry.interpolate_bezier(
-                Vector(a.co),
-                Vector(a.handle_right),
-                Vector(b.handle_left),
-                Vector(b.co),
-                resolution,
-            )
-
-            pts2d = []
-            for p in samples:
-                p2d = view3d_utils.location_3d_to_region_2d(region, rv3d, world @ p)
-                pts2d.append(Vector(p2d) if p2d is not None else None)
-
-            # Measure distance to the polyline formed by the sampled points (more robust than
-            # checking only sample-point distances).
-            denom = (len(samples) - 1)
-            for j in range(len(samples) - 1):
-                a2 = pts2d[j]
-                b2 = pts2d[j + 1]
-                if a2 is None or b2 is None:
-                    continue
-                d, u = closest_on_seg_2d(a2, b2, mouse_xy)
-                if d < best_dist:
-                    best_dist = d
-                    t = (j + u) / denom if denom > 0 else 0.0
-                    best = (spline, i, t)
+    # Object -> region pixels in one matrix (location_3d_to_region_2d for many points at once).
+    perspective = np.array(rv3d.perspective_matrix @ curve_obj.matrix_world, dtype=np.float64)
+    mouse = (float(mouse_xy[0]), float(mouse_xy[1]))
+
+    for spline in _iter_bezier_splines(curve_obj.data):
+        # Bbox cull of the projected control polygons, then Newton on the few candidate segments.
+        hit = nearest_on_bezier_2d(
+            *read_spline_points(spline),
+            perspective,
+            region.width,
+            region.height,
+            mouse,
+            coarse=resolution,
+        )
+        if hit is None:
+            continue
+        d, i, t = hit
+        if d < best_dist:
+            best_dist = d
+            best = (spline, i, t)
 
     return best, best_dist
 
 
-def _copy_spline_settings(src, dst):
-    for name in (
-        "resolution_u",
-        "resolution_v",
-        "tilt_interpolation",
-        "radius_interpolation",
-        "use_cyclic_u",
-        "use_endpoint_u",
-        "use_smooth",
-    ):
-        if hasattr(src, name) and hasattr(dst, name):
-            try:
-                setattr(dst, name, getattr(src, name))
-            except Exception:
-                pass
-
-
-def _copy_bezier_point(src, dst):
-    dst.co = src.co.copy()
-    dst.handle_left = src.handle_left.copy()
-    dst.handle_right = src.handle_right.copy()
-    dst.handle_left_type = src.handle_left_type
-    dst.handle_right_type = src.handle_right_type
-    if hasattr(src, "radius") and hasattr(dst, "radius"):
-        dst.radius = float(src.radius)
-    if hasattr(src, "tilt") and hasattr(dst, "tilt"):
-        dst.tilt = float(src.tilt)
-    if hasattr(dst, "select_control_point"):
-        dst.select_control_point = bool(getattr(src, "select_control_point", False))
-
-
-def _rebuild_spline_insert_through(curve_data, spline, seg_index, local_co):
+def _insert_point_through(spline, seg_index, local_co):
     bps = spline.bezier_points
     n = len(bps)
     if seg_index < 0 or seg_index >= n - 1:
         return None
 
-    # Create a new spline with one extra point, then delete the old spline.
-    new_spline = curve_data.splines.new(type="BEZIER")
-    new_spline.bezier_points.add(count=n)  # adds n points + the initial = n+1 total
-    _copy_spline_settings(spline, new_spline)
-
-    new_bps = new_spline.bezier_points
-    insert_at = seg_index + 1
-
-    # Copy points before insertion.
-    for i in range(insert_at):
-        _copy_bezier_point(bps[i], new_bps[i])
+    # Open a gap in place (bulk copy of all point fields; keeps the spline and its settings).
+    insert_at = insert_bezier_points(spline, seg_index + 1, co=(tuple(local_co),))
+    left = bps[seg_index]
+    mid = bps[insert_at]
+    right = bps[seg_index + 2]
 
     # Inserted point: force the curve to pass through the clicked position by
     # creating two straight Bezier segments (left->mid->right).
-    mid = new_bps[insert_at]
-    mid.co = Vector(local_co)
-    if hasattr(mid, "radius"):
-        left_r = float(getattr(bps[seg_index], "radius", 1.0))
-        right_r = float(getattr(bps[seg_index + 1], "radius", 1.0))
-        mid.radius = (left_r + right_r) * 0.5
-    if hasattr(mid, "tilt"):
-        left_t = float(getattr(bps[seg_index], "tilt", 0.0))
-        right_t = float(getattr(bps[seg_index + 1], "tilt", 0.0))
-        mid.tilt = (left_t + right_t) * 0.5
-    if hasattr(mid, "select_control_point"):
-        mid.select_control_point = True
-
-    # Copy points after insertion.
-    for i in range(insert_at, n):
-        _copy_bezier_point(bps[i], new_bps[i + 1])
+    mid.radius = (float(left.radius) + float(right.radius)) * 0.5
+    mid.tilt = (float(left.tilt) + float(right.tilt)) * 0.5
+    mid.select_control_point = True
 
     # Force straight segments into / out of the inserted point (no automatic handle solver).
-    left = new_bps[seg_index]
-    right = new_bps[seg_index + 2]
-
     pL = Vector(left.co)
     pM = Vector(mid.co)
     pR = Vector(right.co)
@@ -189,10 +114,7 @@ def _rebuild_spline_insert_through(curve_data, spline, seg_index, local_co):
 
     mid.handle_right = pM + (pR - pM) / 3.0
     right.handle_left = pR - (pR - pM) / 3.0
-
-    # Remove old spline.
-    curve_data.splines.remove(spline)
-    return new_spline
+    return spline
 
 
 class TAXILINES_OT_insert_point_at_mouse(bpy.types.Operator):
@@ -211,9 +133,9 @@ class TAXILINES_OT_insert_point_at_mouse(bpy.types.Operator):
 
     sample_resolution: bpy.props.IntProperty(
         name="Sampling Resolution",
-        description="Higher = more accurate hit location, slower",
-        default=40,
-        min=12,
+        description="Coarse samples per candidate segment before the exact (Newton) refinement",
+        default=16,
+        min=4,
         soft_max=120,
     )
 
@@ -264,7 +186,7 @@ class TAXILINES_OT_insert_point_at_mouse(bpy.types.Operator):
 
         spline, seg_index, t = best
         local_hit = obj.matrix_world.inverted() @ hit_world
-        _rebuild_spline_insert_through(obj.data, spline, seg_index, local_hit)
+        _insert_point_through(spline, seg_index, local_hit)
 
         obj.data.update_tag()
         obj.update_tag()
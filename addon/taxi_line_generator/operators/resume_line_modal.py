@@ -1,7 +1,9 @@
 import bpy
 from bpy_extras import view3d_utils
 
-from ..curve_utils import apply_taxi_handles_to_spline
+from ..curve_utils import apply_taxi_handles_to_spline_window, extend_bezier_spline, remove_bezier_end_point
+from ..point_preview import PointPreview
+from ..preferences import get_preference
 from ..properties import ensure_taxi_preview, is_taxi_curve
 
 
@@ -41,53 +43,6 @@ def _safe_mode_set(context, obj, mode):
         pass
 
 
-def _copy_spline_settings(src, dst):
-    for name in (
-        "resolution_u",
-        "resolution_v",
-        "tilt_interpolation",
-        "radius_interpolation",
-        "use_cyclic_u",
-        "use_endpoint_u",
-        "use_smooth",
-    ):
-        if hasattr(src, name) and hasattr(dst, name):
-            try:
-                setattr(dst, name, getattr(src, name))
-            except Exception:
-                pass
-
-
-def _copy_bezier_point(src, dst):
-    dst.co = src.co.copy()
-    dst.handle_left = src.handle_left.copy()
-    dst.handle_right = src.handle_right.copy()
-    dst.handle_left_type = src.handle_left_type
-    dst.handle_right_type = src.handle_right_type
-    if hasattr(src, "radius") and hasattr(dst, "radius"):
-        dst.radius = float(src.radius)
-    if hasattr(src, "tilt") and hasattr(dst, "tilt"):
-        dst.tilt = float(src.tilt)
-
-
-def _prepend_bezier_point(curve_data, spline, local_co):
-    bps = spline.bezier_points
-    n = len(bps)
-
-    new_spline = curve_data.splines.new(type="BEZIER")
-    new_spline.bezier_points.add(count=n)  # adds n + the initial = n+1 total
-    _copy_spline_settings(spline, new_spline)
-
-    new_bps = new_spline.bezier_points
-    new_bps[0].co = local_co
-
-    for i in range(n):
-        _copy_bezier_point(bps[i], new_bps[i + 1])
-
-    curve_data.splines.remove(spline)
-    return new_spline
-
-
 def _get_single_selected_endpoint(curve_obj):
     if curve_obj is None or curve_obj.type != "CURVE" or curve_obj.data is None:
         return None
@@ -136,6 +91,9 @@ class TAXILINES_OT_resume_taxi_line(bpy.types.Operator):
     _spline_index = 0
     _extend_at_start = False
     _initial_points_count = 0
+    # Clicks are buffered here (curve-local) and written in one go, see _commit_pending.
+    _pending = None
+    _preview = None
 
     def _set_ui_state(self, context, *, active):
         wm = getattr(context, "window_manager", None)
@@ -156,6 +114,60 @@ class TAXILINES_OT_resume_taxi_line(bpy.types.Operator):
             except Exception:
                 pass
 
+    def _get_spline(self):
+        curve_data = self._curve_obj.data if self._curve_obj is not None else None
+        if curve_data is None or len(curve_data.splines) <= self._spline_index:
+            return None
+        spline = curve_data.splines[self._spline_index]
+        if spline.type != "BEZIER":
+            return None
+        return spline
+
+    def _update_preview_anchor(self, spline):
+        if self._preview is None:
+            return
+        bps = spline.bezier_points if spline is not None else ()
+        if len(bps) == 0:
+            self._preview.set_anchor(None)
+            return
+        endpoint = bps[0] if self._extend_at_start else bps[-1]
+        self._preview.set_anchor(self._curve_obj.matrix_world @ endpoint.co)
+
+    def _commit_pending(self, context):
+        """Write all buffered points with one mode switch, one bulk insert and one local handle solve."""
+        if not self._pending:
+            return
+        _safe_mode_set(context, self._curve_obj, "OBJECT")
+        spline = self._get_spline()
+        if spline is not None:
+            try:
+                extend_bezier_spline(spline, self._pending, at_start=self._extend_at_start)
+                bps = spline.bezier_points
+                bps.foreach_set("select_control_point", [False] * len(bps))
+                endpoint = bps[0] if self._extend_at_start else bps[-1]
+                endpoint.select_control_point = True
+                self._curve_obj.data.update_tag()
+                self._curve_obj.update_tag()
+            except Exception:
+                pass
+            self._update_preview_anchor(spline)
+        self._pending.clear()
+        if self._preview is not None:
+            self._preview.clear()
+        _safe_mode_set(context, self._curve_obj, "EDIT")
+
+    def _finish(self, context, commit=True):
+        if commit and self._curve_obj is not None and self._curve_obj.data is not None:
+            self._commit_pending(context)
+        if self._preview is not None:
+            self._preview.stop()
+            self._preview = None
+        self._pending = None
+        self._set_ui_state(context, active=False)
+
+    def cancel(self, context):
+        self._finish(context, commit=False)
+
     @classmethod
     def poll(cls, context):
         obj = getattr(context, "active_object", None)
@@ -205,12 +217,17 @@ class TAXILINES_OT_resume_taxi_line(bpy.types.Operator):
 
         _safe_mode_set(context, obj, "OBJECT")
         ensure_taxi_preview(obj, context=context)
-        _safe_mode_set(context, obj, "EDIT")
 
         self._curve_obj = obj
         self._spline_index = int(spline_index)
         self._extend_at_start = bool(extend_at_start)
         self._initial_points_count = int(len(bps))
+        self._pending = []
+        self._preview = PointPreview()
+        self._update_preview_anchor(spline)
+        self._preview.start()
+
+        _safe_mode_set(context, obj, "EDIT")
 
         self._set_ui_state(context, active=True)
         context.window_manager.modal_handler_add(self)
@@ -245,121 +262,72 @@ class TAXILINES_OT_resume_taxi_line(bpy.types.Operator):
             return {"PASS_THROUGH"}
 
         if self._curve_obj is None or self._curve_obj.data is None:
-            self._set_ui_state(context, active=False)
+            self._finish(context, commit=False)
             return {"CANCELLED"}
 
-        # Finish (Right Click / Esc)
-        if event.type in {"RIGHTMOUSE", "ESC"} and event.value == "PRESS":
+        # Finish (Right Click / Esc / Enter): write the buffered points.
+        if event.type in {"RIGHTMOUSE", "ESC", "RET", "NUMPAD_ENTER"} and event.value == "PRESS":
+            self._finish(context)
             _safe_mode_set(context, self._curve_obj, "EDIT")
-            self._set_ui_state(context, active=False)
-            return {"FINISHED"}
-
-        # Finish (Enter)
-        if event.type in {"RET", "NUMPAD_ENTER"} and event.value == "PRESS":
-            _safe_mode_set(context, self._curve_obj, "EDIT")
-            self._set_ui_state(context, active=False)
             return {"FINISHED"}
 
         # Undo last placed point (keep resuming).
         if event.type == "Z" and event.value == "PRESS" and (event.ctrl or event.oskey):
-            curve_data = self._curve_obj.data
-            if len(curve_data.splines) <= self._spline_index:
+            # Buffered points are only dropped from the buffer.
+            if self._pending:
+                self._pending.pop()
+                self._preview.pop()
+                if context.area is not None:
+                    context.area.tag_redraw()
                 return {"RUNNING_MODAL"}
 
-            spline = curve_data.splines[self._spline_index]
-            if spline.type != "BEZIER":
+            spline = self._get_spline()
+            if spline is None:
                 return {"RUNNING_MODAL"}
 
             points = spline.bezier_points
             if len(points) <= max(1, self._initial_points_count):
                 return {"RUNNING_MODAL"}
 
-            _safe_mode_set(context, self._curve_obj, "EDIT")
-            try:
-                for bp in points:
-                    bp.select_control_point = False
-                    if hasattr(bp, "select_left_handle"):
-                        bp.select_left_handle = False
-                    if hasattr(bp, "select_right_handle"):
-                        bp.select_right_handle = False
-
-                target = points[0] if self._extend_at_start else points[-1]
-                target.select_control_point = True
-                with context.temp_override(
-                    object=self._curve_obj,
-                    active_object=self._curve_obj,
-                    selected_objects=[self._curve_obj],
-                    selected_editable_objects=[self._curve_obj],
-                ):
-                    bpy.ops.curve.delete(type="VERT")
-            except Exception:
-                return {"RUNNING_MODAL"}
-
+            # Truncate in Object Mode (leaving Edit Mode writes the edit points back) with bulk
+            # copies, then return to Edit Mode once. The switch frees the old point data, so the
+            # spline returned by the truncate is the one used below.
             _safe_mode_set(context, self._curve_obj, "OBJECT")
             try:
-                apply_taxi_handles_to_spline(spline)
-                self._curve_obj.data.update_tag()
-                self._curve_obj.update_tag()
+                spline = remove_bezier_end_point(self._curve_obj.data, self._spline_index, self._extend_at_start)
             except Exception:
-                pass
+                spline = None
+            if spline is not None and len(spline.bezier_points):
+                try:
+                    # Only the points next to the removed end change.
+                    end_index = 0 if self._extend_at_start else len(spline.bezier_points) - 1
+                    apply_taxi_handles_to_spline_window(spline, end_index)
+                    self._curve_obj.data.update_tag()
+                    self._curve_obj.update_tag()
+                except Exception:
+                    pass
+                self._update_preview_anchor(spline)
 
             _safe_mode_set(context, self._curve_obj, "EDIT")
             if context.area is not None:
                 context.area.tag_redraw()
             return {"RUNNING_MODAL"}
 
-        # Add point (Left Click)
+        # Add point (Left Click): only buffered; the curve is written on finish or every N points.
         if event.type == "LEFTMOUSE" and event.value == "PRESS":
-            _safe_mode_set(context, self._curve_obj, "OBJECT")
-
             origin, direction = _get_mouse_ray(context, event)
             hit = _intersect_ray_with_plane(origin, direction, plane_z=0.0)
             if hit is None:
                 self.report({"WARNING"}, "Could not place point.")
-                _safe_mode_set(context, self._curve_obj, "EDIT")
                 return {"RUNNING_MODAL"}
 
-            curve_data = self._curve_obj.data
-            if len(curve_data.splines) <= self._spline_index:
-                _safe_mode_set(context, self._curve_obj, "EDIT")
-                self._set_ui_state(context, active=False)
-                return {"CANCELLED"}
-
-            spline = curve_data.splines[self._spline_index]
-            if spline.type != "BEZIER":
-                _safe_mode_set(context, self._curve_obj, "EDIT")
-                self._set_ui_state(context, active=False)
-                return {"CANCELLED"}
+            self._pending.append(self._curve_obj.matrix_world.inverted() @ hit)
+            self._preview.push(hit)
 
-            local_hit = self._curve_obj.matrix_world.inverted() @ hit
+            interval = int(get_preference("draw_commit_interval", 0, context))
+            if interval > 0 and len(self._pending) >= interval:
+                self._commit_pending(context)
 
-            if self._extend_at_start:
-                spline = _prepend_bezier_point(curve_data, spline, local_hit)
-                self._spline_index = len(curve_data.splines) - 1
-            else:
-                spline.bezier_points.add(count=1)
-                spline.bezier_points[-1].co = local_hit
-
-            try:
-                apply_taxi_handles_to_spline(spline)
-            except Exception:
-                pass
-
-            try:
-                for bp in spline.bezier_points:
-                    bp.select_control_point = False
-                endpoint = spline.bezier_points[0] if self._extend_at_start else spline.bezier_points[-1]
-                endpoint.select_control_point = True
-            except Exception:
-                pass
-
-            try:
-                self._curve_obj.data.update_tag()
-                self._curve_obj.update_tag()
-            except Exception:
-                pass
-
-            _safe_mode_set(context, self._curve_obj, "EDIT")
             if context.area is not None:
                 context.area.tag_redraw()
             return {"RUNNING_MODAL"}
@@ -0,0 +1,157 @@
+import bpy  # pyright: ignore[reportMissingImports]
+
+from .. import registry
+from ..properties import (
+    get_base_mesh_for_curve,
+    get_baked_mesh_for_curve,
+    get_taxi_curves_collection,
+    get_taxi_export_collection,
+    get_taxi_internal_collection,
+    tlg_ensure_line_metadata,
+    tlg_file_schema_version,
+    tlg_link_objects,
+    tlg_parse_base_name,
+    tlg_stamp_file_schema,
+    tlg_sync_linked_object_names,
+    TLG_SCHEMA_VERSION,
+)
+
+_LEGACY_COLLECTION_NAMES = ("TAXI_LINES", "TLG_Baked")
+
+
+def _move_out_of_legacy_collections(obj, target_col):
+    if obj is None:
+        return False
+    moved = False
+    for col in list(getattr(obj, "users_collection", [])):
+        try:
+            if col is None or col.name not in _LEGACY_COLLECTION_NAMES:
+                continue
+            if target_col is not None and target_col not in obj.users_collection:
+                target_col.objects.link(obj)
+            col.objects.unlink(obj)
+            moved = True
+        except Exception:
+            pass
+    return moved
+
+
+def _remove_empty_legacy_collections():
+    for name in _LEGACY_COLLECTION_NAMES:
+        col = bpy.data.collections.get(name)
+        if col is None:
+            continue
+        try:
+            if len(col.objects) == 0 and len(col.children) == 0:
+                bpy.data.collections.remove(col)
+        except Exception:
+            pass
+
+
+def _iter_legacy_or_current_taxi_curves():
+    for obj in list(bpy.data.objects):
+        try:
+            if obj.type != "CURVE":
+                continue
+            if obj.get("tlg_is_taxi_line"):
+                yield obj
+            elif "taxilines_mesh" in obj:
+                obj["tlg_is_taxi_line"] = True
+                yield obj
+        except Exception:
+            continue
+
+
+def upgrade_blend_file(filepath=None, save=False):
+    """
+    Upgrade every taxi line in a .blend in one pass and stamp the file schema version.
+
+    Converts legacy keys/names/collections to the current layout so the resolvers can skip
+    their legacy fallbacks afterwards. Headless use:
+
+        blender -b file.blend --python-expr "from taxi_line_generator.operators.upgrade_file \\
+            import upgrade_blend_file; upgrade_blend_file(save=True)"
+
+    Returns a dict of counts.
+    """
+    if filepath:
+        bpy.ops.wm.open_mainfile(filepath=str(filepath))
+
+    stats = {"curves": 0, "linked": 0, "renamed": 0, "moved": 0}
+
+    # Legacy meshes only carry taxilines_source_curve; copy it to the current key.
+    for obj in list(bpy.data.objects):
+        try:
+            if obj.type == "MESH" and not obj.get("tlg_source_curve") and obj.get("taxilines_source_curve"):
+                obj["tlg_source_curve"] = obj["taxilines_source_curve"]
+        except Exception:
+            continue
+
+    scene = getattr(bpy.context, "scene", None)
+    if scene is None and len(bpy.data.scenes):
+        scene = bpy.data.scenes[0]
+    curves_col = get_taxi_curves_collection(scene)
+    export_col = get_taxi_export_collection(scene)
+    internal_col = get_taxi_internal_collection(scene)
+
+    # Resolvers still run in legacy mode here (the file is stamped last).
+    for curve_obj in _iter_legacy_or_current_taxi_curves():
+        stats["curves"] += 1
+        tlg_ensure_line_metadata(curve_obj)
+        export_obj = get_baked_mesh_for_curve(curve_obj)
+        base_obj = get_base_mesh_for_curve(curve_obj)
+        if export_obj is not None or base_obj is not None:
+            tlg_link_objects(curve_obj, export_obj=export_obj, base_obj=base_obj)
+            stats["linked"] += 1
+
+        for obj, col in ((curve_obj, curves_col), (export_obj, export_col), (base_obj, internal_col)):
+            if _move_out_of_legacy_collections(obj, col):
+                stats["moved"] += 1
+
+        # Normalize legacy <BASE>_SRC_MESH / <BASE>_SRC_BASE names.
+        names_before = tuple(getattr(o, "name", None) for o in (curve_obj, export_obj, base_obj))
+        try:
+            base_name = curve_obj.get("tlg_line_name") or tlg_parse_base_name(curve_obj.name)
+            if base_name:
+                tlg_sync_linked_object_names(curve_obj, base_name)
+        except Exception:
+            pass
+        if names_before != tuple(getattr(o, "name", None) for o in (curve_obj, export_obj, base_obj)):
+            stats["renamed"] += 1
+
+    _remove_empty_legacy_collections()
+    tlg_stamp_file_schema(TLG_SCHEMA_VERSION)
+    registry.invalidate()
+
+    if save:
+        target = str(filepath) if filepath else bpy.data.filepath
+        if target:
+            bpy.ops.wm.save_mainfile(filepath=target)
+
+    return stats
+
+
+class TAXILINES_OT_upgrade_file(bpy.types.Operator):
+    bl_idname = "taxilines.upgrade_file"
+    bl_label = "Upgrade File"
+    bl_description = (
+        "Convert legacy taxi line keys, names and collections in this file to the current layout "
+        "(afterwards lookups skip the slow legacy fallbacks)"
+    )
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        if context.mode != "OBJECT":
+            self.report({"ERROR"}, "Switch to Object Mode to upgrade the file.")
+            return {"CANCELLED"}
+
+        version_before = tlg_file_schema_version()
+        stats = upgrade_blend_file()
+        self.report(
+            {"INFO"},
+            (
+                f"Upgraded file schema {version_before} -> {TLG_SCHEMA_VERSION}: "
+                f"{stats['curves']} line(s), {stats['renamed']} renamed, {stats['moved']} moved."
+            ),
+        )
+        return {"FINISHED"}
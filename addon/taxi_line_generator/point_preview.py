@@ -0,0 +1,103 @@
+try:
+    import bpy  # pyright: ignore[reportMissingImports]
+    import gpu  # pyright: ignore[reportMissingImports]
+    from gpu_extras.batch import batch_for_shader  # pyright: ignore[reportMissingImports]
+except ImportError:  # outside Blender / background builds without GPU module
+    bpy = None
+    gpu = None
+    batch_for_shader = None
+
+
+_SHADER = None
+
+
+def _uniform_color_shader():
+    global _SHADER
+    if _SHADER is None and gpu is not None:
+        # "UNIFORM_COLOR" on 4.x, "3D_UNIFORM_COLOR" on 3.6.
+        for name in ("UNIFORM_COLOR", "3D_UNIFORM_COLOR"):
+            try:
+                _SHADER = gpu.shader.from_builtin(name)
+                break
+            except Exception:
+                continue
+    return _SHADER
+
+
+class PointPreview:
+    """
+    Viewport overlay for clicked points that are not written to the curve yet.
+
+    Points are world space. `anchor` is the existing curve end the pending points continue from
+    (drawn as the start of the polyline, not as a point).
+    """
+
+    def __init__(self, color=(1.0, 0.55, 0.1, 1.0)):
+        self.color = color
+        self.anchor = None
+        self.points = []
+        self._handle = None
+        self._batches = None
+
+    def start(self):
+        if self._handle is not None or bpy is None or gpu is None:
+            return
+        try:
+            self._handle = bpy.types.SpaceView3D.draw_handler_add(self._draw, (), "WINDOW", "POST_VIEW")
+        except Exception:
+            self._handle = None
+
+    def stop(self):
+        if self._handle is not None:
+            try:
+                bpy.types.SpaceView3D.draw_handler_remove(self._handle, "WINDOW")
+            except Exception:
+                pass
+        self._handle = None
+        self._batches = None
+
+    def set_anchor(self, co):
+        self.anchor = None if co is None else tuple(co)
+        self._batches = None
+
+    def push(self, co):
+        self.points.append(tuple(co))
+        self._batches = None
+
+    def pop(self):
+        if self.points:
+            self.points.pop()
+            self._batches = None
+
+    def clear(self):
+        self.points.clear()
+        self._batches = None
+
+    def _draw(self):
+        if not self.points:
+            return
+        shader = _uniform_color_shader()
+        if shader is None:
+            return
+        try:
+            if self._batches is None:
+                strip = ([self.anchor] if self.anchor is not None else []) + self.points
+                line = batch_for_shader(shader, "LINE_STRIP", {"pos": strip}) if len(strip) >= 2 else None
+                dots = batch_for_shader(shader, "POINTS", {"pos": self.points})
+                self._batches = (line, dots)
+            line, dots = self._batches
+
+            gpu.state.line_width_set(2.0)
+            gpu.state.point_size_set(7.0)
+            shader.bind()
+            shader.uniform_float("color", self.color)
+            if line is not None:
+                line.draw(shader)
+            dots.draw(shader)
+            gpu.state.line_width_set(1.0)
+            gpu.state.point_size_set(1.0)
+        except Exception:
+            pass
+
+
+__all__ = ("PointPreview",)
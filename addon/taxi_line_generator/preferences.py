@@ -0,0 +1,112 @@
+import bpy  # pyright: ignore[reportMissingImports]
+
+
+class TAXILINES_AddonPreferences(bpy.types.AddonPreferences):
+    bl_idname = __package__
+
+    sync_debounce_ms: bpy.props.FloatProperty(
+        name="Sync Delay (ms)",
+        description=(
+            "Wait this long after the last scene change before syncing taxi line names/deletions "
+            "(coalesces transform drags into a single pass)"
+        ),
+        default=100.0,
+        min=0.0,
+        soft_max=1000.0,
+    )
+
+    sync_max_lines_per_tick: bpy.props.IntProperty(
+        name="Max Lines per Tick",
+        description="Upper bound on lines/objects processed per sync tick; leftover work continues on the next tick",
+        default=64,
+        min=1,
+        soft_max=1000,
+    )
+
+    sync_max_ms_per_tick: bpy.props.FloatProperty(
+        name="Max Time per Tick (ms)",
+        description="Time budget for one sync tick; leftover work continues on the next tick",
+        default=4.0,
+        min=0.5,
+        soft_max=50.0,
+    )
+
+    use_native_mesher: bpy.props.BoolProperty(
+        name="Native Mesher",
+        description=(
+            "Build export meshes directly from the curve data with NumPy instead of evaluating the "
+            "Geometry Nodes preview (much faster for many lines; falls back to GN when unsupported)"
+        ),
+        default=True,
+    )
+
+    edit_storage_mode: bpy.props.EnumProperty(
+        name="Edit Storage",
+        description="How new lines remember the mesh edits that are carried over when the export mesh is regenerated",
+        items=(
+            (
+                "FULL",
+                "Base Mesh",
+                "Keep a hidden full copy of the generated mesh (_BASE) per line to compute edit deltas",
+            ),
+            (
+                "COMPACT",
+                "Compact Deltas",
+                "Store only the edited vertex offsets on the export mesh; the base mesh is regenerated on demand. "
+                "Mesh edits are recorded when Edit Curve is run from the export mesh",
+            ),
+        ),
+        default="FULL",
+    )
+
+    draw_commit_interval: bpy.props.IntProperty(
+        name="Commit Every (points)",
+        description=(
+            "While drawing or resuming a line, clicked points are buffered and shown as a preview; write them "
+            "to the curve after this many points (0 = only when finishing)"
+        ),
+        default=0,
+        min=0,
+        soft_max=100,
+    )
+
+    def draw(self, context):
+        layout = self.layout
+
+        draw_box = layout.box()
+        draw_box.label(text="Drawing")
+        draw_box.prop(self, "draw_commit_interval")
+
+        mesh_box = layout.box()
+        mesh_box.label(text="Mesh Generation")
+        mesh_box.prop(self, "use_native_mesher")
+        mesh_box.prop(self, "edit_storage_mode")
+        mesh_box.operator("taxilines.compact_edit_storage", icon="FILE_REFRESH")
+
+        sync_box = layout.box()
+        sync_box.label(text="Name / Delete Sync")
+        col = sync_box.column(align=True)
+        col.prop(self, "sync_debounce_ms")
+        col.prop(self, "sync_max_lines_per_tick")
+        col.prop(self, "sync_max_ms_per_tick")
+
+
+def get_addon_preferences(context=None):
+    ctx = context if context is not None else bpy.context
+    try:
+        addon = ctx.preferences.addons.get(__package__)
+    except Exception:
+        addon = None
+    if addon is None:
+        return None
+    return getattr(addon, "preferences", None)
+
+
+def get_preference(name, default, context=None):
+    prefs = get_addon_preferences(context)
+    if prefs is None:
+        return default
+    try:
+        return getattr(prefs, name)
+    except Exception:
+        return default
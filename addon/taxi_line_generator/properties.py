@@ -1,18 +1,41 @@
 import bpy  # pyright: ignore[reportMissingImports]
+from bpy.app.handlers import persistent  # pyright: ignore[reportMissingImports]
+import array
+import hashlib
 import re
+import time
 import uuid
 
-from .curve_utils import apply_taxi_handles_to_curve
+from . import registry
+from .curve_utils import apply_taxi_handles_to_curve, update_taxi_handles_incremental
+from .uv_utils import fit_uv_to_bbox, repeat_uv_u_by_face, uv_bbox, uv_segment_axis_from_bbox
 
 _TLG_PREVIEW_NODEGROUP_NAME = "TLG_TaxiLinePreview"
 _TLG_PREVIEW_MODIFIER_NAME = "TLG_TaxiLinePreview"
 _TLG_PREVIEW_NODEGROUP_VERSION = 12
+# Digest of the inputs last written by ensure_taxi_preview (see _tlg_preview_fingerprint).
+_TLG_PREVIEW_FINGERPRINT_KEY = "tlg_preview_fingerprint"
+
+# Lines whose settings changed since the last deferred preview refresh (object names).
+_TLG_PENDING_PREVIEW_NAMES = set()
+_TLG_LAST_BATCH_STATS = None
+# Per-curve handle state from the last auto-smooth pass: {curve data key: [state per spline]}.
+# Keyed by curve data session_uid and dropped on undo/redo and load.
+_TLG_HANDLE_STATE = {}
 
 _TLG_LINE_ID_KEY = "tlg_line_id"
 _TLG_LINE_ROLE_KEY = "tlg_line_role"
 _TLG_LINE_NAME_KEY = "tlg_line_name"
 _TLG_LINE_LAST_NAME_KEY = "tlg_last_seen_name"
 
+# File-level schema version (stored on scenes). Files stamped with the current version were
+# upgraded by the "Upgrade File" operator, so resolvers can skip the legacy fallbacks
+# (taxilines_* keys, name-based scans, legacy collections).
+_TLG_SCHEMA_VERSION_KEY = "tlg_schema_version"
+TLG_SCHEMA_VERSION = 1
+
+_TLG_FILE_SCHEMA_CACHE = None
+
 _TLG_ROLE_SRC = "SRC"
 _TLG_ROLE_MESH = "MESH"
 _TLG_ROLE_BASE = "BASE"
@@ -80,16 +103,20 @@ def _tlg_set_role(obj, role: str):
     if obj is None:
         return
     try:
+        if obj.get(_TLG_LINE_ROLE_KEY) == str(role):
+            return
         obj[_TLG_LINE_ROLE_KEY] = str(role)
     except Exception:
-        pass
+        return
+    registry.note_object(obj)
 
 
 def _tlg_set_last_seen_name(obj):
     if obj is None:
         return
     try:
-        obj[_TLG_LINE_LAST_NAME_KEY] = obj.name
+        if obj.get(_TLG_LINE_LAST_NAME_KEY) != obj.name:
+            obj[_TLG_LINE_LAST_NAME_KEY] = obj.name
     except Exception:
         pass
 
@@ -110,7 +137,8 @@ def _tlg_get_line_base_name(obj):
         base = tlg_parse_base_name(current_name)
         if base:
             try:
-                obj[_TLG_LINE_NAME_KEY] = base
+                if obj.get(_TLG_LINE_NAME_KEY) != base:
+                    obj[_TLG_LINE_NAME_KEY] = base
             except Exception:
                 pass
             return base
@@ -132,26 +160,87 @@ def _tlg_get_line_base_name(obj):
 def _tlg_find_object_by_line_id(line_id: str, role: str | None = None, obj_type: str | None = None):
     if not line_id:
         return None
-    try:
-        objects = getattr(bpy.data, "objects", None)
-    except Exception:
-        objects = None
-    if not objects:
-        return None
+    return registry.find_object(line_id, role=role, obj_type=obj_type)
 
-    for obj in list(objects):
+
+def tlg_file_schema_version():
+    """Schema version stamped on the current file (0 = legacy/unstamped). Cached until load/undo."""
+    global _TLG_FILE_SCHEMA_CACHE
+    if _TLG_FILE_SCHEMA_CACHE is not None:
+        return _TLG_FILE_SCHEMA_CACHE
+    version = 0
+    for scene in getattr(bpy.data, "scenes", []):
         try:
-            if obj_type and obj.type != obj_type:
-                continue
-            if obj.get(_TLG_LINE_ID_KEY) != line_id:
-                continue
-            if role and obj.get(_TLG_LINE_ROLE_KEY) != role:
-                continue
-            return obj
+            version = max(version, int(scene.get(_TLG_SCHEMA_VERSION_KEY, 0) or 0))
         except Exception:
             continue
+    _TLG_FILE_SCHEMA_CACHE = version
+    return version
 
-    return None
+
+def tlg_file_is_upgraded():
+    return tlg_file_schema_version() >= TLG_SCHEMA_VERSION
+
+
+def tlg_stamp_file_schema(version=TLG_SCHEMA_VERSION):
+    global _TLG_FILE_SCHEMA_CACHE
+    for scene in getattr(bpy.data, "scenes", []):
+        try:
+            scene[_TLG_SCHEMA_VERSION_KEY] = int(version)
+        except Exception:
+            pass
+    _TLG_FILE_SCHEMA_CACHE = None
+
+
+def _tlg_invalidate_file_schema():
+    global _TLG_FILE_SCHEMA_CACHE
+    _TLG_FILE_SCHEMA_CACHE = None
+
+
+def _tlg_link_get(owner, field, line_id=None, obj_type=None):
+    link = getattr(owner, "tlg_link", None)
+    if link is None:
+        return None
+    try:
+        target = getattr(link, field, None)
+    except Exception:
+        return None
+    if target is None:
+        return None
+    try:
+        if obj_type and target.type != obj_type:
+            return None
+        # Shift+D copies the pointers along with the object; only trust targets of the same line.
+        if line_id and target.get(_TLG_LINE_ID_KEY) != line_id:
+            return None
+    except Exception:
+        return None
+    return target
+
+
+def _tlg_link_set(owner, field, target):
+    link = getattr(owner, "tlg_link", None)
+    if link is None:
+        return
+    try:
+        # Pointer writes tag the owner for a depsgraph update; skip no-op writes.
+        if getattr(link, field, None) != target:
+            setattr(link, field, target)
+    except Exception:
+        # Writing ID data is not allowed in some contexts (e.g. while drawing UI).
+        pass
+
+
+def tlg_link_objects(curve_obj, export_obj=None, base_obj=None):
+    """Store direct ID pointers between the SRC curve and its MESH/BASE objects (both directions)."""
+    if curve_obj is None:
+        return
+    if export_obj is not None:
+        _tlg_link_set(curve_obj, "export_mesh", export_obj)
+        _tlg_link_set(export_obj, "source_curve", curve_obj)
+    if base_obj is not None:
+        _tlg_link_set(curve_obj, "base_mesh", base_obj)
+        _tlg_link_set(base_obj, "source_curve", curve_obj)
 
 
 def tlg_sync_linked_object_names(curve_obj, base_name: str):
@@ -195,6 +284,10 @@ def tlg_sync_linked_object_names(curve_obj, base_name: str):
         except Exception:
             pass
 
+    for obj in (curve_obj, export_obj, base_obj):
+        registry.note_object(obj)
+    tlg_link_objects(curve_obj, export_obj=export_obj, base_obj=base_obj)
+
     # Refresh legacy linkage keys so older code paths keep working (and helps debugging in the Outliner).
     if export_obj is not None:
         try:
@@ -221,11 +314,13 @@ def tlg_sync_linked_object_names(curve_obj, base_name: str):
     _tlg_set_last_seen_name(curve_obj)
 
 
-def get_source_curve_for_mesh(mesh_obj):
+def get_source_curve_for_mesh(mesh_obj, repair_links=True):
     """
     Resolve a source curve for a mesh, robust to renames.
 
-    Preferred linkage is tlg_line_id/tlg_line_role. Falls back to legacy name keys.
+    Preferred linkage is the tlg_link.source_curve pointer, then tlg_line_id/tlg_line_role.
+    Falls back to legacy name keys. With repair_links, a pointer found through a fallback is
+    stored on the mesh (an ID write); pass False where nothing may be written.
     """
     if not mesh_obj or getattr(mesh_obj, "type", None) != "MESH":
         return None
@@ -235,17 +330,28 @@ def get_source_curve_for_mesh(mesh_obj):
     except Exception:
         line_id = None
 
+    curve_obj = _tlg_link_get(mesh_obj, "source_curve", line_id=line_id, obj_type="CURVE")
+    if curve_obj is not None:
+        return curve_obj
+
     if line_id:
         curve_obj = _tlg_find_object_by_line_id(str(line_id), role=_TLG_ROLE_SRC, obj_type="CURVE")
         if curve_obj is not None:
+            if repair_links:
+                _tlg_link_set(mesh_obj, "source_curve", curve_obj)
             return curve_obj
 
-    curve_name = mesh_obj.get("tlg_source_curve") or mesh_obj.get("taxilines_source_curve")
+    if tlg_file_is_upgraded():
+        curve_name = mesh_obj.get("tlg_source_curve")
+    else:
+        curve_name = mesh_obj.get("tlg_source_curve") or mesh_obj.get("taxilines_source_curve")
     if not curve_name:
         return None
     curve_obj = bpy.data.objects.get(curve_name)
     if not curve_obj or curve_obj.type != "CURVE":
         return None
+    if repair_links:
+        _tlg_link_set(mesh_obj, "source_curve", curve_obj)
     return curve_obj
 
 
@@ -567,12 +673,15 @@ def _ensure_ribbon_mesh_modifier(curve_obj):
             ng = _ensure_preview_nodegroup()
             if ng is not None:
                 mod.node_group = ng
+        # RNA writes tag the object for re-evaluation even when the value is unchanged.
         try:
-            mod.show_in_editmode = False
+            if mod.show_in_editmode:
+                mod.show_in_editmode = False
         except Exception:
             pass
         try:
-            mod.show_on_cage = False
+            if mod.show_on_cage:
+                mod.show_on_cage = False
         except Exception:
             pass
         return mod
@@ -603,6 +712,11 @@ def _set_modifier_input(mod, socket_name, value):
     socket = mod.node_group.inputs.get(socket_name)
     if socket is None:
         return False
+    try:
+        if mod[socket.identifier] == value:
+            return False
+    except Exception:
+        pass
     mod[socket.identifier] = value
     return True
 
@@ -610,29 +724,90 @@ def _set_modifier_input(mod, socket_name, value):
 def is_taxi_curve(obj):
     if not obj or obj.type != "CURVE":
         return False
-    return bool(obj.get("tlg_is_taxi_line") or ("taxilines_mesh" in obj))
+    if obj.get("tlg_is_taxi_line"):
+        return True
+    return (not tlg_file_is_upgraded()) and ("taxilines_mesh" in obj)
 
 
-def ensure_taxi_preview(curve_obj, context=None):
-    # Ensure persistent linkage metadata so users can rename objects without breaking the add-on.
+def tlg_ensure_line_metadata(curve_obj):
+    """
+    Stamp persistent linkage metadata (line ID, role, base name) on a source curve.
+
+    Only writes custom properties, so it never tags the depsgraph.
+    """
+    if curve_obj is None:
+        return None
     line_id = _tlg_ensure_line_id(curve_obj)
     _tlg_set_role(curve_obj, _TLG_ROLE_SRC)
     _tlg_get_line_base_name(curve_obj)
     _tlg_set_last_seen_name(curve_obj)
+    return line_id
 
-    mod = _ensure_ribbon_mesh_modifier(curve_obj)
-    if mod is None:
-        return None
 
-    if bool(getattr(curve_obj, "tlg_auto_smooth_handles", True)):
+def tlg_inspect_line(obj):
+    """
+    Read-only linkage lookup for handlers: returns (curve_obj, line_id, role).
+
+    Unlike ensure_taxi_preview / the get_*_for_curve resolvers, this never writes to the
+    objects, so it is safe to call from depsgraph handlers without triggering another update.
+    """
+    if obj is None:
+        return None, None, None
+    try:
+        t = obj.type
+        line_id = obj.get(_TLG_LINE_ID_KEY)
+        role = obj.get(_TLG_LINE_ROLE_KEY)
+    except Exception:
+        return None, None, None
+
+    if t == "CURVE":
+        if not is_taxi_curve(obj):
+            return None, None, None
+        return obj, (str(line_id) if line_id else None), _TLG_ROLE_SRC
+    if t != "MESH":
+        return None, None, None
+
+    curve_obj = get_source_curve_for_mesh(obj, repair_links=False)
+    if curve_obj is not None:
         try:
-            apply_taxi_handles_to_curve(curve_obj)
+            curve_line_id = curve_obj.get(_TLG_LINE_ID_KEY)
         except Exception:
-            pass
+            curve_line_id = None
+        if curve_line_id:
+            line_id = curve_line_id
+    return curve_obj, (str(line_id) if line_id else None), (str(role) if role else None)
 
-    # Inputs are evaluated in the object's local space. Compensate for object scale so
-    # the user-facing width/UV values remain in world meters (avoids surprise "fat" lines
-    # and corner overlap on scaled objects).
+
+def tlg_curve_geometry_hash(curve_obj, include_handles=False):
+    """
+    Hash of the control point positions of all Bezier splines.
+
+    Handles are derived data for change detection, but ensure_taxi_preview includes them so a
+    manual handle edit is not mistaken for "unchanged".
+    """
+    curve_data = getattr(curve_obj, "data", None)
+    if curve_data is None or not hasattr(curve_data, "splines"):
+        return None
+    attrs = ("co", "handle_left", "handle_right") if include_handles else ("co",)
+    h = hashlib.blake2b(digest_size=16)
+    try:
+        for spline in curve_data.splines:
+            if spline.type != "BEZIER":
+                h.update(str(spline.type).encode())
+                continue
+            bps = spline.bezier_points
+            h.update(len(bps).to_bytes(4, "little"))
+            h.update(b"c" if spline.use_cyclic_u else b"o")
+            for attr in attrs:
+                co = array.array("f", [0.0]) * (len(bps) * 3)
+                bps.foreach_get(attr, co)
+                h.update(co.tobytes())
+    except Exception:
+        return None
+    return h.hexdigest()
+
+
+def _tlg_curve_scale_xy(curve_obj):
     try:
         sx = abs(float(curve_obj.scale.x))
         sy = abs(float(curve_obj.scale.y))
@@ -641,6 +816,113 @@ def ensure_taxi_preview(curve_obj, context=None):
         scale_xy = 1.0
     if scale_xy <= 1e-6:
         scale_xy = 1.0
+    return scale_xy
+
+
+def _tlg_preview_material(curve_obj):
+    mat = getattr(curve_obj, "active_material", None)
+    if mat is None and curve_obj.data and hasattr(curve_obj.data, "materials") and curve_obj.data.materials:
+        mat = curve_obj.data.materials[0]
+    return mat
+
+
+def _tlg_data_key(data):
+    try:
+        return getattr(data, "session_uid", None) or data.as_pointer()
+    except Exception:
+        return None
+
+
+def _tlg_preview_fingerprint(curve_obj, mod):
+    """Compact digest of everything ensure_taxi_preview writes from."""
+    ng = getattr(mod, "node_group", None)
+    mat = _tlg_preview_material(curve_obj)
+    parts = (
+        round(float(getattr(curve_obj, "tlg_line_width", 0.15)), 6),
+        round(_tlg_curve_scale_xy(curve_obj), 6),
+        round(float(getattr(curve_obj, "tlg_segments_mult", 1.0)), 6),
+        round(float(getattr(curve_obj, "tlg_uv_u_m_per_tile", 1.0)), 6),
+        round(float(getattr(curve_obj, "tlg_uv_v_m_per_tile", 1.0)), 6),
+        getattr(mat, "name_full", None),
+        bool(getattr(curve_obj, "tlg_auto_smooth_handles", True)),
+        getattr(ng, "name_full", None),
+        ng.get("tlg_version") if ng is not None else None,
+        # Hashed fresh every time: co/handle writers don't all go through one choke point,
+        # and a foreach_get hash is cheap next to the ribbon rebuild it guards.
+        tlg_curve_geometry_hash(curve_obj, include_handles=True),
+    )
+    return hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+
+
+def _tlg_preview_is_current(curve_obj):
+    """True when the preview modifier exists and was last written from identical inputs."""
+    try:
+        stored = curve_obj.get(_TLG_PREVIEW_FINGERPRINT_KEY)
+    except Exception:
+        return False
+    if not stored:
+        return False
+    mod = curve_obj.modifiers.get(_TLG_PREVIEW_MODIFIER_NAME)
+    if mod is None or mod.type != "NODES" or mod.node_group is None:
+        return False
+    return stored == _tlg_preview_fingerprint(curve_obj, mod)
+
+
+def tlg_preview_fingerprint(curve_obj):
+    """Fingerprint of everything the generated ribbon depends on (None without a preview modifier)."""
+    try:
+        mod = curve_obj.modifiers.get(_TLG_PREVIEW_MODIFIER_NAME)
+        if mod is None or mod.type != "NODES":
+            return None
+        return _tlg_preview_fingerprint(curve_obj, mod)
+    except Exception:
+        return None
+
+
+def _tlg_apply_auto_handles(curve_obj):
+    """Auto-smooth handles, re-solving only the points that changed since the last pass."""
+    curve_data = getattr(curve_obj, "data", None)
+    if curve_data is None or curve_obj.type != "CURVE":
+        return
+    key = _tlg_data_key(curve_data)
+    if key is None:
+        apply_taxi_handles_to_curve(curve_obj)
+        return
+
+    previous = _TLG_HANDLE_STATE.get(key) or []
+    states = []
+    for index, spline in enumerate(curve_data.splines):
+        if spline.type != "BEZIER":
+            states.append(None)
+            continue
+        before = previous[index] if index < len(previous) else None
+        states.append(update_taxi_handles_incremental(spline, before))
+    _TLG_HANDLE_STATE[key] = states
+
+
+def ensure_taxi_preview(curve_obj, context=None, force=False):
+    # Ensure persistent linkage metadata so users can rename objects without breaking the add-on.
+    tlg_ensure_line_metadata(curve_obj)
+
+    # Dirty check: every write below invalidates the GN evaluation (a full ribbon rebuild),
+    # so skip the whole pass when nothing it depends on has changed since the last call.
+    if not force and curve_obj is not None and _tlg_preview_is_current(curve_obj):
+        return curve_obj.modifiers.get(_TLG_PREVIEW_MODIFIER_NAME)
+
+    mod = _ensure_ribbon_mesh_modifier(curve_obj)
+    if mod is None:
+        return None
+
+    if bool(getattr(curve_obj, "tlg_auto_smooth_handles", True)):
+        try:
+            _tlg_apply_auto_handles(curve_obj)
+        except Exception:
+            pass
+
+    # Inputs are evaluated in the object's local space. Compensate for object scale so
+    # the user-facing width/UV values remain in world meters (avoids surprise "fat" lines
+    # and corner overlap on scaled objects).
+    scale_xy = _tlg_curve_scale_xy(curve_obj)
 
     width_m = float(getattr(curve_obj, "tlg_line_width", 0.15))
 
@@ -656,19 +938,26 @@ def ensure_taxi_preview(curve_obj, context=None):
     # because combined curve+mesh outputs on Curve objects can fail to display reliably.
 
     # Best-effort material sync for preview (bake will copy all material slots).
-    mat = getattr(curve_obj, "active_material", None)
-    if mat is None and curve_obj.data and hasattr(curve_obj.data, "materials") and curve_obj.data.materials:
-        mat = curve_obj.data.materials[0]
+    mat = _tlg_preview_material(curve_obj)
     if mat is not None:
         _set_modifier_input(mod, "Material", mat)
 
     # Display defaults: keep the curve as the editable/authoritative object.
+    for attr, value in (
+        ("hide_select", False),
+        ("hide_viewport", False),
+        ("hide_render", True),
+        ("display_type", "WIRE"),
+        ("show_in_front", True),
+    ):
+        try:
+            if getattr(curve_obj, attr) != value:
+                setattr(curve_obj, attr, value)
+        except Exception:
+            pass
+
     try:
-        curve_obj.hide_select = False
-        curve_obj.hide_viewport = False
-        curve_obj.hide_render = True
-        curve_obj.display_type = "WIRE"
-        curve_obj.show_in_front = True
+        curve_obj[_TLG_PREVIEW_FINGERPRINT_KEY] = _tlg_preview_fingerprint(curve_obj, mod)
     except Exception:
         pass
 
@@ -737,6 +1026,18 @@ def get_baked_mesh_for_curve(curve_obj):
     line_id = _tlg_ensure_line_id(curve_obj)
     _tlg_set_role(curve_obj, _TLG_ROLE_SRC)
 
+    # Fast path: direct ID pointer (rename-safe, no lookup).
+    obj = _tlg_link_get(curve_obj, "export_mesh", line_id=line_id, obj_type="MESH")
+    if obj is not None:
+        return obj
+
+    obj = _tlg_resolve_baked_mesh_by_keys(curve_obj, line_id)
+    if obj is not None:
+        tlg_link_objects(curve_obj, export_obj=obj)
+    return obj
+
+
+def _tlg_resolve_baked_mesh_by_keys(curve_obj, line_id):
     baked_name = curve_obj.get("tlg_baked_mesh")
     if baked_name:
         obj = bpy.data.objects.get(baked_name)
@@ -758,10 +1059,13 @@ def get_baked_mesh_for_curve(curve_obj):
             pass
         return obj
 
-    # Legacy fallback: search meshes pointing at this curve by name.
-    for obj in list(getattr(bpy.data, "objects", []) or []):
+    if tlg_file_is_upgraded():
+        return None
+
+    # Legacy fallback: meshes pointing at this curve by name.
+    for obj in registry.find_meshes_by_source_curve(curve_obj.name):
         try:
-            if obj.type == "MESH" and obj.get("tlg_source_curve") == curve_obj.name:
+            if obj.get("tlg_source_curve") == curve_obj.name:
                 obj[_TLG_LINE_ID_KEY] = line_id
                 _tlg_set_role(obj, _TLG_ROLE_MESH)
                 curve_obj["tlg_baked_mesh"] = obj.name
@@ -779,6 +1083,17 @@ def get_base_mesh_for_curve(curve_obj):
     line_id = _tlg_ensure_line_id(curve_obj)
     _tlg_set_role(curve_obj, _TLG_ROLE_SRC)
 
+    obj = _tlg_link_get(curve_obj, "base_mesh", line_id=line_id, obj_type="MESH")
+    if obj is not None:
+        return obj
+
+    obj = _tlg_resolve_base_mesh_by_keys(curve_obj, line_id)
+    if obj is not None:
+        tlg_link_objects(curve_obj, base_obj=obj)
+    return obj
+
+
+def _tlg_resolve_base_mesh_by_keys(curve_obj, line_id):
     base_name = curve_obj.get("tlg_base_mesh")
     if base_name:
         obj = bpy.data.objects.get(base_name)
@@ -799,9 +1114,12 @@ def get_base_mesh_for_curve(curve_obj):
             pass
         return obj
 
-    for obj in list(getattr(bpy.data, "objects", []) or []):
+    if tlg_file_is_upgraded():
+        return None
+
+    for obj in registry.find_meshes_by_source_curve(curve_obj.name):
         try:
-            if obj.type == "MESH" and obj.get("tlg_source_curve") == curve_obj.name and obj.name.endswith("_BASE"):
+            if obj.get("tlg_source_curve") == curve_obj.name and obj.name.endswith("_BASE"):
                 obj[_TLG_LINE_ID_KEY] = line_id
                 _tlg_set_role(obj, _TLG_ROLE_BASE)
                 curve_obj["tlg_base_mesh"] = obj.name
@@ -812,189 +1130,141 @@ def get_base_mesh_for_curve(curve_obj):
     return None
 
 
-def _tlg_curve_settings_update(obj, context):
-    if not obj or obj.type != "CURVE":
-        return
-    if not is_taxi_curve(obj):
-        return
-    ensure_taxi_preview(obj, context=context)
-
-
-def _tlg_uv_bbox(mesh, uv_layer_name="UVMap"):
-    if mesh is None or not uv_layer_name or not hasattr(mesh, "uv_layers"):
-        return None
-    try:
-        uv_layer = mesh.uv_layers.get(uv_layer_name)
-    except Exception:
-        uv_layer = None
-    if uv_layer is None:
-        return None
-    data = getattr(uv_layer, "data", None)
-    if not data:
-        return None
-    min_u = 1e30
-    min_v = 1e30
-    max_u = -1e30
-    max_v = -1e30
-    for uv in data:
+def tlg_migrate_pointer_links():
+    """
+    Derive tlg_link pointers from the string linkage keys (tlg_baked_mesh / tlg_base_mesh /
+    tlg_source_curve / tlg_line_id) for every taxi line. Lines whose pointers are already set
+    are not written to, so running this again is a cheap no-op.
+    """
+    count = 0
+    for obj in list(getattr(bpy.data, "objects", []) or []):
         try:
-            u = float(uv.uv.x)
-            v = float(uv.uv.y)
+            if not is_taxi_curve(obj):
+                continue
         except Exception:
             continue
-        if u < min_u:
-            min_u = u
-        if v < min_v:
-            min_v = v
-        if u > max_u:
-            max_u = u
-        if v > max_v:
-            max_v = v
-    if min_u > max_u or min_v > max_v:
-        return None
-    return (min_u, min_v, max_u, max_v)
-
-
-def _tlg_fit_uv_to_bbox(mesh, target_bbox, uv_layer_name="UVMap"):
-    if mesh is None or target_bbox is None or not uv_layer_name or not hasattr(mesh, "uv_layers"):
-        return False
-
+        get_baked_mesh_for_curve(obj)
+        get_base_mesh_for_curve(obj)
+        count += 1
+    return count
+
+
+@persistent
+def _tlg_reset_caches_on_undo(*_args):
+    # Undo/redo restore older ID data (possibly at the same addresses / session UIDs).
+    _tlg_invalidate_file_schema()
+    _TLG_HANDLE_STATE.clear()
+
+
+@persistent
+def _tlg_migrate_pointer_links_on_load(*_args):
+    _tlg_invalidate_file_schema()
+    _TLG_HANDLE_STATE.clear()
+    # Upgraded files (schema stamp) always have their pointers; files without taxi lines are
+    # left untouched (no stamps, so loading them doesn't mark them modified).
+    registry.invalidate()
+    if tlg_file_is_upgraded() or not registry.has_lines():
+        return
     try:
-        uv_layer = mesh.uv_layers.get(uv_layer_name)
+        tlg_migrate_pointer_links()
     except Exception:
-        uv_layer = None
-    if uv_layer is None:
-        return False
+        pass
 
-    current_bbox = _tlg_uv_bbox(mesh, uv_layer_name=uv_layer_name)
-    if current_bbox is None:
-        return False
 
-    cmin_u, cmin_v, cmax_u, cmax_v = current_bbox
-    tmin_u, tmin_v, tmax_u, tmax_v = target_bbox
+class TAXILINES_PG_line_link(bpy.types.PropertyGroup):
+    source_curve: bpy.props.PointerProperty(
+        name="Source Curve",
+        description="Authoring curve (SRC) of this taxi line",
+        type=bpy.types.Object,
+        options={"HIDDEN"},
+    )
+    export_mesh: bpy.props.PointerProperty(
+        name="Export Mesh",
+        description="Editable export mesh (MESH) of this taxi line",
+        type=bpy.types.Object,
+        options={"HIDDEN"},
+    )
+    base_mesh: bpy.props.PointerProperty(
+        name="Base Mesh",
+        description="Internal base mesh (BASE) used to preserve mesh edits on regeneration",
+        type=bpy.types.Object,
+        options={"HIDDEN"},
+    )
 
-    csize_u = cmax_u - cmin_u
-    csize_v = cmax_v - cmin_v
-    tsize_u = tmax_u - tmin_u
-    tsize_v = tmax_v - tmin_v
 
-    eps = 1e-12
-    if abs(csize_u) <= eps:
-        if abs(tsize_u) > eps:
-            return False
-        su = 1.0
-    else:
-        if abs(tsize_u) <= eps:
-            return False
-        su = tsize_u / csize_u
+def tlg_apply_preview_batch(curve_objs, context=None):
+    """
+    Refresh the GN preview of several lines, then evaluate the view layer once.
 
-    if abs(csize_v) <= eps:
-        if abs(tsize_v) > eps:
-            return False
-        sv = 1.0
-    else:
-        if abs(tsize_v) <= eps:
-            return False
-        sv = tsize_v / csize_v
+    Returns (refreshed line count, elapsed ms).
+    """
+    global _TLG_LAST_BATCH_STATS
+    t0 = time.perf_counter()
 
-    for uv in uv_layer.data:
-        uv.uv.x = (uv.uv.x - cmin_u) * su + tmin_u
-        uv.uv.y = (uv.uv.y - cmin_v) * sv + tmin_v
-    return True
+    count = 0
+    for curve_obj in curve_objs:
+        try:
+            if not is_taxi_curve(curve_obj) or _tlg_preview_is_current(curve_obj):
+                continue
+        except Exception:
+            continue
+        # No context: defer the view layer update to the single one below.
+        ensure_taxi_preview(curve_obj)
+        count += 1
+
+    ctx = context if context is not None else bpy.context
+    if count:
+        view_layer = getattr(ctx, "view_layer", None)
+        if view_layer is not None:
+            try:
+                view_layer.update()
+            except Exception:
+                pass
+        try:
+            for window in ctx.window_manager.windows:
+                for area in window.screen.areas:
+                    if area.type == "VIEW_3D":
+                        area.tag_redraw()
+        except Exception:
+            pass
 
+    elapsed_ms = (time.perf_counter() - t0) * 1000.0
+    if count:
+        _TLG_LAST_BATCH_STATS = (count, elapsed_ms)
+    return count, elapsed_ms
 
-def _tlg_uv_segment_axis_from_bbox(bbox):
-    if bbox is None:
-        return "X"
-    try:
-        min_u, min_v, max_u, max_v = bbox
-        uspan = float(max_u) - float(min_u)
-        vspan = float(max_v) - float(min_v)
-    except Exception:
-        return "X"
-    return "Y" if abs(vspan) > abs(uspan) else "X"
 
+def tlg_last_preview_batch_stats():
+    """(line count, elapsed ms) of the last deferred/batched preview refresh, or None."""
+    return _TLG_LAST_BATCH_STATS
 
-def _tlg_repeat_uv_u_by_face(mesh, repeat_segments, uv_layer_name="UVMap", slot_axis="X"):
-    if mesh is None or not uv_layer_name or not hasattr(mesh, "uv_layers"):
-        return False
-    try:
-        segments = int(round(float(repeat_segments)))
-    except Exception:
-        segments = 0
-    if segments < 0:
-        segments = 0
 
+def _tlg_flush_pending_previews():
+    names = list(_TLG_PENDING_PREVIEW_NAMES)
+    _TLG_PENDING_PREVIEW_NAMES.clear()
+    curves = [obj for obj in (bpy.data.objects.get(n) for n in names) if obj is not None]
     try:
-        uv_layer = mesh.uv_layers.get(uv_layer_name)
-    except Exception:
-        uv_layer = None
-    if uv_layer is None:
-        return False
-    try:
-        polys = list(mesh.polygons)
+        tlg_apply_preview_batch(curves)
     except Exception:
-        polys = []
-    if not polys:
-        return False
-    segment_slots = segments if segments > 0 else len(polys)
-    if segment_slots < 1:
-        return False
-
-    polys.sort(key=lambda p: int(getattr(p, "index", 0)))
-    eps = 1e-12
-    for face_rank, poly in enumerate(polys):
-        try:
-            loop_start = int(poly.loop_start)
-            loop_total = int(poly.loop_total)
-        except Exception:
-            continue
-        if loop_total <= 0:
-            continue
+        pass
+    return None
 
-        loop_indices = list(range(loop_start, loop_start + loop_total))
-        u_values = []
-        v_values = []
-        for loop_idx in loop_indices:
-            try:
-                uv = uv_layer.data[loop_idx].uv
-                u_values.append(float(uv.x))
-                v_values.append(float(uv.y))
-            except Exception:
-                pass
-        if not u_values or not v_values:
-            continue
 
-        umin = min(u_values)
-        umax = max(u_values)
-        vmin = min(v_values)
-        vmax = max(v_values)
-        uspan = umax - umin
-        vspan = vmax - vmin
-        face_slot = float(face_rank % segment_slots)
+def _tlg_curve_settings_update(obj, context):
+    if not obj or obj.type != "CURVE":
+        return
+    if not is_taxi_curve(obj):
+        return
+    if bpy.app.background:
+        # No event loop to run timers in background mode.
+        ensure_taxi_preview(obj, context=context)
+        return
 
-        for loop_idx in loop_indices:
-            try:
-                uv = uv_layer.data[loop_idx].uv
-                u = float(uv.x)
-                v = float(uv.y)
-            except Exception:
-                continue
-            if abs(uspan) <= eps:
-                local_u = 0.0
-            else:
-                local_u = (u - umin) / uspan
-            if abs(vspan) <= eps:
-                local_v = 0.0
-            else:
-                local_v = (v - vmin) / vspan
-            if slot_axis == "Y":
-                uv.x = local_u
-                uv.y = face_slot + local_v
-            else:
-                uv.x = face_slot + local_u
-                uv.y = local_v
-    return True
+    # Alt-drag over many selected lines calls this once per object. Queue the line and refresh
+    # every queued line in one pass (one view layer evaluation) on the next timer tick.
+    _TLG_PENDING_PREVIEW_NAMES.add(obj.name)
+    if not bpy.app.timers.is_registered(_tlg_flush_pending_previews):
+        bpy.app.timers.register(_tlg_flush_pending_previews, first_interval=0.0)
 
 
 def _tlg_uv_segments_update(obj, context):
@@ -1038,16 +1308,16 @@ def _tlg_uv_segments_update(obj, context):
             uv_layer_name = None
     uv_layer_name = str(uv_layer_name) if uv_layer_name else "UVMap"
 
-    current_bbox_before = _tlg_uv_bbox(mesh, uv_layer_name=uv_layer_name)
+    current_bbox_before = uv_bbox(mesh, uv_layer_name=uv_layer_name)
     if current_bbox_before is None:
         return
 
-    slot_axis = _tlg_uv_segment_axis_from_bbox(saved_bbox if isinstance(saved_bbox, (list, tuple)) and len(saved_bbox) == 4 else current_bbox_before)
-    remapped = _tlg_repeat_uv_u_by_face(mesh, uv_segments, uv_layer_name=uv_layer_name, slot_axis=slot_axis)
+    slot_axis = uv_segment_axis_from_bbox(saved_bbox if isinstance(saved_bbox, (list, tuple)) and len(saved_bbox) == 4 else current_bbox_before)
+    remapped = repeat_uv_u_by_face(mesh, uv_segments, uv_layer_name=uv_layer_name, slot_axis=slot_axis)
     if not remapped:
         return
 
-    current_bbox = _tlg_uv_bbox(mesh, uv_layer_name=uv_layer_name)
+    current_bbox = uv_bbox(mesh, uv_layer_name=uv_layer_name)
     if current_bbox is None:
         return
     cmin_u, cmin_v, cmax_u, cmax_v = current_bbox
@@ -1075,7 +1345,7 @@ def _tlg_uv_segments_update(obj, context):
         desired_seg_span = float(uv_segments) if uv_segments > 0 else (cmax_u - cmin_u)
         target_bbox = (amin_u, amin_v, amin_u + desired_seg_span, amin_v + target_v_span)
 
-    applied = _tlg_fit_uv_to_bbox(mesh, target_bbox, uv_layer_name=uv_layer_name)
+    applied = fit_uv_to_bbox(mesh, target_bbox, uv_layer_name=uv_layer_name)
     if not applied:
         return
 
@@ -1093,6 +1363,15 @@ def _tlg_view_mode_update(scene, context):
 
 
 def register_properties():
+    bpy.utils.register_class(TAXILINES_PG_line_link)
+    bpy.types.Object.tlg_link = bpy.props.PointerProperty(type=TAXILINES_PG_line_link, options={"HIDDEN"})
+    if _tlg_migrate_pointer_links_on_load not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_tlg_migrate_pointer_links_on_load)
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if _tlg_reset_caches_on_undo not in handlers:
+            handlers.append(_tlg_reset_caches_on_undo)
+    _tlg_invalidate_file_schema()
+
     bpy.types.WindowManager.tlg_ui_is_drawing_line = bpy.props.BoolProperty(
         name="Drawing Taxi Line",
         description="Internal UI state: drawing modal operator is active",
@@ -1239,6 +1518,30 @@ def unregister_properties():
         del bpy.types.Scene.tlg_view_mode
     except Exception:
         pass
+    try:
+        bpy.app.handlers.load_post.remove(_tlg_migrate_pointer_links_on_load)
+    except ValueError:
+        pass
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        try:
+            handlers.remove(_tlg_reset_caches_on_undo)
+        except ValueError:
+            pass
+    try:
+        if bpy.app.timers.is_registered(_tlg_flush_pending_previews):
+            bpy.app.timers.unregister(_tlg_flush_pending_previews)
+    except Exception:
+        pass
+    _TLG_PENDING_PREVIEW_NAMES.clear()
+    _TLG_HANDLE_STATE.clear()
+    try:
+        del bpy.types.Object.tlg_link
+    except Exception:
+        pass
+    try:
+        bpy.utils.unregister_class(TAXILINES_PG_line_link)
+    except Exception:
+        pass
 
 
 __all__ = (
@@ -1254,6 +1557,17 @@ __all__ = (
     "get_taxi_export_collection",
     "get_taxi_internal_collection",
     "is_taxi_curve",
+    "tlg_apply_preview_batch",
+    "tlg_curve_geometry_hash",
+    "tlg_ensure_line_metadata",
+    "tlg_inspect_line",
+    "tlg_last_preview_batch_stats",
+    "tlg_file_is_upgraded",
+    "tlg_file_schema_version",
+    "tlg_link_objects",
+    "tlg_migrate_pointer_links",
+    "tlg_preview_fingerprint",
+    "tlg_stamp_file_schema",
     "tlg_parse_base_name",
     "tlg_sync_linked_object_names",
 )
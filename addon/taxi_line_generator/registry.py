@@ -0,0 +1,204 @@
+import bpy  # pyright: ignore[reportMissingImports]
+from bpy.app.handlers import persistent  # pyright: ignore[reportMissingImports]
+
+# In-memory index of taxi line objects so resolvers don't have to walk bpy.data.objects.
+#
+# Entries store object *names* (not Python references): references held across undo/file load
+# can dangle, while a name lookup through bpy.data.objects is resolved in C and every hit is
+# validated against the object's tlg_line_id / tlg_line_role before it is returned.
+
+_LINE_ID_KEY = "tlg_line_id"
+_LINE_ROLE_KEY = "tlg_line_role"
+
+_NAMES_BY_LINE_ID = {}  # line_id -> {role: object name}
+_NAMES_BY_SOURCE_CURVE = {}  # legacy tlg_source_curve / taxilines_source_curve value -> [mesh object names]
+_IS_DIRTY = True
+
+
+def invalidate():
+    global _IS_DIRTY
+    _IS_DIRTY = True
+
+
+def _read_key(obj, key):
+    try:
+        value = obj.get(key)
+    except Exception:
+        return None
+    return str(value) if value else None
+
+
+def _index_object(obj, *, replace):
+    try:
+        name = obj.name
+        t = obj.type
+    except Exception:
+        return
+
+    line_id = _read_key(obj, _LINE_ID_KEY)
+    role = _read_key(obj, _LINE_ROLE_KEY)
+    if line_id and role:
+        roles = _NAMES_BY_LINE_ID.setdefault(line_id, {})
+        existing = roles.get(role)
+        # Keep the first object seen for a (line_id, role) pair, matching the old linear scan.
+        # Duplicates (Shift+D copies the custom properties) only take over once the original is gone.
+        if existing is None or existing == name or (replace and _resolve(existing, line_id, role) is None):
+            roles[role] = name
+
+    if t == "MESH":
+        for key in ("tlg_source_curve", "taxilines_source_curve"):
+            curve_name = _read_key(obj, key)
+            if not curve_name:
+                continue
+            names = _NAMES_BY_SOURCE_CURVE.setdefault(curve_name, [])
+            if name not in names:
+                names.append(name)
+
+
+def _rebuild():
+    global _IS_DIRTY
+    _NAMES_BY_LINE_ID.clear()
+    _NAMES_BY_SOURCE_CURVE.clear()
+    _IS_DIRTY = False
+
+    try:
+        objects = getattr(bpy.data, "objects", None)
+    except Exception:
+        objects = None
+    if not objects:
+        return
+
+    for obj in objects:
+        try:
+            if obj.type not in {"CURVE", "MESH"}:
+                continue
+        except Exception:
+            continue
+        _index_object(obj, replace=False)
+
+
+def _ensure_built():
+    if _IS_DIRTY:
+        _rebuild()
+
+
+def _resolve(name, line_id, role, obj_type=None):
+    if not name:
+        return None
+    try:
+        obj = bpy.data.objects.get(name)
+    except Exception:
+        return None
+    if obj is None:
+        return None
+    try:
+        if obj_type and obj.type != obj_type:
+            return None
+        if obj.get(_LINE_ID_KEY) != line_id:
+            return None
+        if role and obj.get(_LINE_ROLE_KEY) != role:
+            return None
+    except Exception:
+        return None
+    return obj
+
+
+def note_object(obj):
+    """Record (or refresh) an object's linkage after it was created, stamped or renamed."""
+    if obj is None:
+        return
+    _ensure_built()
+    _index_object(obj, replace=True)
+
+
+def has_lines():
+    """True when any object in the file carries tlg_line_id / tlg_line_role."""
+    _ensure_built()
+    return bool(_NAMES_BY_LINE_ID)
+
+
+def find_object(line_id: str, role: str | None = None, obj_type: str | None = None):
+    if not line_id:
+        return None
+    _ensure_built()
+
+    line_id = str(line_id)
+    for attempt in range(2):
+        roles = _NAMES_BY_LINE_ID.get(line_id)
+        if roles:
+            names = [roles.get(role)] if role else list(roles.values())
+            for name in names:
+                obj = _resolve(name, line_id, role, obj_type=obj_type)
+                if obj is not None:
+                    return obj
+            stale = any(n and _resolve(n, line_id, role) is None for n in names)
+        else:
+            stale = False
+
+        # A stale entry means an object was renamed or deleted behind our back: rebuild once and retry.
+        if not stale or attempt:
+            return None
+        _rebuild()
+    return None
+
+
+def find_meshes_by_source_curve(curve_name: str):
+    """Legacy lookup: mesh objects whose name-based source-curve key points at curve_name."""
+    if not curve_name:
+        return []
+    _ensure_built()
+
+    for attempt in range(2):
+        out = []
+        stale = False
+        for name in list(_NAMES_BY_SOURCE_CURVE.get(curve_name, ())):
+            try:
+                obj = bpy.data.objects.get(name)
+            except Exception:
+                obj = None
+            try:
+                ok = (
+                    obj is not None
+                    and obj.type == "MESH"
+                    and curve_name in (obj.get("tlg_source_curve"), obj.get("taxilines_source_curve"))
+                )
+            except Exception:
+                ok = False
+            if ok:
+                out.append(obj)
+            else:
+                stale = True
+        if not stale or attempt:
+            return out
+        _rebuild()
+    return []
+
+
+@persistent
+def _on_file_or_undo(*_args):
+    invalidate()
+
+
+_HANDLER_LISTS = ("load_post", "undo_post", "redo_post")
+
+
+def register_handlers():
+    invalidate()
+    for list_name in _HANDLER_LISTS:
+        handlers = getattr(bpy.app.handlers, list_name, None)
+        if handlers is not None and _on_file_or_undo not in handlers:
+            handlers.append(_on_file_or_undo)
+
+
+def unregister_handlers():
+    for list_name in _HANDLER_LISTS:
+        handlers = getattr(bpy.app.handlers, list_name, None)
+        if handlers is None:
+            continue
+        try:
+            handlers.remove(_on_file_or_undo)
+        except ValueError:
+            pass
+    _NAMES_BY_LINE_ID.clear()
+    _NAMES_BY_SOURCE_CURVE.clear()
+    invalidate()
@@ -0,0 +1,129 @@
+
+import bpy  # pyright: ignore[reportMissingImports]
+
+try:
+    import numpy as np
+
+    from .core.ribbon import merge_ribbons, ribbon_geometry
+except ImportError:  # pragma: no cover - Blender always bundles NumPy
+    np = None
+
+# Native (NumPy) version of the TLG_TaxiLinePreview node group (see core/ribbon.py for the
+# array kernels). Export meshes can be built straight from the curve data, without a depsgraph
+# evaluation or copying every evaluated data layer.
+
+_HANDLE_VECTOR = 2
+
+
+def is_available():
+    return np is not None
+
+
+def _read_bezier_spline(spline):
+    bps = spline.bezier_points
+    n = len(bps)
+    co = np.empty(n * 3, dtype=np.float64)
+    hl = np.empty(n * 3, dtype=np.float64)
+    hr = np.empty(n * 3, dtype=np.float64)
+    radius = np.empty(n, dtype=np.float64)
+    bps.foreach_get("co", co)
+    bps.foreach_get("handle_left", hl)
+    bps.foreach_get("handle_right", hr)
+    bps.foreach_get("radius", radius)
+    # Raw enum values (foreach_get bypasses the RNA names): VECTOR is 2.
+    type_l = np.empty(n, dtype=np.int32)
+    type_r = np.empty(n, dtype=np.int32)
+    bps.foreach_get("handle_left_type", type_l)
+    bps.foreach_get("handle_right_type", type_r)
+    return co.reshape(n, 3), hl.reshape(n, 3), hr.reshape(n, 3), radius, type_l == _HANDLE_VECTOR, type_r == _HANDLE_VECTOR
+
+
+def _ribbon_for_spline(spline, width, seg_mult, uv_u, uv_v):
+    """Returns (verts (n,3), loop vertex indices (m,), face count, uvs (m,2)) or None."""
+    if len(spline.bezier_points) < 2:
+        return None
+    co, hl, hr, radius, vec_l, vec_r = _read_bezier_spline(spline)
+    return ribbon_geometry(
+        co, hl, hr, radius, vec_l, vec_r, bool(spline.use_cyclic_u), spline.resolution_u, width, seg_mult, uv_u, uv_v
+    )
+
+
+def ribbon_inputs(curve_obj):
+    """The (local space) inputs ensure_taxi_preview feeds into the preview modifier."""
+    try:
+        scale_xy = (abs(float(curve_obj.scale.x)) + abs(float(curve_obj.scale.y))) * 0.5
+    except Exception:
+        scale_xy = 1.0
+    if scale_xy <= 1e-6:
+        scale_xy = 1.0
+    return (
+        float(getattr(curve_obj, "tlg_line_width", 0.15)) / scale_xy,
+        float(getattr(curve_obj, "tlg_segments_mult", 1.0)),
+        float(getattr(curve_obj, "tlg_uv_u_m_per_tile", 1.0)) / scale_xy,
+        float(getattr(curve_obj, "tlg_uv_v_m_per_tile", 1.0)) / scale_xy,
+    )
+
+
+def build_ribbon_mesh(curve_obj, name=None, uv_layer_name="UVMap"):
+    """
+    Build the ribbon mesh of a taxi line directly from its Bezier data (no depsgraph).
+
+    Returns a new mesh datablock, or None when the curve can't be meshed natively
+    (NumPy missing, non-Bezier splines, degenerate fillets); callers then fall back to GN.
+    """
+    if np is None or curve_obj is None or getattr(curve_obj, "type", None) != "CURVE":
+        return None
+    curve_data = getattr(curve_obj, "data", None)
+    if curve_data is None or not hasattr(curve_data, "splines"):
+        return None
+
+    width, seg_mult, uv_u, uv_v = ribbon_inputs(curve_obj)
+    if uv_u == 0.0 or uv_v == 0.0:
+        return None
+
+    parts = []
+    for spline in curve_data.splines:
+        if spline.type != "BEZIER":
+            return None
+        part = _ribbon_for_spline(spline, width, seg_mult, uv_u, uv_v)
+        if part is not None:
+            parts.append(part)
+
+    verts, loops, face_total, uvs = merge_ribbons(parts)
+
+    mesh = bpy.data.meshes.new(name or f"{curve_obj.name}_ribbon")
+    if parts:
+        verts = verts.astype(np.float32)
+        loops = loops.astype(np.int32)
+        uvs = uvs.astype(np.float32)
+
+        mesh.vertices.add(len(verts))
+        mesh.vertices.foreach_set("co", verts.ravel())
+        mesh.loops.add(len(loops))
+        mesh.loops.foreach_set("vertex_index", loops)
+        mesh.polygons.add(face_total)
+        mesh.polygons.foreach_set("loop_start", np.arange(0, len(loops), 4, dtype=np.int32))
+        try:
+            mesh.polygons.foreach_set("loop_total", np.full(face_total, 4, dtype=np.int32))
+        except Exception:
+            # Read-only in newer Blender (derived from loop_start).
+            pass
+        mesh.update(calc_edges=True)
+
+        uv_layer = mesh.uv_layers.new(name=uv_layer_name)
+        uv_layer.data.foreach_set("uv", uvs.ravel())
+
+    # Match the GN Set Material node (bake/edit copy the full slot list afterwards).
+    mat = getattr(curve_obj, "active_material", None)
+    if mat is None and getattr(curve_data, "materials", None):
+        mat = curve_data.materials[0]
+    if mat is not None:
+        mesh.materials.append(mat)
+    return mesh
+
+
+__all__ = (
+    "build_ribbon_mesh",
+    "is_available",
+    "ribbon_inputs",
+)
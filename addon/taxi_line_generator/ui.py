@@ -4,7 +4,13 @@ import importlib
 import sys
 from datetime import datetime, timezone
 
-from .properties import get_baked_mesh_for_curve, get_source_curve_for_mesh, is_taxi_curve
+from .properties import (
+    get_baked_mesh_for_curve,
+    get_source_curve_for_mesh,
+    is_taxi_curve,
+    tlg_file_is_upgraded,
+    tlg_last_preview_batch_stats,
+)
 
 
 _LAST_RELOAD_STATUS = None
@@ -150,12 +156,21 @@ class TAXILINES_PT_main(bpy.types.Panel):
                 modifiers_box.operator("taxilines.recompute_handles", text="Recompute Taxi Handles", icon="HANDLE_AUTO")
             if not is_edit_mesh_mode:
                 modifiers_box.prop(target_curve, "tlg_auto_smooth_handles", text="Auto Smooth Handles")
+            if not is_edit_mesh_mode and len(context.selected_objects) > 1:
+                modifiers_box.operator(
+                    "taxilines.apply_line_settings", text="Apply Settings to Selected", icon="DUPLICATE"
+                )
+            batch_stats = tlg_last_preview_batch_stats()
+            if batch_stats is not None and batch_stats[0] > 1:
+                modifiers_box.label(text=f"Last update: {batch_stats[0]} lines, {batch_stats[1]:.1f} ms")
             modifiers_box.separator()
         elif not is_edit_mesh_mode:
             modifiers_box.operator("taxilines.normalize_curve", text="Normalize Curve", icon="MOD_CURVE")
             modifiers_box.operator("taxilines.recompute_handles", text="Recompute Taxi Handles", icon="HANDLE_AUTO")
 
         layout.operator("taxilines.debug_active", icon="CONSOLE")
+        if not tlg_file_is_upgraded():
+            layout.operator("taxilines.upgrade_file", icon="FILE_REFRESH")
         layout.separator()
         layout.label(text="Edit Mesh regenerates the export mesh.")
         layout.label(text="Left-click = add point on Z=0")
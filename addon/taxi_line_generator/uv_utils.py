@@ -0,0 +1,208 @@
+import numpy as np
+
+from .core import uv as _core_uv
+from .core.uv import strip_face_arcs
+from .core.uv import segment_axis_from_bbox as uv_segment_axis_from_bbox
+
+# Shared UV kernels for export meshes. Everything goes through foreach_get/foreach_set and NumPy
+# reductions (core/uv.py): per-loop Python access (uv_layer.data[i].uv) costs seconds on long,
+# dense lines.
+
+
+def get_uv_layer(mesh, uv_layer_name="UVMap"):
+    if mesh is None or not uv_layer_name or not hasattr(mesh, "uv_layers"):
+        return None
+    try:
+        return mesh.uv_layers.get(uv_layer_name)
+    except Exception:
+        return None
+
+
+def read_uvs(uv_layer):
+    """(loop_count, 2) float64 array of the layer's UVs (None if unreadable)."""
+    data = getattr(uv_layer, "data", None)
+    if data is None:
+        return None
+    try:
+        buf = np.empty(len(data) * 2, dtype=np.float32)
+        data.foreach_get("uv", buf)
+    except Exception:
+        return None
+    return buf.reshape(-1, 2).astype(np.float64)
+
+
+def write_uvs(uv_layer, uvs):
+    uv_layer.data.foreach_set("uv", np.ascontiguousarray(uvs, dtype=np.float32).ravel())
+
+
+def uv_layer_bbox(uv_layer):
+    return _core_uv.bbox_of(read_uvs(uv_layer))
+
+
+def uv_bbox(mesh, uv_layer_name="UVMap"):
+    """(min_u, min_v, max_u, max_v) of a UV layer, or None."""
+    uv_layer = get_uv_layer(mesh, uv_layer_name)
+    if uv_layer is None:
+        return None
+    return uv_layer_bbox(uv_layer)
+
+
+def fit_uv_to_bbox(mesh, target_bbox, uv_layer_name="UVMap"):
+    """Scale/offset a UV layer so its bbox matches target_bbox."""
+    if target_bbox is None:
+        return False
+    uv_layer = get_uv_layer(mesh, uv_layer_name)
+    if uv_layer is None:
+        return False
+
+    uvs = _core_uv.fit_to_bbox(read_uvs(uv_layer), target_bbox)
+    if uvs is None:
+        return False
+    write_uvs(uv_layer, uvs)
+    return True
+
+
+def _face_loops(mesh):
+    """(loop_start, loop_total) int arrays of all polygons, in index order."""
+    polys = mesh.polygons
+    count = len(polys)
+    starts = np.empty(count, dtype=np.int64)
+    totals = np.empty(count, dtype=np.int64)
+    if count:
+        polys.foreach_get("loop_start", starts)
+        polys.foreach_get("loop_total", totals)
+    return starts, totals
+
+
+def repeat_uv_u_by_face(mesh, repeat_segments, uv_layer_name="UVMap", slot_axis="X"):
+    """
+    Give every face its own 0..1 UV slot along slot_axis, repeating after repeat_segments faces
+    (0 = one slot per face, i.e. no repeat).
+    """
+    if mesh is None or not uv_layer_name or not hasattr(mesh, "uv_layers"):
+        return False
+    try:
+        segments = int(round(float(repeat_segments)))
+    except Exception:
+        segments = 0
+    if segments < 0:
+        segments = 0
+
+    uv_layer = get_uv_layer(mesh, uv_layer_name)
+    if uv_layer is None:
+        return False
+    try:
+        starts, totals = _face_loops(mesh)
+    except Exception:
+        return False
+    uvs = read_uvs(uv_layer)
+    if uvs is None:
+        return False
+    uvs = _core_uv.face_slot_uvs(uvs, starts, totals, segments, slot_axis)
+    if uvs is None:
+        return False
+    write_uvs(uv_layer, uvs)
+    return True
+
+
+def copy_uv_layer_by_index(src_mesh, dst_mesh, uv_layer_name):
+    """Copy a UV layer loop-by-loop when both meshes have the same face/loop layout."""
+    if src_mesh is None or dst_mesh is None or not uv_layer_name:
+        return False
+    if not hasattr(src_mesh, "uv_layers") or not hasattr(dst_mesh, "uv_layers"):
+        return False
+
+    src_layer = get_uv_layer(src_mesh, uv_layer_name)
+    if src_layer is None:
+        return False
+
+    try:
+        _src_starts, src_totals = _face_loops(src_mesh)
+        _dst_starts, dst_totals = _face_loops(dst_mesh)
+    except Exception:
+        return False
+    if len(src_totals) != len(dst_totals) or not np.array_equal(src_totals, dst_totals):
+        return False
+    if len(src_layer.data) != len(dst_mesh.loops):
+        return False
+
+    try:
+        dst_layer = dst_mesh.uv_layers.get(uv_layer_name) or dst_mesh.uv_layers.new(name=uv_layer_name)
+        dst_mesh.uv_layers.active = dst_layer
+    except Exception:
+        return False
+
+    uvs = read_uvs(src_layer)
+    if uvs is None or len(uvs) != len(dst_layer.data):
+        return False
+    try:
+        write_uvs(dst_layer, uvs)
+    except Exception:
+        return False
+    return True
+
+
+def strip_rings(mesh):
+    """
+    (ring_a, ring_b) per face when the mesh is a ribbon strip: vertices 2r/2r+1 are the two profile
+    sides of ring r and every quad runs (a, 0) -> (a, 1) -> (b, 1) -> (b, 0). None otherwise.
+    """
+    try:
+        face_count = len(mesh.polygons)
+        vert_count = len(mesh.vertices)
+        loop_count = len(mesh.loops)
+    except Exception:
+        return None
+    if face_count < 1 or vert_count < 4 or vert_count % 2 or loop_count != face_count * 4:
+        return None
+
+    starts, totals = _face_loops(mesh)
+    loop_verts = np.empty(loop_count, dtype=np.int64)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    return _core_uv.strip_rings(starts, totals, loop_verts, vert_count)
+
+
+def strip_unwrap(mesh, uv_layer_name="UVMap"):
+    """
+    Analytic unwrap for ribbon meshes (see strip_rings):
+    U = arc length along the ring centers / average ribbon width, V = profile factor (0..1).
+
+    Works on any number of strips (one per spline, cyclic or not) without mode switching.
+    Returns False (layer untouched) when the mesh isn't laid out as such a strip.
+    """
+    if mesh is None or not uv_layer_name or not hasattr(mesh, "uv_layers"):
+        return False
+    rings = strip_rings(mesh)
+    if rings is None:
+        return False
+    ring_a, ring_b = rings
+
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    uvs = _core_uv.strip_uvs(co, ring_a, ring_b)
+    if uvs is None:
+        return False
+
+    try:
+        uv_layer = mesh.uv_layers.get(uv_layer_name) or mesh.uv_layers.new(name=uv_layer_name)
+        mesh.uv_layers.active = uv_layer
+        write_uvs(uv_layer, uvs)
+    except Exception:
+        return False
+    return True
+
+
+__all__ = (
+    "copy_uv_layer_by_index",
+    "fit_uv_to_bbox",
+    "get_uv_layer",
+    "read_uvs",
+    "repeat_uv_u_by_face",
+    "strip_face_arcs",
+    "strip_rings",
+    "strip_unwrap",
+    "uv_bbox",
+    "uv_layer_bbox",
+    "uv_segment_axis_from_bbox",
+    "write_uvs",
+)
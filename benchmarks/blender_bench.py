@@ -0,0 +1,135 @@
+"""
+Benchmarks of the Blender adapters (RNA reads/writes around the core kernels).
+
+Not part of the add-on. Run from the repository root:
+    blender --background --python benchmarks/blender_bench.py
+The bpy-free kernels have their own benchmark: python -m taxi_line_generator.core.bench
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "addon"))
+
+import bpy  # noqa: E402  # pyright: ignore[reportMissingImports]
+import numpy as np  # noqa: E402
+
+from taxi_line_generator import curve_utils, mesh_deltas, ribbon_mesh, uv_utils  # noqa: E402
+from taxi_line_generator.core.bench import best_ms, strip_layout  # noqa: E402
+
+
+def _zigzag_curve(point_count):
+    cu = bpy.data.curves.new("TLG_Bench", "CURVE")
+    spline = cu.splines.new("BEZIER")
+    spline.bezier_points.add(max(2, int(point_count)) - 1)
+    i = np.arange(len(spline.bezier_points), dtype=np.float32)
+    co = np.stack((i * 2.0, (i % 3) * 1.5, np.zeros_like(i)), axis=1)
+    spline.bezier_points.foreach_set("co", co.ravel())
+    return cu
+
+
+def _strip_mesh(name, face_count, offset=0.0, with_uvs=True):
+    """Ribbon-like strip: two vertices per ring, one quad per segment, UVs along the strip."""
+    co, loops, _starts, _totals = strip_layout(face_count + 1)
+    co = co.astype(np.float32)
+    co[:, 1] += offset
+    loops = loops.astype(np.int32)
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set("co", co.ravel())
+    mesh.loops.add(len(loops))
+    mesh.loops.foreach_set("vertex_index", loops)
+    mesh.polygons.add(face_count)
+    mesh.polygons.foreach_set("loop_start", np.arange(0, len(loops), 4, dtype=np.int32))
+    try:
+        mesh.polygons.foreach_set("loop_total", np.full(face_count, 4, dtype=np.int32))
+    except Exception:
+        pass
+    mesh.update(calc_edges=True)
+    if with_uvs:
+        uv_layer = mesh.uv_layers.new(name="UVMap")
+        uv_utils.write_uvs(uv_layer, np.stack((co[loops, 0], co[loops, 1] / 0.15 + 0.5), axis=1))
+    return mesh
+
+
+def bench_handle_solver(point_counts=(10, 100, 1_000, 10_000), repeat=5):
+    """NumPy handle solver against the per-point loop on a zig-zag spline."""
+    for count in point_counts:
+        cu = _zigzag_curve(count)
+        spline = cu.splines[0]
+        try:
+            numpy_ms = best_ms(lambda: curve_utils._apply_taxi_handles_to_spline_np(spline), repeat)
+            loop_ms = best_ms(lambda: curve_utils._apply_taxi_handles_to_spline_loop(spline), repeat)
+            print(f"[TLG] handle solver, {count} points: numpy={numpy_ms:.2f}ms  loop={loop_ms:.2f}ms")
+        finally:
+            bpy.data.curves.remove(cu)
+
+
+def bench_ribbon_mesher(point_counts=(10, 100, 1_000), repeat=10):
+    """Native export mesh build (meshes are removed again)."""
+    for count in point_counts:
+        cu = _zigzag_curve(count)
+        obj = bpy.data.objects.new("TLG_Bench", cu)
+        curve_utils.apply_taxi_handles_to_curve(obj)
+
+        def build():
+            mesh = ribbon_mesh.build_ribbon_mesh(obj)
+            if mesh is not None:
+                bpy.data.meshes.remove(mesh)
+
+        try:
+            print(f"[TLG] ribbon mesher, {count} points: {best_ms(build, repeat):.2f}ms")
+        finally:
+            bpy.data.objects.remove(obj)
+            bpy.data.curves.remove(cu)
+
+
+def bench_uv_kernels(face_counts=(1_000, 10_000, 100_000), repeat=5):
+    for face_count in face_counts:
+        src = _strip_mesh("TLG_BenchUV", int(face_count))
+        dst = src.copy()
+        try:
+            kernels = (
+                ("uv_bbox", lambda: uv_utils.uv_bbox(src)),
+                ("fit_uv_to_bbox", lambda: uv_utils.fit_uv_to_bbox(src, (0.0, 0.0, 2.0, 1.0))),
+                ("repeat_uv_u_by_face", lambda: uv_utils.repeat_uv_u_by_face(src, 8)),
+                ("copy_uv_layer_by_index", lambda: uv_utils.copy_uv_layer_by_index(src, dst, "UVMap")),
+                ("strip_unwrap", lambda: uv_utils.strip_unwrap(dst)),
+            )
+            cols = "  ".join(f"{name}={best_ms(fn, repeat):.2f}ms" for name, fn in kernels)
+            print(f"[TLG] UV kernels, {face_count} faces: {cols}")
+        finally:
+            bpy.data.meshes.remove(dst)
+            bpy.data.meshes.remove(src)
+
+
+def bench_edit_deltas(face_counts=(1_000, 10_000, 100_000, 250_000), repeat=3):
+    """apply_edit_deltas against the per-vertex loop it replaced."""
+    for count in face_counts:
+        base = _strip_mesh("TLG_BenchBase", count, with_uvs=False)
+        export = _strip_mesh("TLG_BenchExport", count, offset=0.01, with_uvs=False)
+        target = _strip_mesh("TLG_BenchTarget", count, with_uvs=False)
+
+        def loop():
+            for i, v in enumerate(target.vertices):
+                v.co = v.co + (export.vertices[i].co - base.vertices[i].co)
+
+        try:
+            numpy_ms = best_ms(lambda: mesh_deltas.apply_edit_deltas(target, export, base), repeat)
+            loop_ms = best_ms(loop, repeat)
+            print(f"[TLG] edit deltas, {len(base.vertices)} verts: numpy={numpy_ms:.2f}ms  loop={loop_ms:.2f}ms")
+        finally:
+            for mesh in (base, export, target):
+                bpy.data.meshes.remove(mesh)
+
+
+def run():
+    bench_handle_solver()
+    bench_ribbon_mesher()
+    bench_uv_kernels()
+    bench_edit_deltas()
+
+
+if __name__ == "__main__":
+    run()
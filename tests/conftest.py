@@ -0,0 +1,6 @@
+# The tests cover the bpy-free `taxi_line_generator.core` kernels and run under plain CPython +
+# NumPy: the add-on package skips its Blender imports when bpy is missing.
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "addon"))
@@ -0,0 +1,186 @@
+import numpy as np
+import pytest
+
+from taxi_line_generator.core.bezier import (
+    ArcLengthTable,
+    bezier_segments,
+    cumulative_lengths,
+    normalize_span,
+    normalize_spans,
+    resample_polyline_evenly,
+    sample_span,
+)
+from taxi_line_generator.core.handles import solve_taxi_handles
+
+# Pure-Python port of the original single-span normalize (operators/normalize_curve.py before the
+# array kernels): sample the span with interpolate_bezier, walk the polyline to even arc-length
+# targets, then move/scale the handles with their points.
+
+
+def _lerp(a, b, t):
+    return tuple(x + (y - x) * t for x, y in zip(a, b))
+
+
+def _dist(a, b):
+    return sum((x - y) ** 2 for x, y in zip(a, b)) ** 0.5
+
+
+def _interpolate_bezier(p0, p1, p2, p3, resolution):
+    out = []
+    for k in range(resolution):
+        t = k / (resolution - 1)
+        s = 1.0 - t
+        out.append(
+            tuple(s**3 * a + 3.0 * s**2 * t * b + 3.0 * s * t**2 * c + t**3 * d for a, b, c, d in zip(p0, p1, p2, p3))
+        )
+    return out
+
+
+def _resample_evenly(points, count):
+    cumulative = [0.0]
+    for i in range(1, len(points)):
+        cumulative.append(cumulative[-1] + _dist(points[i], points[i - 1]))
+    total = cumulative[-1]
+    if total <= 1e-9:
+        return [points[0]] * count
+    out = []
+    for k in range(count):
+        d = total * (k / (count - 1))
+        j = 1
+        while j < len(cumulative) and cumulative[j] < d:
+            j += 1
+        if j >= len(cumulative):
+            out.append(points[-1])
+            continue
+        d0, d1 = cumulative[j - 1], cumulative[j]
+        if d1 - d0 <= 1e-12:
+            out.append(points[j])
+            continue
+        out.append(_lerp(points[j - 1], points[j], (d - d0) / (d1 - d0)))
+    return out
+
+
+def reference_normalize(co, left, right, i0, i1, resolution):
+    n = len(co)
+    co = [tuple(map(float, p)) for p in co]
+    left = [tuple(map(float, p)) for p in left]
+    right = [tuple(map(float, p)) for p in right]
+    count = i1 - i0 + 1
+
+    sampled = []
+    for i in range(i0, i1):
+        seg = _interpolate_bezier(co[i], right[i], left[i + 1], co[i + 1], resolution)
+        sampled.extend(seg if i == i0 else seg[1:])
+    targets = _resample_evenly(sampled, count)
+    targets[0] = co[i0]
+    targets[-1] = co[i1]
+
+    out_co, out_left, out_right = [], [], []
+    for local_i, idx in enumerate(range(i0, i1 + 1)):
+        old_co, old_hl, old_hr = co[idx], left[idx], right[idx]
+        new_co = targets[local_i]
+        delta = tuple(a - b for a, b in zip(new_co, old_co))
+        left_scale = right_scale = 1.0
+        if local_i > 0:
+            old_len = _dist(old_co, co[idx - 1])
+            if old_len > 1e-9:
+                left_scale = _dist(new_co, targets[local_i - 1]) / old_len
+        if local_i < count - 1:
+            old_len = _dist(co[idx + 1], old_co)
+            if old_len > 1e-9:
+                right_scale = _dist(targets[local_i + 1], new_co) / old_len
+        if idx == i0 and i0 > 0:
+            hl = tuple(a + b for a, b in zip(old_hl, delta))
+        else:
+            hl = tuple(c + (h - o) * left_scale for c, h, o in zip(new_co, old_hl, old_co))
+        if idx == i1 and i1 < n - 1:
+            hr = tuple(a + b for a, b in zip(old_hr, delta))
+        else:
+            hr = tuple(c + (h - o) * right_scale for c, h, o in zip(new_co, old_hr, old_co))
+        out_co.append(new_co)
+        out_left.append(hl)
+        out_right.append(hr)
+    return np.array(out_co), np.array(out_left), np.array(out_right)
+
+
+def _uneven_line(seed, n=12):
+    rng = np.random.default_rng(seed)
+    steps = rng.uniform(0.2, 4.0, n - 1)
+    x = np.concatenate(([0.0], np.cumsum(steps)))
+    co = np.stack((x, np.sin(x * 0.4) * 3.0, np.zeros(n)), axis=1)
+    left = co.copy()
+    right = co.copy()
+    solve_taxi_handles(co, left, right)
+    return co, left, right
+
+
+def test_bezier_segments_hit_control_points():
+    co, left, right = _uneven_line(0)
+    segs = bezier_segments(co, left, right, 8)
+    assert segs.shape == (len(co) - 1, 8, 3)
+    np.testing.assert_allclose(segs[:, 0], co[:-1])
+    np.testing.assert_allclose(segs[:, -1], co[1:])
+    assert len(sample_span(co, left, right, 2, 5, 8)) == 3 * 7 + 1
+
+
+def test_resample_polyline_evenly():
+    points = np.array([(0, 0, 0), (1, 0, 0), (1, 3, 0)], dtype=np.float64)
+    out = resample_polyline_evenly(points, 5)
+    np.testing.assert_allclose(out, [(0, 0, 0), (1, 0, 0), (1, 1, 0), (1, 2, 0), (1, 3, 0)])
+    np.testing.assert_allclose(cumulative_lengths(out), [0, 1, 2, 3, 4])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_arc_table_samples(seed):
+    co, left, right = _uneven_line(seed)
+    table = ArcLengthTable(co, left, right, 24)
+    assert len(table.points) == (len(co) - 1) * 23 + 1
+    np.testing.assert_allclose(table.lengths, cumulative_lengths(table.points))
+    np.testing.assert_allclose(table.points_at(table.lengths), table.points, atol=1e-9)
+    # Control points sit exactly on table samples.
+    lo, hi = table.span_indices(2, 5)
+    np.testing.assert_allclose(table.points[[lo, hi]], co[[2, 5]])
+
+
+def test_arc_table_of_a_single_point():
+    table = ArcLengthTable(np.zeros((1, 3)), np.zeros((1, 3)), np.zeros((1, 3)))
+    assert table.segment_count == 0
+    assert table.total == 0.0
+
+
+@pytest.mark.parametrize("span", [(0, 11), (0, 4), (3, 8), (7, 11), (5, 6)])
+def test_normalize_span_matches_reference(span):
+    co, left, right = _uneven_line(7)
+    i0, i1 = span
+    expected = reference_normalize(co, left, right, i0, i1, 32)
+    result = normalize_span(co, left, right, i0, i1, 32)
+    for got, want in zip(result, expected):
+        np.testing.assert_allclose(got, want, atol=1e-9)
+
+
+def test_normalize_spans_batches_disjoint_spans():
+    co, left, right = _uneven_line(11, n=20)
+    spans = [(1, 5), (7, 12), (14, 19)]
+    idx, new_co, new_left, new_right = normalize_spans(co, left, right, spans, 32)
+    np.testing.assert_array_equal(idx, np.concatenate([np.arange(i0, i1 + 1) for i0, i1 in spans]))
+    rows = 0
+    for i0, i1 in spans:
+        want = reference_normalize(co, left, right, i0, i1, 32)
+        count = i1 - i0 + 1
+        for got, expected in zip((new_co, new_left, new_right), want):
+            np.testing.assert_allclose(got[rows : rows + count], expected, atol=1e-9)
+        rows += count
+
+
+def test_normalize_spans_evens_out_spacing():
+    co, left, right = _uneven_line(3)
+    table = ArcLengthTable(co, left, right, 64)
+    _idx, new_co, _left, _right = normalize_spans(co, left, right, [(0, len(co) - 1)], 64, table=table)
+    # The points move to even arc-length positions along the path they described before.
+    np.testing.assert_allclose(new_co, table.points_at(np.linspace(0.0, table.total, len(co))), atol=1e-9)
+    assert np.ptp(np.linalg.norm(np.diff(new_co, axis=0), axis=1)) < np.ptp(np.linalg.norm(np.diff(co, axis=0), axis=1))
+
+
+def test_normalize_spans_ignores_invalid_spans():
+    co, left, right = _uneven_line(1)
+    assert normalize_spans(co, left, right, [(3, 3), (5, 2), (-1, 4), (4, 99)], 32) is None
@@ -0,0 +1,78 @@
+import numpy as np
+
+from taxi_line_generator.core.deltas import (
+    EDIT_EPS,
+    capture_edits,
+    pack_deltas,
+    ribbon_keys,
+    sample_edits,
+    unpack_deltas,
+)
+from taxi_line_generator.core.uv import strip_rings
+
+from .test_uv import _strip
+
+
+def _rings(ring_count, step=1.0):
+    co, loops, starts, totals = _strip(ring_count, step=step)
+    ring_a, ring_b = strip_rings(starts, totals, loops, len(co))
+    return co, ring_a, ring_b
+
+
+def test_ribbon_keys_are_grouped_by_side_and_sorted_along_the_line():
+    co, ring_a, ring_b = _rings(5)
+    keys = ribbon_keys(co, ring_a, ring_b)
+    # Side 0 lives in [0, 1], side 1 in [2, 3]; the fraction runs 0..1 along the strip.
+    np.testing.assert_allclose(keys[0::2], [0.0, 0.25, 0.5, 0.75, 1.0])
+    np.testing.assert_allclose(keys[1::2], [2.0, 2.25, 2.5, 2.75, 3.0])
+
+
+def test_capture_keeps_neighbours_of_edits():
+    co, ring_a, ring_b = _rings(6)
+    keys = ribbon_keys(co, ring_a, ring_b)
+    deltas = np.zeros_like(co)
+    deltas[4] = (0.0, 0.0, 1.0)  # ring 2, side 0
+    edit_keys, edit_deltas = capture_edits(deltas, keys, ring_a, ring_b)
+    # The edited vertex plus its unedited neighbours on the same side (rings 1 and 3).
+    np.testing.assert_allclose(edit_keys, [0.2, 0.4, 0.6])
+    np.testing.assert_allclose(edit_deltas[:, 2], [0.0, 1.0, 0.0])
+    empty_keys, empty_deltas = capture_edits(np.zeros_like(co), keys, ring_a, ring_b)
+    assert len(empty_keys) == 0
+    assert empty_deltas.shape == (0, 3)
+
+
+def test_sample_edits_on_a_denser_ribbon():
+    co, ring_a, ring_b = _rings(6)
+    keys = ribbon_keys(co, ring_a, ring_b)
+    deltas = np.zeros_like(co)
+    deltas[4] = (0.0, 0.0, 1.0)
+    edit_keys, edit_deltas = capture_edits(deltas, keys, ring_a, ring_b)
+
+    dense, dense_a, dense_b = _rings(11, step=0.5)
+    offsets = sample_edits(ribbon_keys(dense, dense_a, dense_b), edit_keys, edit_deltas)
+    # Side 0 picks up the bump (peak at fraction 0.4, linear falloff); side 1 stays untouched.
+    np.testing.assert_allclose(offsets[0::2, 2], [0, 0, 0, 0.5, 1.0, 0.5, 0, 0, 0, 0, 0], atol=1e-12)
+    np.testing.assert_array_equal(offsets[1::2], 0.0)
+    assert not sample_edits(np.array([0.5]), np.empty(0), np.empty((0, 3))).any()
+
+
+def test_pack_round_trip():
+    deltas = np.zeros((6, 3))
+    deltas[1] = (0.5, 0.0, 0.0)
+    deltas[4] = (0.0, -0.25, 1.0)
+    deltas[5] = (EDIT_EPS * 0.5, 0.0, 0.0)  # below the edit threshold
+    indices, values = pack_deltas(deltas)
+    assert indices.dtype == np.int32
+    assert values.dtype == np.float32
+    np.testing.assert_array_equal(indices, [1, 4])
+    restored = unpack_deltas(indices, values, len(deltas))
+    expected = deltas.copy()
+    expected[5] = 0.0
+    np.testing.assert_allclose(restored, expected)
+
+
+def test_unpack_rejects_inconsistent_data():
+    assert unpack_deltas([0, 7], np.zeros(6), 4) is None
+    assert unpack_deltas([0], np.zeros(6), 4) is None
+    assert unpack_deltas([], [], -1) is None
+    np.testing.assert_array_equal(unpack_deltas([], [], 3), np.zeros((3, 3)))
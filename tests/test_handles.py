@@ -0,0 +1,211 @@
+from math import acos, degrees
+
+import numpy as np
+import pytest
+
+from taxi_line_generator.core.handles import (
+    APPROACH_SCALE,
+    HANDLE_SCALE,
+    RIGHT_ANGLE_SCALE,
+    TURN_MAX_DEG,
+    TURN_MIN_DEG,
+    changed_point_indices,
+    merge_windows,
+    solve_taxi_handles,
+    solve_taxi_handles_range,
+)
+
+# Pure-Python port of the original per-point loop (curve_utils._apply_taxi_handles_to_spline_loop)
+# on plain tuples, the reference for the array solver.
+
+
+def _sub(a, b):
+    return (a[0] - b[0], a[1] - b[1], a[2] - b[2])
+
+
+def _add(a, b):
+    return (a[0] + b[0], a[1] + b[1], a[2] + b[2])
+
+
+def _mul(a, f):
+    return (a[0] * f, a[1] * f, a[2] * f)
+
+
+def _length(a):
+    return (a[0] * a[0] + a[1] * a[1] + a[2] * a[2]) ** 0.5
+
+
+def _norm_or(v, fallback):
+    length = _length(v)
+    if length <= 1e-9:
+        return fallback
+    return _mul(v, 1.0 / length)
+
+
+def _dot(a, b):
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def _deflection(a, b):
+    return degrees(acos(min(max(_dot(a, b), -1.0), 1.0)))
+
+
+def reference_handles(co, left, right):
+    co = [tuple(map(float, p)) for p in co]
+    left = [tuple(map(float, p)) for p in left]
+    right = [tuple(map(float, p)) for p in right]
+    n = len(co)
+    if n < 2:
+        return left, right
+    x_axis = (1.0, 0.0, 0.0)
+
+    for i, p in enumerate(co):
+        if i in (0, n - 1):
+            other = co[1] if i == 0 else co[i - 1]
+            v = _sub(other, p)
+            dist = _length(v)
+            if dist > 1e-6:
+                tip = _add(p, _mul(v, HANDLE_SCALE))
+                if i == 0:
+                    left[i], right[i] = p, tip
+                else:
+                    left[i], right[i] = tip, p
+            continue
+
+        prev = co[i - 1]
+        nxt = co[i + 1]
+        dist_in = _length(_sub(prev, p))
+        dist_out = _length(_sub(nxt, p))
+        if dist_in <= 1e-6 or dist_out <= 1e-6:
+            continue
+        t_in = _norm_or(_sub(p, prev), x_axis)
+        t_out = _norm_or(_sub(nxt, p), x_axis)
+        deflection = _deflection(t_in, t_out)
+
+        t = _add(t_in, t_out)
+        if _length(t) <= 1e-9:
+            t = t_out
+        t = _norm_or(t, t_out)
+        scale = RIGHT_ANGLE_SCALE if 70.0 <= deflection <= 110.0 else HANDLE_SCALE
+        length = min(dist_in, dist_out) * scale
+        if deflection > 160.0:
+            length *= 0.55
+        elif deflection > 135.0:
+            length *= 0.75
+        left[i] = _add(p, _mul(t, -length))
+        right[i] = _add(p, _mul(t, length))
+
+    for i in range(1, n - 1):
+        prev, p, nxt = co[i - 1], co[i], co[i + 1]
+        deflection = _deflection(_norm_or(_sub(p, prev), x_axis), _norm_or(_sub(nxt, p), x_axis))
+        if deflection < TURN_MIN_DEG or deflection > TURN_MAX_DEG:
+            continue
+        dist_prev = _length(_sub(p, prev))
+        if dist_prev > 1e-6:
+            right[i - 1] = _add(prev, _mul(_sub(p, prev), APPROACH_SCALE))
+        dist_next = _length(_sub(nxt, p))
+        if dist_next > 1e-6:
+            left[i + 1] = _add(nxt, _mul(_sub(p, nxt), APPROACH_SCALE))
+    return left, right
+
+
+def _random_line(rng, n):
+    co = rng.uniform(-10.0, 10.0, (n, 3))
+    co[:, 2] = 0.0
+    # Duplicate points exercise the "too short to solve" branches.
+    if n > 3:
+        co[n // 2] = co[n // 2 - 1]
+    return co
+
+
+def _right_angle_line():
+    return np.array([(0, 0, 0), (4, 0, 0), (4, 4, 0), (8, 4, 0), (8, 0, 0), (9, 1, 0)], dtype=np.float64)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_solver_matches_reference_loop(seed):
+    rng = np.random.default_rng(seed)
+    co = _random_line(rng, int(rng.integers(2, 30)))
+    left = co + 0.25
+    right = co - 0.25
+    ref_left, ref_right = reference_handles(co, left, right)
+
+    solve_taxi_handles(co, left, right)
+    np.testing.assert_allclose(left, ref_left, atol=1e-9)
+    np.testing.assert_allclose(right, ref_right, atol=1e-9)
+
+
+def test_solver_matches_reference_on_turns():
+    co = _right_angle_line()
+    left = co.copy()
+    right = co.copy()
+    ref_left, ref_right = reference_handles(co, left, right)
+    solve_taxi_handles(co, left, right)
+    np.testing.assert_allclose(left, ref_left, atol=1e-9)
+    np.testing.assert_allclose(right, ref_right, atol=1e-9)
+
+
+def test_solver_leaves_short_lines_alone():
+    co = np.zeros((1, 3))
+    left = np.ones((1, 3))
+    right = np.ones((1, 3))
+    solve_taxi_handles(co, left, right)
+    np.testing.assert_array_equal(left, 1.0)
+    np.testing.assert_array_equal(right, 1.0)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_range_solve_matches_full_solve(seed):
+    rng = np.random.default_rng(100 + seed)
+    n = int(rng.integers(2, 40))
+    co = _random_line(rng, n)
+    full_left = co + 0.5
+    full_right = co - 0.5
+    solve_taxi_handles(co, full_left, full_right)
+
+    # Start from solved handles, move a few points, then re-solve only around them.
+    moved = rng.choice(n, size=min(3, n), replace=False)
+    co[moved] += rng.uniform(-2.0, 2.0, (len(moved), 3)) * (1.0, 1.0, 0.0)
+    left = full_left.copy()
+    right = full_right.copy()
+    for lo, hi in merge_windows(np.sort(moved)):
+        first, w_left, w_right = solve_taxi_handles_range(co, left, right, lo, hi)
+        left[first : first + len(w_left)] = w_left
+        right[first : first + len(w_right)] = w_right
+
+    solve_taxi_handles(co, full_left, full_right)
+    np.testing.assert_allclose(left, full_left, atol=1e-9)
+    np.testing.assert_allclose(right, full_right, atol=1e-9)
+
+
+def test_range_solve_clamps_and_skips_empty_ranges():
+    co = _right_angle_line()
+    first, w_left, w_right = solve_taxi_handles_range(co, co.copy(), co.copy(), -5, 1)
+    assert first == 0
+    assert len(w_left) == len(w_right) == 2
+    first, w_left, _w_right = solve_taxi_handles_range(co, co, co, 4, 2)
+    assert len(w_left) == 0
+
+
+def test_merge_windows():
+    assert merge_windows([3]) == [(1, 5)]
+    assert merge_windows([3, 6]) == [(1, 8)]
+    assert merge_windows([0, 10]) == [(-2, 2), (8, 12)]
+
+
+def test_changed_point_indices():
+    co = _right_angle_line()
+    state = (co, co + 1.0, co - 1.0)
+    moved = tuple(a.copy() for a in state)
+    moved[0][2] += 0.5
+    np.testing.assert_array_equal(changed_point_indices(state, moved), [2])
+
+    appended = tuple(np.vstack((a, a[-1:] + 1.0)) for a in state)
+    np.testing.assert_array_equal(changed_point_indices(state, appended), [len(co)])
+    prepended = tuple(np.vstack((a[:1] - 1.0, a)) for a in state)
+    np.testing.assert_array_equal(changed_point_indices(state, prepended), [0])
+    removed = tuple(a[:-1] for a in state)
+    np.testing.assert_array_equal(changed_point_indices(state, removed), [len(co) - 2])
+
+    assert changed_point_indices(None, state) is None
+    assert changed_point_indices(state, tuple(a[:-2] for a in state)) is None
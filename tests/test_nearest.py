@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from taxi_line_generator.core.handles import solve_taxi_handles
+from taxi_line_generator.core.nearest import nearest_on_bezier_2d, project_to_region
+
+
+def _perspective(fov_scale=1.5, near=0.1, far=100.0, eye_z=20.0):
+    proj = np.array(
+        [
+            (fov_scale, 0.0, 0.0, 0.0),
+            (0.0, fov_scale, 0.0, 0.0),
+            (0.0, 0.0, (far + near) / (near - far), 2.0 * far * near / (near - far)),
+            (0.0, 0.0, -1.0, 0.0),
+        ]
+    )
+    view = np.eye(4)
+    view[2, 3] = -eye_z
+    return proj @ view
+
+
+def _line(seed, n=10):
+    rng = np.random.default_rng(seed)
+    co = np.zeros((n, 3))
+    co[:, :2] = np.cumsum(rng.uniform(-3.0, 3.0, (n, 2)), axis=0)
+    left = co.copy()
+    right = co.copy()
+    solve_taxi_handles(co, left, right)
+    return co, left, right
+
+
+def _brute_force(co, left, right, mat, width, height, point, samples=4001):
+    t = np.linspace(0.0, 1.0, samples)[:, None]
+    s = 1.0 - t
+    best = None
+    for seg in range(len(co) - 1):
+        pts = s**3 * co[seg] + 3.0 * s**2 * t * right[seg] + 3.0 * s * t**2 * left[seg + 1] + t**3 * co[seg + 1]
+        d = np.linalg.norm(project_to_region(pts, mat, width, height) - point, axis=1)
+        k = int(np.argmin(d))
+        if best is None or d[k] < best[0]:
+            best = (float(d[k]), seg, float(t[k, 0]))
+    return best
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_matches_dense_brute_force(seed):
+    co, left, right = _line(seed)
+    mat = _perspective()
+    width, height = 800.0, 600.0
+    rng = np.random.default_rng(1000 + seed)
+    for point in rng.uniform((0.0, 0.0), (width, height), (5, 2)):
+        got = nearest_on_bezier_2d(co, left, right, mat, width, height, point)
+        want = _brute_force(co, left, right, mat, width, height, point)
+        assert got is not None
+        # The refined hit is never worse than the dense scan (up to its sampling error).
+        assert got[0] <= want[0] + 1e-3
+        assert got[0] == pytest.approx(want[0], abs=1e-2)
+        if abs(got[0] - want[0]) < 1e-6:
+            assert got[1] == want[1]
+
+
+def test_identity_view_hits_the_curve():
+    co = np.array([(0.0, 0.0, 0.0), (1.0, 0.0, 0.0)])
+    left = np.array([(0.0, 0.0, 0.0), (2.0 / 3.0, 0.0, 0.0)])
+    right = np.array([(1.0 / 3.0, 0.0, 0.0), (1.0, 0.0, 0.0)])
+    # Identity: region pixel = (1 + x, 1 + y) in a 2x2 region.
+    dist, seg, t = nearest_on_bezier_2d(co, left, right, np.eye(4), 2.0, 2.0, (1.25, 1.5))
+    assert seg == 0
+    assert dist == pytest.approx(0.5)
+    assert t == pytest.approx(0.25, abs=1e-6)
+
+
+def test_points_behind_the_viewer():
+    out = project_to_region(np.array([(0.0, 0.0, 0.0), (0.0, 0.0, 30.0)]), _perspective(), 100.0, 100.0)
+    assert np.all(np.isfinite(out[0]))
+    assert np.all(np.isnan(out[1]))
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from taxi_line_generator.core.ribbon import merge_ribbons, ribbon_geometry
+
+
+def _straight(length=2.0):
+    co = np.array([(0.0, 0.0, 0.0), (length, 0.0, 0.0)])
+    left = np.array([(0.0, 0.0, 0.0), (length * 2.0 / 3.0, 0.0, 0.0)])
+    right = np.array([(length / 3.0, 0.0, 0.0), (length, 0.0, 0.0)])
+    return co, left, right
+
+
+def _ribbon(co, left, right, cyclic=False, width=0.2, uv_u=1.0, uv_v=1.0):
+    n = len(co)
+    flags = np.zeros(n, dtype=bool)
+    return ribbon_geometry(co, left, right, np.ones(n), flags, flags, cyclic, 12, width, 1.0, uv_u, uv_v)
+
+
+def test_straight_ribbon():
+    verts, loops, face_count, uvs = _ribbon(*_straight(2.0))
+    # 0.5 m samples over 2 m: 5 rings, 4 quads, two profile vertices per ring.
+    assert face_count == 4
+    assert verts.shape == (10, 3)
+    np.testing.assert_allclose(verts[0::2, 0], [0.0, 0.5, 1.0, 1.5, 2.0], atol=1e-9)
+    np.testing.assert_allclose(np.abs(verts[:, 1]), 0.1, atol=1e-9)
+    np.testing.assert_array_equal(loops[:4], [0, 1, 3, 2])
+    # U runs along the length (m / UV U), V across the width (profile * width / UV V).
+    np.testing.assert_allclose(uvs[:4], [(0.0, -0.1), (0.0, 0.1), (0.5, 0.1), (0.5, -0.1)], atol=1e-9)
+
+
+def test_uv_tiling():
+    _verts, _loops, _faces, uvs = _ribbon(*_straight(2.0), uv_u=2.0, uv_v=0.1)
+    assert uvs[:, 0].max() == pytest.approx(1.0)
+    np.testing.assert_allclose(np.abs(uvs[:, 1]), 1.0)
+
+
+def test_right_angle_is_filleted():
+    co = np.array([(0.0, 0.0, 0.0), (4.0, 0.0, 0.0), (4.0, 4.0, 0.0)])
+    left = co.copy()
+    right = co.copy()
+    verts, _loops, _faces, _uvs = _ribbon(co, left, right, width=0.4)
+    centers = verts.reshape(-1, 2, 3).mean(axis=1)
+    # The fillet (radius 0.75 * width) cuts the corner: no ring passes through it.
+    assert np.min(np.linalg.norm(centers - co[1], axis=1)) > 0.05
+    np.testing.assert_allclose(centers[0], co[0], atol=1e-9)
+    np.testing.assert_allclose(centers[-1], co[-1], atol=1e-9)
+
+
+def test_cyclic_ribbon_closes():
+    co = np.array([(0.0, 0.0, 0.0), (4.0, 0.0, 0.0), (4.0, 4.0, 0.0), (0.0, 4.0, 0.0)])
+    verts, loops, face_count, _uvs = _ribbon(co, co.copy(), co.copy(), cyclic=True)
+    ring_count = len(verts) // 2
+    assert face_count == ring_count
+    # The last quad connects back to the first ring.
+    np.testing.assert_array_equal(loops[-4:], [(ring_count - 1) * 2, (ring_count - 1) * 2 + 1, 1, 0])
+
+
+def test_degenerate_input():
+    co = np.zeros((1, 3))
+    assert _ribbon(co, co, co) is None
+
+
+def test_merge_ribbons_offsets_loops():
+    a = _ribbon(*_straight(1.0))
+    b = _ribbon(*_straight(2.0))
+    verts, loops, face_count, uvs = merge_ribbons([a, b])
+    assert face_count == a[2] + b[2]
+    assert len(verts) == len(a[0]) + len(b[0])
+    np.testing.assert_array_equal(loops[len(a[1]) :], b[1] + len(a[0]))
+    assert len(uvs) == len(loops)
+    empty = merge_ribbons([])
+    assert empty[2] == 0
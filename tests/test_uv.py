@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from taxi_line_generator.core.uv import (
+    bbox_of,
+    face_slot_uvs,
+    fit_to_bbox,
+    segment_axis_from_bbox,
+    strip_face_arcs,
+    strip_rings,
+    strip_uvs,
+)
+
+
+def _strip(ring_count, step=1.0, width=0.5):
+    """Straight strip along X: vertices 2r/2r+1 are the two sides of ring r."""
+    x = np.repeat(np.arange(ring_count) * step, 2)
+    y = np.tile((-width * 0.5, width * 0.5), ring_count)
+    co = np.stack((x, y, np.zeros_like(x)), axis=1)
+    ring = np.arange(ring_count - 1)
+    loops = np.stack((ring * 2, ring * 2 + 1, ring * 2 + 3, ring * 2 + 2), axis=1).ravel()
+    return co, loops, ring * 4, np.full(ring_count - 1, 4)
+
+
+def test_bbox_and_fit():
+    uvs = np.array([(0.0, 0.0), (2.0, 1.0), (1.0, 0.5)])
+    assert bbox_of(uvs) == (0.0, 0.0, 2.0, 1.0)
+    assert bbox_of(np.empty((0, 2))) is None
+    fitted = fit_to_bbox(uvs, (1.0, -1.0, 2.0, 1.0))
+    np.testing.assert_allclose(fitted, [(1.0, -1.0), (2.0, 1.0), (1.5, 0.0)])
+    # A flat axis can't be stretched onto a non-flat target.
+    assert fit_to_bbox(np.array([(0.0, 0.0), (1.0, 0.0)]), (0.0, 0.0, 1.0, 1.0)) is None
+
+
+def test_segment_axis_from_bbox():
+    assert segment_axis_from_bbox((0.0, 0.0, 1.0, 4.0)) == "Y"
+    assert segment_axis_from_bbox((0.0, 0.0, 4.0, 1.0)) == "X"
+    assert segment_axis_from_bbox(None) == "X"
+    assert segment_axis_from_bbox("bad") == "X"
+
+
+def test_face_slot_uvs_repeat_every_segments_faces():
+    co, loops, starts, totals = _strip(5)
+    uvs = co[loops, :2]
+    out = face_slot_uvs(uvs, starts, totals, 2)
+    # Faces 0..3 get U slots 0, 1, 0, 1; V spans 0..1 inside every face.
+    np.testing.assert_allclose(out[:, 0].reshape(4, 4).min(axis=1), [0.0, 1.0, 0.0, 1.0])
+    np.testing.assert_allclose(out[:, 0].reshape(4, 4).max(axis=1), [1.0, 2.0, 1.0, 2.0])
+    np.testing.assert_allclose(out[:, 1].reshape(4, 4), [[0.0, 1.0, 1.0, 0.0]] * 4)
+    along_y = face_slot_uvs(uvs, starts, totals, 0, slot_axis="Y")
+    np.testing.assert_allclose(along_y[:, 1].reshape(4, 4).min(axis=1), [0.0, 1.0, 2.0, 3.0])
+    assert face_slot_uvs(uvs, starts + 100, totals, 2) is None
+
+
+def test_strip_rings_and_arcs():
+    co, loops, starts, totals = _strip(4, step=2.0)
+    ring_a, ring_b = strip_rings(starts, totals, loops, len(co))
+    np.testing.assert_array_equal(ring_a, [0, 1, 2])
+    np.testing.assert_array_equal(ring_b, [1, 2, 3])
+    arc_a, arc_b, strip = strip_face_arcs(co.reshape(-1, 2, 3).mean(axis=1), ring_a, ring_b)
+    np.testing.assert_allclose(arc_a, [0.0, 2.0, 4.0])
+    np.testing.assert_allclose(arc_b, [2.0, 4.0, 6.0])
+    np.testing.assert_array_equal(strip, [0, 0, 0])
+    # Triangles (or any non-strip layout) are rejected.
+    assert strip_rings(starts, totals - 1, loops, len(co)) is None
+
+
+def test_strip_face_arcs_restart_per_strip():
+    centers = np.array([(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (2.0, 0.0, 0.0), (0.0, 5.0, 0.0), (3.0, 5.0, 0.0)])
+    arc_a, arc_b, strip = strip_face_arcs(centers, np.array([0, 1, 3]), np.array([1, 2, 4]))
+    np.testing.assert_allclose(arc_a, [0.0, 1.0, 0.0])
+    np.testing.assert_allclose(arc_b, [1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(strip, [0, 0, 1])
+
+
+def test_strip_uvs():
+    co, loops, starts, totals = _strip(3, step=1.0, width=0.5)
+    ring_a, ring_b = strip_rings(starts, totals, loops, len(co))
+    uvs = strip_uvs(co, ring_a, ring_b)
+    # U = arc length / width, V = profile side.
+    np.testing.assert_allclose(
+        uvs, [(0.0, 0.0), (0.0, 1.0), (2.0, 1.0), (2.0, 0.0), (2.0, 0.0), (2.0, 1.0), (4.0, 1.0), (4.0, 0.0)]
+    )
+    flat = co.copy()
+    flat[:, 1] = 0.0
+    assert strip_uvs(flat, ring_a, ring_b) is None
+
+
+@pytest.mark.parametrize("segments", [1, 3])
+def test_face_slot_uvs_skips_empty_faces(segments):
+    co, loops, starts, totals = _strip(3)
+    totals = totals.copy()
+    totals[0] = 0
+    out = face_slot_uvs(co[loops, :2], starts, totals, segments)
+    np.testing.assert_allclose(out[:4], co[loops[:4], :2])